@@ -1,16 +1,12 @@
 #!/usr/bin/python3
 
-from .project import compile_source, run
-from .network import accounts, alert, history, rpc, web3
-from brownie.network.contract import Contract  # NOQA: F401
-from brownie.gui import Gui
-from brownie._config import CONFIG as config
-from brownie.convert import Wei
+from brownie._imports import lazy_module
 
 __all__ = [
     "accounts",  # accounts is an Accounts singleton
     "alert",
     "history",  # history is a TxHistory singleton
+    "multicall",
     "network",
     "rpc",  # rpc is a Rpc singleton
     "web3",  # web3 is a Web3 singleton
@@ -21,3 +17,25 @@ __all__ = [
     "config",
     "Gui",
 ]
+
+# subsystems are imported on first access, so that commands which do not use
+# them are not slowed down by importing web3, solcx, tkinter etc.
+lazy_module(
+    __name__,
+    {
+        "accounts": "brownie.network:accounts",
+        "alert": "brownie.network.alert",
+        "history": "brownie.network:history",
+        "multicall": "brownie.network.multicall:Multicall",
+        "network": "brownie.network",
+        "rpc": "brownie.network:rpc",
+        "web3": "brownie.network:web3",
+        "Contract": "brownie.network.contract:Contract",
+        "project": "brownie.project",
+        "compile_source": "brownie.project:compile_source",
+        "run": "brownie.project:run",
+        "Wei": "brownie.convert:Wei",
+        "config": "brownie._config:CONFIG",
+        "Gui": "brownie.gui:Gui",
+    },
+)
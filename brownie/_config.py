@@ -5,6 +5,7 @@ from collections import defaultdict
 import json
 from pathlib import Path
 import re
+from urllib.parse import urlparse
 
 from brownie._singleton import _Singleton
 
@@ -102,6 +103,9 @@ def modify_network_config(network: str = None) -> Any:
             CONFIG["active_network"].update(CONFIG["pytest"])
             if not CONFIG["active_network"]["reverting_tx_gas_limit"]:
                 print("WARNING: Reverting transactions will NOT be broadcasted.")
+        active = CONFIG["active_network"]
+        if ARGV["xdist_worker"] is not None and {"host", "test_rpc"} <= set(active):
+            _set_worker_port(active, ARGV["xdist_worker"])
         return CONFIG["active_network"]
     except KeyError:
         raise KeyError(f"Network '{network}' is not defined in config.json")
@@ -109,6 +113,26 @@ def modify_network_config(network: str = None) -> Any:
         CONFIG._lock()
 
 
+def _set_worker_port(settings: Dict, worker_id: int) -> None:
+    # each pytest-xdist worker launches a local RPC client on a distinct port. only
+    # the active network settings are changed, the host and test_rpc port must match
+    host = urlparse(settings["host"])
+    port = host.port or settings["test_rpc"].get("port")
+    if not port:
+        raise ValueError(
+            f"Cannot assign an RPC port to xdist worker {worker_id}: no port is"
+            f" set for network '{settings['name']}'"
+        )
+    port += worker_id + 1
+    if port > 65535:
+        raise ValueError(
+            f"Cannot assign an RPC port to xdist worker {worker_id}: port {port}"
+            " is out of range"
+        )
+    settings["host"] = host._replace(netloc=f"{host.hostname}:{port}").geturl()
+    settings["test_rpc"] = {**settings["test_rpc"], "port": port}
+
+
 # merges project .json with brownie .json
 def _recursive_update(original: Any, new: Any, base: Any) -> None:
     for k in new:
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+
+from typing import Any, Dict, List, Optional
+import importlib
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+import sys
+import time
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+
+    """Module type where some attributes are only imported when first accessed."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            target = self.__dict__["_lazy_attributes"][name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{self.__name__}' has no attribute '{name}'"
+            ) from None
+        module_name, _, attr = target.partition(":")
+        value = importlib.import_module(module_name)
+        if attr:
+            value = getattr(value, attr.rstrip("()"))
+            if attr.endswith("()"):
+                value = value()
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # importing a submodule sets it as an attribute of the parent package. when
+        # the same name is used by a lazy attribute, the submodule is not set.
+        if (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and self.__dict__["_lazy_attributes"].get(name, value.__name__)
+            != value.__name__
+        ):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List:
+        return sorted(set(super().__dir__()) | set(self.__dict__["_lazy_attributes"]))
+
+
+def lazy_module(name: str, attributes: Dict) -> None:
+    """Modifies a module so that attributes are imported on first access.
+
+    Args:
+        name: Name of the module, normally given as __name__
+        attributes: Dict of {'attribute name': "target"}, where target is given
+                    as "module", "module:attribute" or "module:attribute()". When
+                    the target ends with parentheses, the value is the result of
+                    calling the attribute."""
+    module = sys.modules[name]
+    module.__dict__.setdefault("_lazy_attributes", {}).update(attributes)
+    module.__class__ = _LazyModule
+
+
+class ImportProfiler(MetaPathFinder):
+
+    """Import hook that records the time taken to import each module.
+
+    Cumulative time includes the time spent importing other modules during the
+    import, self time does not. Modules that were imported before the profiler
+    was installed are not included."""
+
+    def __init__(self) -> None:
+        self._times: Dict = {}
+        self._stack: List = []
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self, fullname: str, path: Any, target: Any = None
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)  # type: ignore
+        return spec
+
+    def _start(self) -> None:
+        self._stack.append(0.0)
+
+    def _stop(self, name: str, elapsed: float) -> None:
+        children = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+        self._times[name] = (elapsed, elapsed - children)
+
+    def get_profile(self) -> Dict:
+        """Returns a dict of {module name: (cumulative time, self time)}, given
+        in seconds."""
+        return dict(self._times)
+
+
+class _TimedLoader:
+
+    """Wraps a module loader, timing the execution of the module."""
+
+    def __init__(self, loader: Any, profiler: ImportProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._start()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._stop(module.__name__, time.perf_counter() - start)
@@ -4,8 +4,9 @@ from docopt import docopt
 import importlib
 from pathlib import Path
 import sys
+import time
 
-from brownie import network
+from brownie._imports import ImportProfiler, lazy_module
 from brownie.cli.utils import color, notify
 from brownie.exceptions import ProjectNotFound
 from brownie._config import ARGV
@@ -24,6 +25,7 @@ Commands:
 
 Options:
   --help -h          Display this message
+  --profile-startup  Report the time spent importing each module
 
 Type 'brownie <command> --help' for specific options and more information about
 each command."""
@@ -33,6 +35,13 @@ def main():
 
     print(f"Brownie v{__version__} - Python development framework for Ethereum\n")
 
+    profiler = None
+    if "--profile-startup" in sys.argv:
+        sys.argv.remove("--profile-startup")
+        profiler = ImportProfiler()
+        profiler.install()
+    start = time.perf_counter()
+
     # remove options before calling docopt
     if len(sys.argv) > 1 and sys.argv[1][0] != "-":
         idx = next(
@@ -48,13 +57,34 @@ def main():
         sys.exit("Invalid command. Try 'brownie --help' for available commands.")
 
     ARGV["cli"] = args["<command>"]
-    sys.modules["brownie"].a = network.accounts
+    lazy_module("brownie", {"a": "brownie.network:accounts"})
     sys.modules["brownie"].__all__.append("a")
 
+    startup_time = 0.0
     try:
-        importlib.import_module(f"brownie.cli.{args['<command>']}").main()
+        cmd = importlib.import_module(f"brownie.cli.{args['<command>']}")
+        startup_time = time.perf_counter() - start
+        cmd.main()
     except ProjectNotFound:
         notify("ERROR", "Brownie environment has not been initiated for this folder.")
         print("Type 'brownie init' to create the file structure.")
     except Exception:
         print(color.format_tb(sys.exc_info()))
+    finally:
+        if profiler is not None:
+            profiler.uninstall()
+            _print_import_profile(profiler, startup_time)
+
+
+def _print_import_profile(profiler, startup_time, count=25):
+    profile = profiler.get_profile()
+    print(f"\n\nStartup Profile:\n  startup time: {startup_time:.3f}s")
+    print(f"  {len(profile)} modules imported in {_import_total(profile):.3f}s")
+    for name in sorted(profile, key=lambda k: profile[k][0], reverse=True)[:count]:
+        cumulative, self_time = profile[name]
+        print(f"{name} -  cumulative: {cumulative:.3f}s  self: {self_time:.3f}s")
+
+
+def _import_total(profile):
+    # the sum of self times, so that nested imports are only counted once
+    return sum(i[1] for i in profile.values())
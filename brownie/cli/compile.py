@@ -24,5 +24,6 @@ def main():
     build_path = project_path.joinpath("build/contracts")
     if args["--all"]:
         shutil.rmtree(build_path, ignore_errors=True)
+        shutil.rmtree(project_path.joinpath("build/artifacts"), ignore_errors=True)
     project.load(project_path)
     print(f"Brownie project has been compiled at {build_path}")
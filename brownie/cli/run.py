@@ -3,7 +3,7 @@
 from docopt import docopt
 
 from brownie import network, project, run
-from brownie.test.output import print_gas_profile
+from brownie.test.output import print_gas_profile, print_rpc_profile
 from brownie._config import ARGV, CONFIG, update_argv_from_docopt
 
 
@@ -16,6 +16,7 @@ Arguments:
 Options:
   --network [name]        Use a specific network (default {CONFIG['network']['default']})
   --gas -g                Display gas profile for function calls
+  --rpc-profile           Display a profile of JSON-RPC requests
   --tb -t                 Show entire python traceback on exceptions
   --help -h               Display this message
 
@@ -35,6 +36,8 @@ def main():
         active_project = None
         print("No project was loaded.")
 
+    if ARGV["rpc-profile"]:
+        network.web3.enable_rpc_profile()
     network.connect(ARGV["network"])
 
     run(
@@ -44,3 +47,5 @@ def main():
     )
     if ARGV["gas"]:
         print_gas_profile()
+    if ARGV["rpc-profile"]:
+        print_rpc_profile()
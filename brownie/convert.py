@@ -1,6 +1,16 @@
 #!/usr/bin/python3
 
-from typing import TypeVar, Any, List, Tuple, Dict, KeysView, ItemsView, Union
+from typing import (
+    TypeVar,
+    Any,
+    List,
+    Tuple,
+    Dict,
+    KeysView,
+    ItemsView,
+    Union,
+    Callable,
+)
 from copy import deepcopy
 import eth_utils
 from hexbytes import HexBytes
@@ -256,12 +266,7 @@ def format_input(abi: Dict, inputs: Union[List, Tuple]) -> "ReturnValue":
         inputs: list of arguments to format
 
     Returns a list of arguments formatted for use in a Contract tx or call."""
-    if len(inputs) and not len(abi["inputs"]):
-        raise TypeError(f"{abi['name']} requires no arguments")
-    try:
-        return _format_abi(abi["inputs"], inputs)
-    except Exception as e:
-        raise type(e)(f"{abi['name']} {e}") from None
+    return get_input_formatter(abi)(inputs)
 
 
 def format_output(abi: Dict, outputs: Tuple) -> "ReturnValue":
@@ -272,7 +277,45 @@ def format_output(abi: Dict, outputs: Tuple) -> "ReturnValue":
         outputs: list of arguments to format
 
     Returns a list of arguments with standard formatting applied."""
-    return _format_abi(abi["outputs"], outputs)
+    return get_output_formatter(abi)(outputs)
+
+
+def get_input_formatter(abi: Dict) -> Callable:
+    """Returns a function that formats contract inputs based on ABI types.
+
+    The ABI is only parsed once, so when the same method is called many times
+    the returned function should be kept and reused instead of calling
+    format_input.
+
+    Args:
+        abi: contract method ABI
+
+    Returns a function that takes a list of arguments, and returns them
+    formatted for use in a Contract tx or call."""
+    name = abi["name"]
+    has_inputs = bool(len(abi["inputs"]))
+    formatter = _compile_abi(abi["inputs"])
+
+    def _format_input(inputs: Union[List, Tuple]) -> "ReturnValue":
+        if len(inputs) and not has_inputs:
+            raise TypeError(f"{name} requires no arguments")
+        try:
+            return formatter(inputs)
+        except Exception as e:
+            raise type(e)(f"{name} {e}") from None
+
+    return _format_input
+
+
+def get_output_formatter(abi: Dict) -> Callable:
+    """Returns a function that formats contract outputs based on ABI types.
+
+    Args:
+        abi: contract method ABI
+
+    Returns a function that takes a list of outputs, and returns them with
+    standard formatting applied."""
+    return _compile_abi(abi["outputs"])
 
 
 def format_event(event: Any) -> Any:
@@ -294,59 +337,85 @@ def format_event(event: Any) -> Any:
 
 def _format_abi(abi: Any, values: Any) -> "ReturnValue":
     """Apply standard formatting to multiple values of differing types"""
+    return _compile_abi(abi)(values)
+
+
+def _compile_abi(abi: Any) -> Callable:
+    """Returns a function that applies standard formatting to multiple values of
+    differing types"""
     types = [i["type"] for i in abi]
-    values = list(values)
-    if len(values) != len(types):
-        raise TypeError(
-            f"Expected {len(types)} arguments, got {len(values)}: {','.join(types)}"
-        )
-    for i, type_ in enumerate(types):
-        try:
-            if "]" in type_:
-                values[i] = _format_array(abi[i], values[i])
-            elif type_ == "tuple":
-                values[i] = _format_abi(abi[i]["components"], values[i])
-            else:
-                values[i] = _format_single(type_, values[i])
-        except Exception as e:
-            raise type(e)(f"argument #{i}: '{values[i]}' - {e}")
-    return ReturnValue(values, abi)
-
-
-def _format_array(abi: Any, values: Any) -> "ReturnValue":
-    """Apply standard formatting to multiple values of the same type (arrays)"""
-    base_type, length = abi["type"][:-1].rsplit("[", maxsplit=1)
-    if not isinstance(values, (list, tuple)):
-        raise TypeError(f"Expected sequence, got {type(values)}")
-    if length != "" and len(values) != int(length):
-        raise ValueError(
-            f"Expected {abi['type']} but sequence has length of {len(values)}"
-        )
-    if "]" in base_type:
-        abi = deepcopy(abi)
-        abi["type"] = base_type
-        return ReturnValue([_format_array(abi, i) for i in values])
-    if base_type == "tuple":
-        abi = abi["components"]
-        return ReturnValue([_format_abi(abi, i) for i in values], abi)
-    return ReturnValue([_format_single(base_type, i) for i in values])
+    formatters = [_compile_type(i) for i in abi]
+    count = len(types)
+
+    def _format(values: Any) -> "ReturnValue":
+        values = list(values)
+        if len(values) != count:
+            raise TypeError(
+                f"Expected {count} arguments, got {len(values)}: {','.join(types)}"
+            )
+        for i, formatter in enumerate(formatters):
+            try:
+                values[i] = formatter(values[i])
+            except Exception as e:
+                raise type(e)(f"argument #{i}: '{values[i]}' - {e}")
+        return ReturnValue(values, abi)
+
+    return _format
+
+
+def _compile_type(abi: Dict) -> Callable:
+    if "]" in abi["type"]:
+        return _compile_array(abi, abi["type"])
+    if abi["type"] == "tuple":
+        return _compile_abi(abi["components"])
+    return _compile_single(abi["type"])
 
 
-def _format_single(type_: str, value: Any) -> Any:
-    """Apply standard formatting to a single value"""
+def _compile_array(abi: Dict, type_: str) -> Callable:
+    """Returns a function that applies standard formatting to multiple values of
+    the same type (arrays)"""
+    base_type, length = type_[:-1].rsplit("[", maxsplit=1)
+    components = None
+    if "]" in base_type:
+        formatter = _compile_array(abi, base_type)
+    elif base_type == "tuple":
+        components = abi["components"]
+        formatter = _compile_abi(components)
+    else:
+        formatter = _compile_single(base_type)
+    size = int(length) if length else None
+
+    def _format(values: Any) -> "ReturnValue":
+        if not isinstance(values, (list, tuple)):
+            raise TypeError(f"Expected sequence, got {type(values)}")
+        if size is not None and len(values) != size:
+            raise ValueError(
+                f"Expected {type_} but sequence has length of {len(values)}"
+            )
+        return ReturnValue([formatter(i) for i in values], components)
+
+    return _format
+
+
+def _compile_single(type_: str) -> Callable:
+    """Returns a function that applies standard formatting to a single value"""
     if "uint" in type_:
-        return to_uint(value, type_)
+        return lambda value: to_uint(value, type_)
     elif "int" in type_:
-        return to_int(value, type_)
+        return lambda value: to_int(value, type_)
     elif type_ == "bool":
-        return to_bool(value)
+        return to_bool
     elif type_ == "address":
-        return EthAddress(value)
+        return EthAddress
     elif "byte" in type_:
-        return HexString(value, type_)
+        return lambda value: HexString(value, type_)
     elif "string" in type_:
-        return to_string(value)
-    raise TypeError(f"Unknown type: {type_}")
+        return to_string
+
+    def _unknown(value: Any) -> Any:
+        raise TypeError(f"Unknown type: {type_}")
+
+    return _unknown
 
 
 class ReturnValue(tuple):
@@ -1,11 +1,13 @@
 #!/usr/bin/python3
 
-from typing import Type, Any
-import psutil
+from typing import TYPE_CHECKING, Type, Any, Tuple
 
 import json
 import sys
 
+if TYPE_CHECKING:
+    import psutil  # NOQA: F401
+
 
 # network
 
@@ -23,7 +25,9 @@ class IncompatibleEVMVersion(Exception):
 
 
 class _RPCBaseException(Exception):
-    def __init__(self, msg: str, cmd: str, proc: Type[psutil.Popen], uri: str) -> None:
+    def __init__(
+        self, msg: str, cmd: str, proc: Type["psutil.Popen"], uri: str
+    ) -> None:
         msg = f"{msg}\n\nCommand: {cmd}\nURI: {uri}\nExit Code: {proc.poll()}"
         if sys.platform != "win32":
             out = proc.stdout.read().decode().strip() or "  (Empty)"
@@ -33,12 +37,12 @@ class _RPCBaseException(Exception):
 
 
 class RPCProcessError(_RPCBaseException):
-    def __init__(self, cmd: str, proc: Type[psutil.Popen], uri: str) -> None:
+    def __init__(self, cmd: str, proc: Type["psutil.Popen"], uri: str) -> None:
         super().__init__("Unable to launch local RPC client.", cmd, proc, uri)
 
 
 class RPCConnectionError(_RPCBaseException):
-    def __init__(self, cmd: str, proc: Type[psutil.Popen], uri: str) -> None:
+    def __init__(self, cmd: str, proc: Type["psutil.Popen"], uri: str) -> None:
         super().__init__(
             "Able to launch RPC client, but unable to connect.", cmd, proc, uri
         )
@@ -98,10 +102,14 @@ class ProjectNotFound(Exception):
 
 
 class CompilerError(Exception):
-    def __init__(self, e: Type[psutil.Popen]) -> None:
+    def __init__(self, e: Type["psutil.Popen"]) -> None:
         err = [i["formattedMessage"] for i in json.loads(e.stdout_data)["errors"]]
         super().__init__("Compiler returned the following errors:\n\n" + "\n".join(err))
 
+    def __reduce__(self) -> Tuple:
+        # allows the exception to be raised from within a worker process
+        return _rebuild_exception, (type(self), self.args)
+
 
 class IncompatibleSolcVersion(Exception):
     pass
@@ -109,3 +117,8 @@ class IncompatibleSolcVersion(Exception):
 
 class PragmaError(Exception):
     pass
+
+
+def _rebuild_exception(cls: Type[Exception], args: Tuple) -> Exception:
+    # restores an exception without calling its __init__ method
+    return cls.__new__(cls, *args)  # type: ignore
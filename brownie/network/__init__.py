@@ -1,17 +1,6 @@
 #!/usr/bin/python3
 
-from .main import (  # NOQA 401
-    connect,
-    disconnect,
-    show_active,
-    is_connected,
-    gas_limit,
-    gas_price,
-)
-from .account import Accounts
-from .state import TxHistory
-from .rpc import Rpc
-from .web3 import Web3
+from brownie._imports import lazy_module
 
 __all__ = ["accounts", "history", "rpc", "web3"]
 __console_dir__ = [
@@ -23,7 +12,23 @@ __console_dir__ = [
     "gas_price",
 ]
 
-accounts = Accounts()
-rpc = Rpc()
-history = TxHistory()
-web3 = Web3()
+# web3 and the eth libraries are only imported once the network is used
+lazy_module(
+    __name__,
+    {
+        "connect": "brownie.network.main:connect",
+        "disconnect": "brownie.network.main:disconnect",
+        "show_active": "brownie.network.main:show_active",
+        "is_connected": "brownie.network.main:is_connected",
+        "gas_limit": "brownie.network.main:gas_limit",
+        "gas_price": "brownie.network.main:gas_price",
+        "Accounts": "brownie.network.account:Accounts",
+        "TxHistory": "brownie.network.state:TxHistory",
+        "Rpc": "brownie.network.rpc:Rpc",
+        "Web3": "brownie.network.web3:Web3",
+        "accounts": "brownie.network.account:Accounts()",
+        "history": "brownie.network.state:TxHistory()",
+        "rpc": "brownie.network.rpc:Rpc()",
+        "web3": "brownie.network.web3:Web3()",
+    },
+)
@@ -7,7 +7,6 @@ from hexbytes import HexBytes
 import os
 from pathlib import Path
 import json
-import threading
 
 from eth_hash.auto import keccak
 import eth_keys
@@ -18,13 +17,13 @@ from brownie.exceptions import (
     UnknownAccount,
     IncompatibleEVMVersion,
 )
-from brownie.network.transaction import TransactionReceipt
+from brownie.network.transaction import TransactionReceipt, _confirmations
 from .rpc import Rpc
 from .web3 import Web3
 from brownie.network.state import find_contract
 from brownie.convert import to_address, Wei
 from brownie._singleton import _Singleton
-from brownie._config import CONFIG
+from brownie._config import ARGV, CONFIG
 
 web3 = Web3()
 rpc = Rpc()
@@ -49,8 +48,11 @@ class Accounts(metaclass=_Singleton):
             pass
 
     def _revert(self, height: int) -> None:
-        for i in self._accounts:
-            i.nonce = web3.eth.getTransactionCount(str(i))
+        with web3.batch() as batch:
+            for i in self._accounts:
+                batch.add("eth_getTransactionCount", [str(i), "latest"])
+        for account, nonce in zip(self._accounts, batch.results):
+            account.nonce = int(nonce, 16)
 
     def __contains__(self, address: str) -> bool:
         try:
@@ -153,6 +155,67 @@ class Accounts(metaclass=_Singleton):
         """Empties the container."""
         self._accounts.clear()
 
+    def send_many(
+        self, transactions: Iterable[Dict], silent: bool = False
+    ) -> List[TransactionReceipt]:
+        """Broadcasts many transactions back-to-back, then awaits their
+        confirmations together.
+
+        Nonces are assigned locally in the order the transactions are given, so
+        each transaction is sent without waiting for the previous one to confirm.
+
+        Args:
+            transactions: Iterable of transaction dicts. Each dict must contain
+                          'from' and 'to', and may optionally contain 'value',
+                          'data', 'gas' and 'gasPrice'.
+            silent: Toggles console verbosity.
+
+        Returns:
+            List of TransactionReceipt objects, in the same order as the given
+            transactions. If any transaction reverts, VirtualMachineError is
+            raised after every transaction has confirmed."""
+        params = [_get_tx_params(tx) for tx in transactions]
+        for tx in params:
+            if not isinstance(tx["from"], _AccountBase):
+                tx["from"] = self.at(tx["from"])
+        _apply_gas(params)
+
+        sent = []
+        try:
+            for tx in params:
+                txid, revert_data = tx["from"]._broadcast(
+                    tx["to"],
+                    tx["value"],
+                    tx["gas"],
+                    tx["gasPrice"],
+                    tx["data"],
+                    check_revert=False,
+                )
+                sent.append((txid, tx["from"], revert_data))
+        finally:
+            # register every broadcasted tx, even if a later one failed
+            receipts = [
+                TransactionReceipt(
+                    txid, sender, silent=silent, revert_data=revert_data, wait=False
+                )
+                for txid, sender, revert_data in sent
+            ]
+
+        error: Optional[Exception] = None
+        try:
+            for receipt in receipts:
+                _confirmations.wait(receipt)
+                try:
+                    receipt._handle_confirmation()
+                except VirtualMachineError as e:
+                    error = error or e
+        except KeyboardInterrupt:
+            if ARGV["cli"] != "console":
+                raise
+        if error:
+            raise error
+        return receipts
+
 
 class _AccountBase:
 
@@ -246,13 +309,13 @@ class _AccountBase:
         tx = TransactionReceipt(
             txid, self, name=contract._name + ".constructor", revert_data=revert_data
         )
-        add_thread = threading.Thread(
-            target=contract._add_from_tx, args=(tx,), daemon=True
-        )
-        add_thread.start()
+        if tx.status == -1:
+            # add the contract once the deployment confirms
+            _confirmations.on_confirm(tx, contract._add_from_tx)
+            return tx
         if tx.status != 1:
             return tx
-        add_thread.join()
+        contract._add_from_tx(tx)
         return find_contract(tx.contract_address)
 
     def estimate_gas(
@@ -303,6 +366,19 @@ class _AccountBase:
 
         Returns:
             TransactionReceipt object"""
+        txid, revert_data = self._broadcast(to, amount, gas_limit, gas_price, data)
+        return TransactionReceipt(txid, self, revert_data=revert_data)
+
+    def _broadcast(
+        self,
+        to: Union[str, "Accounts"],
+        amount: Optional[int],
+        gas_limit: Optional[float],
+        gas_price: Optional[float],
+        data: str,
+        check_revert: bool = True,
+    ) -> Tuple:
+        # broadcasts a transaction without awaiting confirmation
         try:
             txid = self._transact(  # type: ignore
                 {
@@ -315,13 +391,14 @@ class _AccountBase:
                     else self._gas_price(),
                     "gas": Wei(gas_limit) or self._gas_limit(to, amount, data),
                     "data": HexBytes(data),
-                }
+                },
+                check_revert,
             )
             revert_data = None
         except ValueError as e:
             txid, revert_data = _raise_or_return_tx(e)
         self.nonce += 1
-        return TransactionReceipt(txid, self, revert_data=revert_data)
+        return txid, revert_data
 
 
 class Account(_AccountBase):
@@ -335,8 +412,9 @@ class Account(_AccountBase):
     def __repr__(self) -> str:
         return f"<Account object '{color['string']}{self.address}{color}'>"
 
-    def _transact(self, tx: Dict) -> Any:
-        self._check_for_revert(tx)
+    def _transact(self, tx: Dict, check_revert: bool = True) -> Any:
+        if check_revert:
+            self._check_for_revert(tx)
         return web3.eth.sendTransaction(tx)
 
 
@@ -390,8 +468,9 @@ class LocalAccount(_AccountBase):
             json.dump(encrypted, fp)
         return str(json_file)
 
-    def _transact(self, tx: Dict) -> None:
-        self._check_for_revert(tx)
+    def _transact(self, tx: Dict, check_revert: bool = True) -> None:
+        if check_revert:
+            self._check_for_revert(tx)
         signed_tx = self._acct.sign_transaction(tx).rawTransaction  # type: ignore
         return web3.eth.sendRawTransaction(signed_tx)
 
@@ -430,6 +509,73 @@ class PublicKeyAccount:
         return Wei(balance)
 
 
+def _get_tx_params(tx: Dict) -> Dict:
+    # applies default values to a transaction dict given to send_many
+    missing = [f"'{i}'" for i in ("from", "to") if i not in tx]
+    if missing:
+        raise ValueError(
+            f"Transaction is missing required field: {', '.join(missing)}"
+        )
+    params = {"value": 0, "gas": None, "gasPrice": None, "data": ""}
+    params.update(tx)
+    for key, target in [
+        ("amount", "value"),
+        ("gas_limit", "gas"),
+        ("gas_price", "gasPrice"),
+    ]:
+        if key in tx:
+            params[target] = tx[key]
+    return params
+
+
+def _apply_gas(transactions: List[Dict]) -> None:
+    # fills in the gas price and gas limit for transactions given to send_many.
+    # gas estimates and revert checks are sent together in one batch request,
+    # so they are all made against the state prior to the first broadcast.
+    if any(tx["gasPrice"] is None for tx in transactions):
+        gas_price = transactions[0]["from"]._gas_price()
+        for tx in (i for i in transactions if i["gasPrice"] is None):
+            tx["gasPrice"] = gas_price
+
+    reverting_gas = CONFIG["active_network"]["reverting_tx_gas_limit"]
+    gas_limit = CONFIG["active_network"]["gas_limit"]
+    if gas_limit not in (True, False, None):
+        for tx in (i for i in transactions if not i["gas"]):
+            tx["gas"] = Wei(gas_limit)
+
+    # a failed estimate means the tx reverts, so only txs that already have
+    # a gas limit require a separate revert check
+    estimate = [i for i in transactions if not i["gas"]]
+    check = [] if reverting_gas else [i for i in transactions if i["gas"]]
+    requests = [("eth_estimateGas", [_format_raw_tx(i)]) for i in estimate]
+    requests += [("eth_call", [_format_raw_tx(i, True), "latest"]) for i in check]
+    responses = web3._make_batch_request(requests)
+
+    for tx, response in zip(estimate, responses):
+        if "error" not in response:
+            tx["gas"] = int(response["result"], 16)
+        elif reverting_gas:
+            tx["gas"] = reverting_gas
+        else:
+            raise VirtualMachineError(response["error"])
+    for response in responses[len(estimate) :]:
+        if "error" in response:
+            raise VirtualMachineError(response["error"])
+
+
+def _format_raw_tx(tx: Dict, include_gas: bool = False) -> Dict:
+    # formats a send_many transaction for use in a raw JSON-RPC request
+    raw_tx = {
+        "from": tx["from"].address,
+        "to": str(tx["to"]),
+        "value": hex(Wei(tx["value"])),
+        "data": HexBytes(tx["data"]).hex(),
+    }
+    if include_gas:
+        raw_tx.update(gas=hex(Wei(tx["gas"])), gasPrice=hex(Wei(tx["gasPrice"])))
+    return raw_tx
+
+
 def _raise_or_return_tx(exc: ValueError) -> Any:
     try:
         data = eval(str(exc))["data"]
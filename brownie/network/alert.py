@@ -1,16 +1,22 @@
 #!/usr/bin/python3
 
-from typing import List, Callable, Tuple, Dict, Union
+from typing import Any, List, Callable, Tuple, Dict, Union, Optional
 
 import time as time
-from threading import Thread
+from threading import Condition, Event, Thread, current_thread
+import traceback
 
 from brownie.cli.utils import color
+from .contract import ContractCall
+from .multicall import Multicall
+from .web3 import Web3
 
 __console_dir__ = ["Alert", "new", "show", "stop_all"]
 
 _instances = set()
 
+web3 = Web3()
+
 
 class Alert:
 
@@ -26,6 +32,7 @@ class Alert:
         msg: str = None,
         callback: Callable = None,
         repeat: bool = False,
+        on_block: bool = False,
     ) -> None:
 
         """Creates a new Alert.
@@ -42,6 +49,9 @@ class Alert:
                     if True, the alert will continue to fire on changes until it
                     is terminated via Alert.stop()
                     if int, the alert will fire n+1 times before terminating.
+            on_block: if True, the callable is only checked when a new block has
+                      been mined. delay is then the frequency to check the
+                      block height.
         """
         if args is None:
             args = ()
@@ -52,61 +62,50 @@ class Alert:
         if isinstance(repeat, int) and repeat < 0:
             raise ValueError("repeat must be True, False or a positive integer")
         self._kill = False
-        start_value = fn(*args, **kwargs)
-        self._thread = Thread(
-            target=self._loop,
-            daemon=True,
-            args=(fn, args, kwargs, start_value, delay, msg, callback, repeat),
-        )
-        self._thread.start()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._value = fn(*args, **kwargs)
+        self._delay = delay
+        self._msg = msg
+        self._callback = callback
+        self._repeat: Union[int, bool, None] = repeat
+        self._on_block = on_block
+        self._block: Optional[int] = web3.eth.blockNumber if on_block else None
+        self._done = Event()
         self.start_time = time.time()
+        self._next = self.start_time + delay
         _instances.add(self)
-
-    def _loop(
-        self,
-        fn: Callable,
-        args: Tuple,
-        kwargs: Dict,
-        start_value: int,
-        delay: float,
-        msg: str,
-        callback: Callable,
-        repeat: Union[int, bool, None] = False,
-    ) -> None:
-        try:
-            sleep = min(delay, 0.05)
-            while repeat is not None:
-                next_ = time.time() + delay
-                while next_ > time.time() and not self._kill:
-                    time.sleep(sleep)
-                if self._kill:
-                    break
-                value = fn(*args, **kwargs)
-                if value == start_value:
-                    continue
-                if msg:
-                    msg = msg.format(start_value, value)
-                    print(f"{color['bright red']}ALERT{color}: {msg}")
-                if callback:
-                    callback(start_value, value)
-                start_value = value
-                if not repeat:
-                    repeat = None
-                elif isinstance(repeat, int):
-                    repeat -= 1
-        finally:
-            _instances.discard(self)
+        _scheduler.add(self)
+
+    def _check(self, value: Any) -> None:
+        if value == self._value:
+            return
+        if self._msg:
+            msg = self._msg.format(self._value, value)
+            print(f"{color['bright red']}ALERT{color}: {msg}")
+        if self._callback:
+            self._callback(self._value, value)
+        self._value = value
+        if not self._repeat:
+            self._repeat = None
+        elif isinstance(self._repeat, int):
+            self._repeat -= 1
+
+    def _finish(self) -> None:
+        _instances.discard(self)
+        self._done.set()
 
     def is_alive(self) -> bool:
         """Checks if the alert is currently active."""
-        return self._thread.is_alive()
+        return not self._done.is_set()
 
     def wait(self, timeout: int = None) -> None:
         """Waits for the alert to fire.
 
         Args:
             timeout: Number of seconds to wait. If None, will wait indefinitely."""
-        self._thread.join(timeout)
+        self._done.wait(timeout)
 
     def stop(self, wait: bool = True) -> None:
         """Stops the alert.
@@ -114,10 +113,114 @@ class Alert:
         Args:
             wait: If True, waits for the alert to terminate after stopping it."""
         self._kill = True
-        if wait:
+        _scheduler.remove(self)
+        # an alert may be stopped from within a callback
+        if wait and not _scheduler.is_scheduler_thread():
             self.wait()
 
 
+class _AlertScheduler:
+
+    """Checks every active alert from a single thread.
+
+    Alerts that are due at the same time are checked together. When several of
+    them are ContractCall objects, the calls are sent in a single batch. Alerts
+    set with on_block share one request for the block height, and are skipped
+    when no new block has been mined. The thread exits when no alerts remain."""
+
+    def __init__(self) -> None:
+        self._alerts: List = []
+        self._active: Optional[Alert] = None
+        self._thread: Optional[Thread] = None
+        self._condition = Condition()
+
+    def add(self, alert: Alert) -> None:
+        with self._condition:
+            self._alerts.append(alert)
+            if self._thread is None:
+                self._thread = Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def remove(self, alert: Alert) -> None:
+        with self._condition:
+            if alert in self._alerts:
+                self._alerts.remove(alert)
+            # an alert that is being checked finishes once the check completes
+            if alert is not self._active:
+                alert._finish()
+            self._condition.notify()
+
+    def is_scheduler_thread(self) -> bool:
+        return self._thread is current_thread()
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                if not self._alerts:
+                    self._thread = None
+                    return
+                now = time.time()
+                next_ = min(i._next for i in self._alerts)
+                if next_ > now:
+                    self._condition.wait(next_ - now)
+                    continue
+                due = [i for i in self._alerts if i._next <= now]
+            self._check_alerts(due)
+
+    def _check_alerts(self, alerts: List) -> None:
+        if any(i._on_block for i in alerts):
+            try:
+                height = web3.eth.blockNumber
+            except Exception:
+                height = None
+            for alert in [i for i in alerts if i._on_block]:
+                if height is not None and alert._block == height:
+                    alert._next = time.time() + alert._delay
+                    alerts.remove(alert)
+                else:
+                    alert._block = height
+        results = _get_call_results(alerts)
+        for alert in alerts:
+            with self._condition:
+                if alert._kill:
+                    continue
+                self._active = alert
+            try:
+                if alert in results:
+                    value = results[alert].result
+                else:
+                    value = alert._fn(*alert._args, **alert._kwargs)
+                alert._check(value)
+            except Exception:
+                traceback.print_exc()
+                alert._repeat = None
+            with self._condition:
+                self._active = None
+                alert._next = time.time() + alert._delay
+                if alert._repeat is None or alert._kill:
+                    if alert in self._alerts:
+                        self._alerts.remove(alert)
+                    alert._finish()
+
+
+def _get_call_results(alerts: List) -> Dict:
+    # sends the calls of alerts that monitor a ContractCall as a single batch
+    calls = [i for i in alerts if isinstance(i._fn, ContractCall) and not i._kwargs]
+    if len(calls) < 2:
+        return {}
+    try:
+        multicall = Multicall()
+        results = dict((i, multicall.add(i._fn, i._args)) for i in calls)
+        multicall.execute()
+        return results
+    except Exception:
+        return {}
+
+
+_scheduler = _AlertScheduler()
+
+
 def new(
     fn: Callable,
     args: Tuple = None,
@@ -126,9 +229,10 @@ def new(
     msg: str = None,
     callback: Callable = None,
     repeat: bool = False,
+    on_block: bool = False,
 ) -> "Alert":
     """Alias for creating a new Alert instance."""
-    return Alert(fn, args, kwargs, delay, msg, callback, repeat)
+    return Alert(fn, args, kwargs, delay, msg, callback, repeat, on_block)
 
 
 def show() -> List:
@@ -9,11 +9,17 @@ from hexbytes import HexBytes
 
 from brownie.cli.utils import color
 from .event import get_topics
-from .state import _add_contract, _remove_contract, find_contract
+from .multicall import get_active_multicall
+from .state import CallCache, _add_contract, _remove_contract, find_contract
 
 from .rpc import Rpc
 from .web3 import Web3
-from brownie.convert import format_input, format_output, to_address, Wei
+from brownie.convert import (
+    get_input_formatter,
+    get_output_formatter,
+    to_address,
+    Wei,
+)
 from brownie.exceptions import (
     ContractExists,
     ContractNotFound,
@@ -26,6 +32,7 @@ from brownie.typing import TransactionReceiptType, AccountsType
 
 rpc = Rpc()
 web3 = Web3()
+call_cache = CallCache()
 
 
 class _ContractBase:
@@ -90,12 +97,12 @@ class ContractContainer(_ContractBase):
         self._contracts.clear()
 
     def _revert(self, height: int) -> None:
-        reverted = [
-            i
-            for i in self._contracts
-            if (i.tx and i.tx.block_number > height)
-            or len(web3.eth.getCode(i.address).hex()) <= 4
-        ]
+        reverted = [i for i in self._contracts if i.tx and i.tx.block_number > height]
+        remaining = [i for i in self._contracts if i not in reverted]
+        with web3.batch() as batch:
+            for i in remaining:
+                batch.add("eth_getCode", [i.address, "latest"])
+        reverted += [i for i, code in zip(remaining, batch.results) if len(code) <= 4]
         for contract in reverted:
             _remove_contract(contract)
             self._contracts.remove(contract)
@@ -134,8 +141,8 @@ class ContractContainer(_ContractBase):
         return contract
 
     def _add_from_tx(self, tx: TransactionReceiptType) -> None:
-        tx._confirmed.wait()
-        self.at(tx.contract_address, tx.sender, tx)
+        if tx.status == 1:
+            self.at(tx.contract_address, tx.sender, tx)
 
 
 class ContractConstructor:
@@ -150,6 +157,7 @@ class ContractConstructor:
         except Exception:
             self.abi = {"inputs": [], "name": "constructor", "type": "constructor"}
         self._name = name
+        self._format_input: Optional[Callable] = None
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} object '{self._name}.constructor({_inputs(self.abi)})'>"
@@ -191,9 +199,11 @@ class ContractConstructor:
             address = self._parent._project[library][-1].address[-40:]
             bytecode = bytecode.replace(marker, address)
 
-        data = format_input(self.abi, args)
-        types = [i[1] for i in _params(self.abi["inputs"])]
-        return bytecode + eth_abi.encode_abi(types, data).hex()
+        if self._format_input is None:
+            self._input_types = [i[1] for i in _params(self.abi["inputs"])]
+            self._format_input = get_input_formatter(self.abi)
+        data = self._format_input(args)
+        return bytecode + eth_abi.encode_abi(self._input_types, data).hex()
 
 
 class _DeployedContractBase(_ContractBase):
@@ -341,6 +351,8 @@ class _ContractMethod:
         self.abi = abi
         self._owner = owner
         self.signature = _signature(abi)
+        self._format_input: Optional[Callable] = None
+        self._format_output: Optional[Callable] = None
 
     def __repr__(self) -> str:
         pay = "payable " if self.abi["stateMutability"] == "payable" else ""
@@ -359,12 +371,34 @@ class _ContractMethod:
         if tx["from"]:
             tx["from"] = str(tx["from"])
         tx.update({"to": self._address, "data": self.encode_abi(*args)})
-        try:
-            data = web3.eth.call(dict((k, v) for k, v in tx.items() if v))
-        except ValueError as e:
-            raise VirtualMachineError(e) from None
+        if not CONFIG["active_network"].get("call_cache"):
+            return self.decode_abi(_call(tx))
+        key = (
+            call_cache.block_height(),
+            rpc._time_offset,
+            self._address,
+            tx["data"],
+            tx["from"],
+            tx["value"],
+            tx["gas"],
+        )
+        data = call_cache.get(key)
+        if data is None:
+            data = _call(tx)
+            call_cache.set(key, data, CONFIG["active_network"]["call_cache_size"])
         return self.decode_abi(data)
 
+    def _get_call_tx(self, *args: Tuple) -> Dict:
+        # returns call params formatted for a raw eth_call request
+        args, tx = _get_tx(self._owner, args)
+        call_tx = {"to": self._address, "data": self.encode_abi(*args)}
+        if tx["from"]:
+            call_tx["from"] = str(tx["from"])
+        for key in ("value", "gas", "gasPrice"):
+            if tx[key]:
+                call_tx[key] = hex(Wei(tx[key]))
+        return call_tx
+
     def transact(self, *args: Tuple) -> TransactionReceiptType:
         """Broadcasts a transaction that calls this contract method.
 
@@ -396,9 +430,11 @@ class _ContractMethod:
 
         Returns:
             Hexstring of encoded ABI data."""
-        data = format_input(self.abi, args)
-        types = [i[1] for i in _params(self.abi["inputs"])]
-        return self.signature + eth_abi.encode_abi(types, data).hex()
+        if self._format_input is None:
+            self._input_types = [i[1] for i in _params(self.abi["inputs"])]
+            self._format_input = get_input_formatter(self.abi)
+        data = self._format_input(args)
+        return self.signature + eth_abi.encode_abi(self._input_types, data).hex()
 
     def decode_abi(self, hexstr: str) -> Tuple:
         """Decodes hexstring data returned by this method.
@@ -407,9 +443,11 @@ class _ContractMethod:
             hexstr: Hexstring of returned call data
 
         Returns: Decoded values."""
-        types = [i[1] for i in _params(self.abi["outputs"])]
-        result = eth_abi.decode_abi(types, HexBytes(hexstr))
-        result = format_output(self.abi, result)
+        if self._format_output is None:
+            self._output_types = [i[1] for i in _params(self.abi["outputs"])]
+            self._format_output = get_output_formatter(self.abi)
+        result = eth_abi.decode_abi(self._output_types, HexBytes(hexstr))
+        result = self._format_output(result)
         if len(result) == 1:
             result = result[0]
         return result
@@ -461,8 +499,12 @@ class ContractCall(_ContractMethod):
                    dictionary of transaction properties as the last arg.
 
         Returns:
-            Contract method return value(s)."""
+            Contract method return value(s). Within a multicall context, a
+            MulticallResult is returned and the call is executed later."""
         if not ARGV["always_transact"]:
+            multicall = get_active_multicall()
+            if multicall is not None:
+                return multicall.add(self, args)
             return self.call(*args)
         rpc._internal_snap()
         args, tx = _get_tx(self._owner, args)
@@ -490,6 +532,13 @@ def _get_tx(owner: Optional[AccountsType], args: Any) -> Tuple:
     return args, tx
 
 
+def _call(tx: Dict) -> Any:
+    try:
+        return web3.eth.call(dict((k, v) for k, v in tx.items() if v))
+    except ValueError as e:
+        raise VirtualMachineError(e) from None
+
+
 def _get_method_object(
     address: str, abi: Dict, name: str, owner: Optional[AccountsType]
 ) -> Union["ContractCall", "ContractTx"]:
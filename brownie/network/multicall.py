@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+from typing import Any, List, Optional, Tuple, Union
+import threading
+
+from brownie.exceptions import VirtualMachineError
+from .web3 import Web3
+
+web3 = Web3()
+
+_active = threading.local()
+
+
+class Multicall:
+
+    """Context manager that collects calls to ContractCall objects and sends
+    them as a single batch of eth_call requests.
+
+    While the context is active, calling a ContractCall returns a MulticallResult
+    instead of the decoded value. The calls are executed when the context exits,
+    or when `execute` is called. Each active context only applies to the thread
+    that entered it."""
+
+    def __init__(self, block_identifier: Union[int, str] = "latest") -> None:
+        self.block_identifier = block_identifier
+        self._pending: List = []
+        self._previous: Optional["Multicall"] = None
+
+    def __repr__(self) -> str:
+        return f"<Multicall object - {len(self._pending)} pending calls>"
+
+    def __enter__(self) -> "Multicall":
+        self._previous = get_active_multicall()
+        _active.multicall = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        _active.multicall = self._previous
+        self._previous = None
+        if exc_type is None:
+            self.execute()
+        else:
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, method: Any, args: Tuple) -> "MulticallResult":
+        """Adds a contract call.
+
+        Args:
+            method: ContractCall object
+            args: Contract method inputs, optionally followed by a dictionary
+                  of transaction properties.
+
+        Returns:
+            MulticallResult object that holds the result once executed."""
+        result = MulticallResult(method)
+        self._pending.append((method._get_call_tx(*args), result))
+        return result
+
+    def execute(self) -> List:
+        """Sends every pending call and decodes the results.
+
+        Returns:
+            List of MulticallResult objects, in the order the calls were added."""
+        pending, self._pending = self._pending, []
+        block = self.block_identifier
+        if isinstance(block, int):
+            # raw requests are not formatted by web3, so block numbers are hex encoded
+            block = hex(block)
+        requests = [("eth_call", [tx, block]) for tx, _ in pending]
+        responses = web3._make_batch_request(requests)
+        for response, (_, result) in zip(responses, pending):
+            if "error" in response:
+                result._set_error(VirtualMachineError(response["error"]))
+            else:
+                result._set_value(result._method.decode_abi(response["result"]))
+        return [i[1] for i in pending]
+
+
+class MulticallResult:
+
+    """Return value of a contract call made within a Multicall context. The
+    decoded value is available from `result` once the call has executed."""
+
+    def __init__(self, method: Any) -> None:
+        self._method = method
+        self._executed = False
+        self._value: Any = None
+        self._error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        if not self._executed:
+            return f"<MulticallResult '{self._method.abi['name']}' - pending>"
+        if self._error is not None:
+            return f"<MulticallResult '{self._method.abi['name']}' - reverted>"
+        return f"<MulticallResult '{self._method.abi['name']}' - {self._value}>"
+
+    @property
+    def executed(self) -> bool:
+        return self._executed
+
+    @property
+    def result(self) -> Any:
+        """Decoded return value of the call. Raises VirtualMachineError if the
+        call reverted."""
+        if not self._executed:
+            raise ValueError("Call has not been executed yet")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _set_value(self, value: Any) -> None:
+        self._value = value
+        self._executed = True
+
+    def _set_error(self, error: Exception) -> None:
+        self._error = error
+        self._executed = True
+
+
+def get_active_multicall() -> Optional[Multicall]:
+    """Returns the Multicall context that is active in the current thread, if any."""
+    return getattr(_active, "multicall", None)
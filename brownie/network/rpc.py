@@ -143,13 +143,26 @@ class Rpc(metaclass=_Singleton):
         if not self.is_active():
             raise SystemError("RPC is not active.")
         try:
-            response = web3.provider.make_request(*args)  # type: ignore
+            response = web3._raw_request(*args)
             if "result" in response:
                 return response["result"]
         except AttributeError:
             raise RPCRequestError("Web3 is not connected.")
         raise RPCRequestError(response["error"]["message"])
 
+    def _request_batch(self, requests: List) -> List:
+        # sends many independent requests in a single round trip
+        if not self.is_active():
+            raise SystemError("RPC is not active.")
+        try:
+            responses = web3._make_batch_request(requests)
+        except AttributeError:
+            raise RPCRequestError("Web3 is not connected.")
+        for response in responses:
+            if "result" not in response:
+                raise RPCRequestError(response["error"]["message"])
+        return [i["result"] for i in responses]
+
     def _snap(self) -> Any:
         return self._request("evm_snapshot", [])
 
@@ -214,6 +227,7 @@ class Rpc(metaclass=_Singleton):
         if type(seconds) is not int:
             raise TypeError("seconds must be an integer value")
         self._time_offset = self._request("evm_increaseTime", [seconds])
+        self._notify_new_block()
 
     def mine(self, blocks: int = 1) -> str:
         """Increases the block height within the test RPC.
@@ -222,8 +236,8 @@ class Rpc(metaclass=_Singleton):
             blocks (int): Number of new blocks to be mined."""
         if type(blocks) is not int:
             raise TypeError("blocks must be an integer value")
-        for i in range(blocks):
-            self._request("evm_mine", [])
+        self._request_batch([("evm_mine", [])] * blocks)
+        self._notify_new_block()
         return f"Block height at {web3.eth.blockNumber}"
 
     def snapshot(self) -> str:
@@ -257,10 +271,17 @@ class Rpc(metaclass=_Singleton):
 
     # objects that will update whenever the RPC is reset or reverted must register
     # by calling to this function. The must also include _revert and _reset methods
-    # to recieve notifications from this object
+    # to recieve notifications from this object. Objects that track the block height
+    # may also include a _new_block method, called after mining or sleeping.
     def _revert_register(self, obj: object) -> None:
         self._revert_refs.append(weakref.ref(obj))
 
+    def _notify_new_block(self) -> None:
+        for ref in self._revert_refs.copy():
+            obj = ref()
+            if obj is not None and hasattr(obj, "_new_block"):
+                obj._new_block()
+
     def _notify_registry(self, height: int = None) -> None:
         gc.collect()
         if height is None:
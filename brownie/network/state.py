@@ -1,21 +1,39 @@
 #!/usr/bin/python3
 
-from typing import List, Dict, Iterable, Any
+from typing import List, Dict, Iterable, Any, Optional, Tuple, Callable
+from bisect import bisect_right
+from collections import OrderedDict
+import threading
+
 from .rpc import Rpc
+from .web3 import Web3
 from brownie.convert import to_address
 from brownie._singleton import _Singleton
 
 rpc = Rpc()
+web3 = Web3()
 
 
 class TxHistory(metaclass=_Singleton):
 
     """List-like singleton container that contains TransactionReceipt objects.
     Whenever a transaction is broadcast, the TransactionReceipt is automatically
-    added to this container."""
+    added to this container.
+
+    Confirmed transactions are indexed by sender and receiver, sorted by block
+    number and transaction index. If max_length is set, the oldest transactions
+    are removed once the limit is reached."""
 
     def __init__(self) -> None:
         self._list: List = []
+        self._pending: List = []
+        self._senders: Dict = {}
+        self._receivers: Dict = {}
+        self._last_block = 0
+        self._in_order = True
+        self._max_length: Optional[int] = None
+        # receipts are confirmed from a background thread
+        self._lock = threading.RLock()
         self.gas_profile: Dict = {}
         rpc._revert_register(self)
 
@@ -37,17 +55,90 @@ class TxHistory(metaclass=_Singleton):
     def __len__(self) -> int:
         return len(self._list)
 
+    @property
+    def max_length(self) -> Optional[int]:
+        """Maximum number of transactions to keep, or None if unbounded."""
+        return self._max_length
+
+    @max_length.setter
+    def max_length(self, value: Optional[int]) -> None:
+        if value is not None and (type(value) is not int or value < 1):
+            raise ValueError("max_length must be a positive integer or None")
+        with self._lock:
+            self._max_length = value
+            self._evict()
+
     def _reset(self) -> None:
-        self._list.clear()
+        self.clear()
 
     def _revert(self, height: int) -> None:
-        self._list = [i for i in self._list if i.block_number <= height]
+        with self._lock:
+            if self._pending or not self._in_order:
+                self._rebuild(
+                    [
+                        i
+                        for i in self._list
+                        if i.status == -1 or i.block_number <= height
+                    ]
+                )
+                return
+            # when every transaction confirmed in the order it was added, only
+            # those at the end of the list can be in a reverted block
+            while self._list and self._list[-1].block_number > height:
+                self._remove(self._list.pop())
+            self._last_block = min(self._last_block, height)
 
     def _add_tx(self, tx: Any) -> None:
-        self._list.append(tx)
+        with self._lock:
+            self._list.append(tx)
+            self._pending.append(tx)
+            self._evict()
+
+    def _confirm_tx(self, tx: Any) -> None:
+        # called by TransactionReceipt once the receipt has been received
+        with self._lock:
+            if tx not in self._pending:
+                return
+            self._pending.remove(tx)
+            if tx is not self._list[-1] or tx.block_number < self._last_block:
+                self._in_order = False
+            self._last_block = max(self._last_block, tx.block_number)
+            # receipts may confirm out of order, so they are inserted by position
+            _insert_sorted(self._senders, _key(tx.sender), tx)
+            if tx.receiver:
+                _insert_sorted(self._receivers, _key(tx.receiver), tx)
+
+    def _remove(self, tx: Any) -> None:
+        if tx in self._pending:
+            self._pending.remove(tx)
+            return
+        _remove_from(self._senders, _key(tx.sender), tx)
+        if tx.receiver:
+            _remove_from(self._receivers, _key(tx.receiver), tx)
+
+    def _evict(self) -> None:
+        if self._max_length is None or len(self._list) <= self._max_length:
+            return
+        evicted = self._list[: -self._max_length]
+        del self._list[: -self._max_length]
+        for tx in evicted:
+            self._remove(tx)
+
+    def _rebuild(self, tx_list: List) -> None:
+        self.clear()
+        for tx in tx_list:
+            self._add_tx(tx)
+            if tx.status != -1:
+                self._confirm_tx(tx)
 
     def clear(self) -> None:
-        self._list.clear()
+        with self._lock:
+            self._list = []
+            self._pending.clear()
+            self._senders.clear()
+            self._receivers.clear()
+            self._last_block = 0
+            self._in_order = True
 
     def copy(self) -> List:
         """Returns a shallow copy of the object as a list"""
@@ -55,15 +146,27 @@ class TxHistory(metaclass=_Singleton):
 
     def from_sender(self, account: Any) -> List:
         """Returns a list of transactions where the sender is account"""
-        return [i for i in self._list if i.sender == account]
+        return self._filter(account, self._senders, lambda i: i.sender == account)
 
     def to_receiver(self, account: Any) -> List:
         """Returns a list of transactions where the receiver is account"""
-        return [i for i in self._list if i.receiver == account]
+        return self._filter(account, self._receivers, lambda i: i.receiver == account)
 
     def of_address(self, account: Any) -> List:
         """Returns a list of transactions where account is the sender or receiver"""
-        return [i for i in self._list if i.receiver == account or i.sender == account]
+        with self._lock:
+            result = set(self.from_sender(account) + self.to_receiver(account))
+            pending = [i for i in self._pending if i in result]
+            return sorted(result.difference(pending), key=_sort_key) + pending
+
+    def _filter(self, account: Any, index: Dict, check: Callable) -> List:
+        try:
+            key = _key(account)
+        except ValueError:
+            return []
+        # pending transactions are not indexed yet
+        with self._lock:
+            return index.get(key, []) + [i for i in self._pending if check(i)]
 
     def _gas(self, fn_name: str, gas_used: int) -> None:
         if fn_name not in self.gas_profile:
@@ -85,6 +188,124 @@ class TxHistory(metaclass=_Singleton):
         gas["count"] += 1
 
 
+class CallCache(metaclass=_Singleton):
+
+    """Least recently used cache for the results of contract calls.
+
+    Keys begin with the block height that the call was made at. When the RPC is
+    reverted, results from blocks that no longer exist are discarded.
+
+    While a local RPC is active, the block height is tracked locally and only
+    requested again once a block may have been mined."""
+
+    def __init__(self) -> None:
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._height: Optional[int] = None
+        # incremented each time the height is cleared, so that a height which was
+        # requested before the change is not stored
+        self._height_id = 0
+        rpc._revert_register(self)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _reset(self) -> None:
+        self.clear()
+        self._new_block()
+
+    def _revert(self, height: int) -> None:
+        with self._lock:
+            for key in [i for i in self._cache if i[0] > height]:
+                del self._cache[key]
+        self._new_block()
+
+    def _new_block(self) -> None:
+        # called when the block height may have changed
+        with self._lock:
+            self._height = None
+            self._height_id += 1
+
+    def block_height(self) -> int:
+        """Returns the current block height, using the locally tracked value when
+        possible. Other networks may mine blocks at any time, so the height is
+        always requested unless a local RPC is active."""
+        if not rpc.is_active():
+            return web3.eth.blockNumber
+        with self._lock:
+            height, height_id = self._height, self._height_id
+        if height is None:
+            height = web3.eth.blockNumber
+            with self._lock:
+                if self._height_id == height_id:
+                    self._height = height
+        return height
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Returns a cached result, or None if the key is not cached."""
+        with self._lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def set(self, key: Tuple, value: Any, max_size: int) -> None:
+        """Adds a result to the cache, removing the least recently used results
+        so that the cache holds at most max_size items."""
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _key(address: Any) -> str:
+    return to_address(str(address))
+
+
+def _sort_key(tx: Any) -> Tuple:
+    return (tx.block_number, tx.txindex)
+
+
+class _SortKeys:
+
+    """Read-only view of the sort keys of a list of transactions, so the list can
+    be searched with bisect."""
+
+    def __init__(self, tx_list: List) -> None:
+        self._list = tx_list
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    def __getitem__(self, idx: int) -> Tuple:
+        return _sort_key(self._list[idx])
+
+
+def _insert_sorted(index: Dict, key: str, tx: Any) -> None:
+    tx_list = index.setdefault(key, [])
+    if not tx_list or _sort_key(tx_list[-1]) <= _sort_key(tx):
+        tx_list.append(tx)
+    else:
+        tx_list.insert(bisect_right(_SortKeys(tx_list), _sort_key(tx)), tx)
+
+
+def _remove_from(index: Dict, key: str, tx: Any) -> None:
+    tx_list = index[key]
+    if tx_list[-1] is tx:
+        tx_list.pop()
+    elif tx_list[0] is tx:
+        del tx_list[0]
+    else:
+        tx_list.remove(tx)
+    if not tx_list:
+        del index[key]
+
+
 _contract_map: Dict = {}
 
 
@@ -0,0 +1,433 @@
+#!/usr/bin/python3
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from array import array
+from bisect import bisect_right
+import gzip
+from hashlib import sha1
+import json
+import os
+from pathlib import Path
+
+from brownie._config import CONFIG
+
+_COLUMN_KEYS = ("pc", "depth", "gas", "gasCost", "op", "stack", "memory", "storage")
+
+_cache_path: Optional[Path] = None
+_cache_size: Optional[int] = None
+
+
+class _Table:
+
+    """Interning table that maps repeated values to integer ids."""
+
+    def __init__(self) -> None:
+        self._values: List = []
+        self._ids: Dict = {}
+
+    def __getitem__(self, idx: int) -> Any:
+        return self._values[idx]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, key: Any, value: Any = None) -> int:
+        """Returns the id for key, adding value to the table if it is new."""
+        try:
+            return self._ids[key]
+        except KeyError:
+            self._ids[key] = len(self._values)
+            self._values.append(key if value is None else value)
+            return self._ids[key]
+
+
+class Frame:
+
+    """A function call within a transaction trace, as shown by call_trace.
+
+    Attributes:
+        start: index of the first step in the frame
+        stop: index following the final step in the frame
+        depth: call depth of the frame
+        jump_depth: internal jump depth of the frame
+        parent: index of the enclosing frame within Trace.frames
+        external: True if the frame was entered by calling a contract, False if
+                  it was entered by jumping to an internal function
+        caller_jump_depth: jump depth of the step preceding the frame
+        is_last: True if the calling frame makes no further calls after this one"""
+
+    __slots__ = (
+        "start",
+        "stop",
+        "depth",
+        "jump_depth",
+        "parent",
+        "external",
+        "caller_jump_depth",
+        "is_last",
+    )
+
+    def __init__(
+        self,
+        start: int,
+        depth: int,
+        jump_depth: int,
+        parent: int,
+        external: bool,
+        caller_jump_depth: int,
+    ) -> None:
+        self.start = start
+        self.stop = start
+        self.depth = depth
+        self.jump_depth = jump_depth
+        self.parent = parent
+        self.external = external
+        self.caller_jump_depth = caller_jump_depth
+        self.is_last = True
+
+    def __repr__(self) -> str:
+        return f"<Frame {self.start}:{self.stop} ({self.depth}, {self.jump_depth})>"
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return self.depth, self.jump_depth
+
+
+class Trace:
+
+    """Compact, list-like container for an expanded transaction trace.
+
+    Rather than holding one dict per step, numeric values are stored in parallel
+    typed arrays and repeated values (opcodes, function names, addresses and source
+    offsets) are interned. Stack and memory words are shared between steps, and
+    consecutive steps with identical memory or storage reference the same object.
+
+    Indexing returns a dict for the requested step, built on access. Internal
+    methods should use the columns directly to avoid materializing steps.
+
+    A call frame index is built as steps are appended. Consecutive steps with the
+    same (depth, jump_depth) form a segment, and each segment that moves deeper
+    than the one before it opens a Frame. Trace.frames holds every frame in the
+    order they were entered, starting with the frame for the entire trace.
+
+    Columns:
+        pc: program counter
+        depth: number of external calls away from the initial contract
+        jump_depth: number of internal jumps within the active contract
+        gas: remaining gas
+        gas_cost: cost to execute the opcode"""
+
+    def __init__(self) -> None:
+        self.pc = array("L")
+        self.depth = array("H")
+        self.jump_depth = array("L")
+        self.gas = array("Q")
+        self.gas_cost = array("Q")
+        self._op = array("B")
+        self._fn = array("L")
+        self._contract = array("L")
+        self._source = array("l")
+        self._stack: List = []
+        self._memory: List = []
+        self._storage: List = []
+        self._extra: Dict = {}
+
+        self._ops = _Table()
+        self._fns = _Table()
+        self._contracts = _Table()
+        self._sources = _Table()
+        self._words: Dict = {}
+
+        # call frame index
+        self._frames: List = []
+        self._segments = array("L")
+        self._segment_parent = array("l")
+        self._open_frames: List = []
+        self._open_segments: List = []
+        self._pending: Dict = {}
+        self._awaiting: Tuple = ((), [])
+        self._last_key: Tuple = ()
+
+    def __repr__(self) -> str:
+        return f"<Trace object ({len(self)} steps)>"
+
+    def __len__(self) -> int:
+        return len(self.pc)
+
+    def __iter__(self) -> Iterator:
+        return (self._get_step(i) for i in range(len(self)))
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._get_step(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("trace index out of range")
+        return self._get_step(key)
+
+    def append(
+        self,
+        step: Dict,
+        address: str,
+        contract_name: Optional[str],
+        fn: str,
+        jump_depth: int,
+        source: Union[Dict, bool],
+    ) -> None:
+        """Adds a step to the trace.
+
+        Args:
+            step: raw structLog step from debug_traceTransaction
+            address: address of the contract executing the step
+            contract_name: name of the contract executing the step
+            fn: name of the active function
+            jump_depth: number of internal jumps within the active contract
+            source: dict of {'filename', 'offset'} or False if no source is available
+        """
+        idx = len(self)
+        key = (step["depth"], jump_depth)
+        if key != self._last_key:
+            self._add_segment(idx, key)
+        self.pc.append(step["pc"])
+        self.depth.append(step["depth"])
+        self.jump_depth.append(jump_depth)
+        self.gas.append(step["gas"])
+        self.gas_cost.append(step["gasCost"])
+        self._op.append(self._ops.add(step["op"]))
+        self._fn.append(self._fns.add(fn))
+        self._contract.append(self._contracts.add((address, contract_name)))
+        if source:
+            key = (source["filename"], tuple(source["offset"]))  # type: ignore
+            self._source.append(self._sources.add(key, source))
+        else:
+            self._source.append(-1)
+
+        # every step adds a value to each column, None marks a missing key
+        stack = step.get("stack")
+        if stack is not None:
+            stack = self._intern_words(stack)
+        self._stack.append(stack)
+
+        memory = step.get("memory")
+        if memory is not None:
+            memory = tuple(memory)
+            if idx and memory == self._memory[-1]:
+                memory = self._memory[-1]
+            else:
+                memory = self._intern_words(memory)
+        self._memory.append(memory)
+
+        storage = step.get("storage")
+        if idx and storage is not None and storage == self._storage[-1]:
+            storage = self._storage[-1]
+        self._storage.append(storage)
+
+        extra = dict((k, v) for k, v in step.items() if k not in _COLUMN_KEYS)
+        if extra:
+            self._extra[idx] = extra
+
+    def _add_segment(self, idx: int, key: Tuple) -> None:
+        segment = len(self._segments)
+        self._segments.append(idx)
+        last_key, self._last_key = self._last_key, key
+
+        # a frame is the last call made by its caller if the step after execution
+        # next returns to the caller is not any deeper than the caller
+        caller_key, frames = self._awaiting
+        for frame in frames:
+            frame.is_last = key <= caller_key
+        self._awaiting = (key, self._pending.pop(key, []))
+
+        # frames end at the first segment that is shallower than the frame
+        open_frames = self._open_frames
+        while open_frames and self._frames[open_frames[-1]].key > key:
+            self._frames[open_frames.pop()].stop = idx
+
+        # link each segment to the most recent preceding segment that is shallower
+        open_segments = self._open_segments
+        while open_segments and self._segment_key(open_segments[-1]) >= key:
+            open_segments.pop()
+        self._segment_parent.append(open_segments[-1] if open_segments else -1)
+        open_segments.append(segment)
+
+        if not segment:
+            self._frames.append(Frame(idx, key[0], key[1], -1, False, 0))
+        elif key > last_key:
+            parent = open_frames[-1] if open_frames else 0
+            external = key[0] > last_key[0]
+            frame = Frame(idx, key[0], key[1], parent, external, last_key[1])
+            open_frames.append(len(self._frames))
+            self._frames.append(frame)
+            self._pending.setdefault(last_key, []).append(frame)
+
+    def _segment_key(self, segment: int) -> Tuple:
+        idx = self._segments[segment]
+        return self.depth[idx], self.jump_depth[idx]
+
+    def _intern_words(self, words: Iterable) -> tuple:
+        cache = self._words
+        return tuple(cache.setdefault(i, i) for i in words)
+
+    @property
+    def frames(self) -> List:
+        """List of Frame objects for each call within the trace, in the order they
+        were entered. The first frame spans the entire trace."""
+        if self._frames:
+            self._frames[0].stop = len(self)
+            for frame_id in self._open_frames:
+                self._frames[frame_id].stop = len(self)
+        return self._frames
+
+    def get_callers(self, idx: int) -> List:
+        """Returns the index of the final step before execution moved to the frame
+        of the given step, and then to the frame of each calling step in turn."""
+        segment = bisect_right(self._segments, idx) - 1
+        result = []
+        while True:
+            segment = self._segment_parent[segment]
+            if segment == -1:
+                return result
+            result.append(self._segments[segment + 1] - 1)
+
+    def get_op(self, idx: int) -> str:
+        """Returns the opcode executed at the given step."""
+        return self._ops[self._op[idx]]
+
+    def get_fn(self, idx: int) -> str:
+        """Returns the name of the active function at the given step."""
+        return self._fns[self._fn[idx]]
+
+    def get_address(self, idx: int) -> str:
+        """Returns the address of the contract executing the given step."""
+        return self._contracts[self._contract[idx]][0]
+
+    def get_contract_name(self, idx: int) -> Optional[str]:
+        """Returns the name of the contract executing the given step."""
+        return self._contracts[self._contract[idx]][1]
+
+    def has_source(self, idx: int) -> bool:
+        """Checks if the given step has an associated source offset."""
+        return self._source[idx] != -1
+
+    def get_source(self, idx: int) -> Union[Dict, bool]:
+        """Returns the source dict for the given step, or False if there is none."""
+        source_id = self._source[idx]
+        if source_id == -1:
+            return False
+        return dict(self._sources[source_id])
+
+    def _get_step(self, idx: int) -> Dict:
+        step = {
+            "address": self.get_address(idx),
+            "contractName": self.get_contract_name(idx),
+            "depth": self.depth[idx],
+            "fn": self.get_fn(idx),
+            "gas": self.gas[idx],
+            "gasCost": self.gas_cost[idx],
+            "jumpDepth": self.jump_depth[idx],
+            "op": self.get_op(idx),
+            "pc": self.pc[idx],
+            "source": self.get_source(idx),
+        }
+        if self._stack[idx] is not None:
+            step["stack"] = list(self._stack[idx])
+        if self._memory[idx] is not None:
+            step["memory"] = list(self._memory[idx])
+        if self._storage[idx] is not None:
+            step["storage"] = self._storage[idx].copy()
+        if idx in self._extra:
+            step.update(self._extra[idx])
+        return step
+
+
+def set_cache_path(path: Optional[Path]) -> None:
+    """Sets the folder where traces are cached. Called when a project is loaded.
+
+    Args:
+        path: Path of the cache folder, or None to disable the cache
+    """
+    global _cache_path, _cache_size
+    _cache_path = path
+    _cache_size = None
+
+
+def get_cached_trace(txid: str, block_hash: str, options: Dict) -> Optional[List]:
+    """Returns a cached structLog from debug_traceTransaction.
+
+    Args:
+        txid: transaction hash
+        block_hash: hash of the block that the transaction was mined in
+        options: tracer options used to generate the structLog
+
+    Returns: structLog list, or None if the trace is not cached
+    """
+    path = _get_cache_file(txid, block_hash, options)
+    if path is None or not path.exists():
+        return None
+    try:
+        with gzip.open(str(path), "rt") as fp:
+            trace = json.load(fp)
+    except (OSError, EOFError, ValueError):
+        # the file is corrupted, it will be replaced when the trace is fetched
+        return None
+    # the cache is evicted in order of last access
+    os.utime(str(path))
+    return trace
+
+
+def cache_trace(txid: str, block_hash: str, options: Dict, trace: List) -> None:
+    """Adds a structLog from debug_traceTransaction to the trace cache.
+
+    Args:
+        txid: transaction hash
+        block_hash: hash of the block that the transaction was mined in
+        options: tracer options used to generate the structLog
+        trace: structLog list
+    """
+    global _cache_size
+    path = _get_cache_file(txid, block_hash, options)
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if _cache_size is None:
+        _cache_size = sum(i.stat().st_size for i in path.parent.glob("*.json.gz"))
+
+    # write to a temporary file first so a partial trace is never read
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(str(temp_path), "wt") as fp:
+        json.dump(trace, fp)
+    if path.exists():
+        _cache_size -= path.stat().st_size
+    os.replace(str(temp_path), str(path))
+    _cache_size += path.stat().st_size
+
+    max_size = CONFIG["active_network"]["trace_cache_size"] * 1024 ** 2
+    if _cache_size > max_size:
+        _evict_cache(path.parent, max_size)
+
+
+def _get_cache_file(txid: str, block_hash: str, options: Dict) -> Optional[Path]:
+    if _cache_path is None or not CONFIG["active_network"].get("trace_cache"):
+        return None
+    key = f"{txid}{block_hash}{json.dumps(options, sort_keys=True)}"
+    return _cache_path.joinpath(f"{sha1(key.encode()).hexdigest()}.json.gz")
+
+
+def _evict_cache(folder: Path, max_size: int) -> None:
+    # removes the least recently used traces until the cache is within max_size
+    global _cache_size
+    files = []
+    for path in folder.glob("*.json.gz"):
+        stat = path.stat()
+        files.append((stat.st_mtime, stat.st_size, path))
+    files.sort()
+    _cache_size = sum(i[1] for i in files)
+    for mtime, size, path in files:
+        if _cache_size <= max_size:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        _cache_size -= size
@@ -1,17 +1,17 @@
 #!/usr/bin/python3
 
-from typing import Any, Optional, Tuple, Dict, List
+from typing import Any, Callable, Optional, Tuple, Dict, List, Iterable, Iterator, Set
 from hashlib import sha1
 
 import requests
 import threading
-import time
 from web3.exceptions import TransactionNotFound
 
 from eth_abi import decode_abi
 from hexbytes import HexBytes
 
-from .state import TxHistory, find_contract
+from .state import CallCache, TxHistory, find_contract
+from .trace import Trace, cache_trace, get_cached_trace
 from .event import decode_logs, decode_trace
 from pathlib import Path
 from .web3 import Web3
@@ -24,6 +24,7 @@ from brownie.test import coverage
 from brownie._config import ARGV
 
 history = TxHistory()
+call_cache = CallCache()
 web3 = Web3()
 
 
@@ -63,9 +64,12 @@ class TransactionReceipt:
         modified_state: Boolean, did this contract write to storage?"""
 
     __slots__ = (
+        "_block_hash",
         "_getattr",
         "_trace",
+        "_trace_options",
         "_revert_pc",
+        "_revert_info",
         "_confirmed",
         "block_number",
         "contract_address",
@@ -98,6 +102,7 @@ class TransactionReceipt:
         silent: bool = False,
         name: str = "",
         revert_data: Optional[Tuple] = None,
+        wait: bool = True,
     ) -> None:
         """Instantiates a new TransactionReceipt object.
 
@@ -107,6 +112,9 @@ class TransactionReceipt:
             silent: toggles console verbosity
             name: contract function being called
             revert_data: (revert string, program counter, revert type)
+            wait: if False, the transaction is added to the confirmation service
+                  without blocking. The caller must await it and then call
+                  _handle_confirmation.
         """
         if type(txid) is not str:
             txid = txid.hex()
@@ -115,9 +123,12 @@ class TransactionReceipt:
                 f"{color['key']}Transaction sent{color}: {color['value']}{txid}{color}"
             )
         history._add_tx(self)
+        # the transaction may already be mined, or will be soon
+        call_cache._new_block()
 
         self._getattr = False
         self._trace = None
+        self._trace_options: Dict = {}
         self._confirmed = threading.Event()
         self.sender = sender
         self.status = -1
@@ -138,37 +149,39 @@ class TransactionReceipt:
             if type(revert_msg) is str:
                 self.revert_msg = revert_msg
 
-        # threaded to allow impatient users to ctrl-c to stop waiting in the console
-        confirm_thread = threading.Thread(
-            target=self._await_confirmation, args=(silent,), daemon=True
-        )
-        confirm_thread.start()
+        self._revert_info = (revert_msg, revert_type)
+
+        if not wait:
+            _confirmations.add(self, silent)
+            return
         try:
-            confirm_thread.join()
-            if ARGV["cli"] == "console":
-                return
-            # if coverage evaluation is active, evaluate the trace
-            if (
-                ARGV["coverage"]
-                and not coverage.check_cached(self.coverage_hash)
-                and self.trace
-            ):
-                self._expand_trace()
-            if not self.status:
-                if revert_msg is None:
-                    # no revert message and unable to check dev string - have to get trace
-                    self._expand_trace()
-                # raise from a new function to reduce pytest traceback length
-                _raise(
-                    f"{revert_type} {self.revert_msg or ''}",
-                    self._traceback_string()
-                    if ARGV["revert"]
-                    else self._error_string(1),
-                )
+            # the shared confirmation service polls for the receipt in its own
+            # thread, so impatient users can ctrl-c to stop waiting in the console
+            self._await_confirmation(silent)
+            self._handle_confirmation()
         except KeyboardInterrupt:
             if ARGV["cli"] != "console":
                 raise
 
+    def _handle_confirmation(self) -> None:
+        """Evaluates coverage for a confirmed transaction, and raises
+        VirtualMachineError if it reverted."""
+        if ARGV["cli"] == "console":
+            return
+        # if coverage evaluation is active, evaluate the trace
+        if ARGV["coverage"] and not coverage.check_cached(self.coverage_hash):
+            self._expand_trace(coverage_only=bool(self.status))
+        if not self.status:
+            revert_msg, revert_type = self._revert_info
+            if revert_msg is None:
+                # no revert message and unable to check dev string - have to get trace
+                self._expand_trace()
+            # raise from a new function to reduce pytest traceback length
+            _raise(
+                f"{revert_type} {self.revert_msg or ''}",
+                self._traceback_string() if ARGV["revert"] else self._error_string(1),
+            )
+
     def __repr__(self) -> str:
         c = {-1: "pending", 0: "error", 1: None}
         return f"<Transaction object '{color[c[self.status]]}{self.txid}{color}'>"
@@ -194,13 +207,18 @@ class TransactionReceipt:
             self._getattr = False
 
     def _await_confirmation(self, silent: bool) -> None:
-        # await tx showing in mempool
-        while True:
-            try:
-                tx = web3.eth.getTransaction(self.txid)
-                break
-            except TransactionNotFound:
-                time.sleep(0.5)
+        """Blocks until the transaction has confirmed."""
+        self._confirmed.clear()
+        _confirmations.add(self, silent)
+        _confirmations.wait(self)
+
+    def _check_pending(self, silent: bool) -> bool:
+        """Checks if the transaction is known to the network. Returns True once
+        it has been found, after setting attributes from the transaction."""
+        try:
+            tx = web3.eth.getTransaction(self.txid)
+        except TransactionNotFound:
+            return False
         self._set_from_tx(tx)
 
         if not silent:
@@ -210,13 +228,24 @@ class TransactionReceipt:
             )
         if not tx["blockNumber"] and not silent:
             print("Waiting for confirmation...")
+        return True
 
-        # await confirmation
-        receipt = web3.eth.waitForTransactionReceipt(self.txid, None)
+    def _check_confirmed(self, silent: bool) -> bool:
+        """Checks if the transaction has confirmed. Returns True once it has,
+        after setting attributes from the receipt."""
+        try:
+            receipt = web3.eth.getTransactionReceipt(self.txid)
+        except TransactionNotFound:
+            return False
+        if receipt is None or receipt["blockHash"] is None:
+            return False
         self._set_from_receipt(receipt)
+        history._confirm_tx(self)
+        call_cache._new_block()
         self._confirmed.set()
         if not silent:
             print(self._confirm_output())
+        return True
 
     def _set_from_tx(self, tx: Dict) -> None:
         if not self.sender:
@@ -237,6 +266,7 @@ class TransactionReceipt:
     def _set_from_receipt(self, receipt: Dict) -> None:
         """Sets object attributes based on the transaction reciept."""
         self.block_number = receipt["blockNumber"]
+        self._block_hash = HexBytes(receipt["blockHash"]).hex()
         self.txindex = receipt["transactionIndex"]
         self.gas_used = receipt["gasUsed"]
         self.contract_address = receipt["contractAddress"]
@@ -271,28 +301,71 @@ class TransactionReceipt:
             )
         return result + "\n"
 
-    def _get_trace(self) -> None:
+    def _get_trace(self, full: bool = False) -> None:
         """Retrieves the stack trace via debug_traceTransaction and finds the
         return value, revert message and event logs in the trace.
+
+        Stack and memory are only requested if they are required to find the
+        return value or revert message, or if full is True.
+
+        Args:
+            full: Request the stack and memory for every step
         """
 
         # check if trace has already been retrieved, or the tx warrants it
-        if self._trace is not None:
+        if self._trace is not None and not (
+            full and self._trace_options.get("disableMemory")
+        ):
             return
         self.return_value = None
         if not hasattr(self, "revert_msg"):
             self.revert_msg = None
         self._trace = []
-        if (self.input == "0x" and self.gas_used == 21000) or self.contract_address:
+        if not self._has_trace():
             self.modified_state: Optional[bool] = bool(self.contract_address)
-            self.trace: Any = []
+            self.trace: Any = Trace()
             return
 
+        options = {"disableStorage": ARGV["cli"] != "console"}
+        if not full and self.status and not self._has_return_value():
+            # only the opcodes are needed to check if the state was modified
+            options.update(disableMemory=True, disableStack=True)
+        self._trace = trace = self._fetch_trace(options)
+        self._trace_options = options
+        if not trace:
+            self.modified_state = False
+        elif self.status:
+            self._confirmed_trace(trace)
+        else:
+            self._reverted_trace(trace)
+
+    def _has_trace(self) -> bool:
+        # deployments and plain ether transfers are not traced
+        return not (self.input == "0x" and self.gas_used == 21000) and not (
+            self.contract_address
+        )
+
+    def _has_return_value(self) -> bool:
+        contract = find_contract(self.receiver)
+        if not contract or not self.fn_name:
+            return False
+        fn = getattr(contract, self.fn_name, None)
+        # overloaded methods do not have a single abi, assume a return value
+        return bool(fn.abi["outputs"]) if hasattr(fn, "abi") else True
+
+    def _fetch_trace(self, options: Dict) -> List:
+        """Returns the structLog for this transaction, from the trace cache or
+        by querying debug_traceTransaction."""
+        trace = get_cached_trace(self.txid, self._block_hash, options)
+        if trace is None:
+            trace = self._request_trace(options)
+            cache_trace(self.txid, self._block_hash, options, trace)
+        return trace
+
+    def _request_trace(self, options: Dict) -> List:
+        """Queries debug_traceTransaction and returns the structLog."""
         try:
-            trace = web3.provider.make_request(  # type: ignore
-                "debug_traceTransaction",
-                (self.txid, {"disableStorage": ARGV["cli"] != "console"}),
-            )
+            trace = web3._raw_request("debug_traceTransaction", (self.txid, options))
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             msg = f"Encountered a {type(e).__name__} while requesting "
             msg += "debug_traceTransaction. The local RPC client has likely crashed."
@@ -303,18 +376,12 @@ class TransactionReceipt:
         if "error" in trace:
             self.modified_state = None
             raise RPCRequestError(trace["error"]["message"])
-        self._trace = trace = trace["result"]["structLogs"]
-        if not trace:
-            self.modified_state = False
-        elif self.status:
-            self._confirmed_trace(trace)
-        else:
-            self._reverted_trace(trace)
+        return trace["result"]["structLogs"]
 
     def _confirmed_trace(self, trace: List) -> None:
         self.modified_state = next((True for i in trace if i["op"] == "SSTORE"), False)
         step = trace[-1]
-        if step["op"] != "RETURN":
+        if step["op"] != "RETURN" or "memory" not in step:
             return
         contract = find_contract(self.receiver)
         if contract:
@@ -329,7 +396,9 @@ class TransactionReceipt:
         if self.revert_msg is not None:
             return
         # get revert message
-        step = next(i for i in trace if i["op"] in ("REVERT", "INVALID"))
+        idx, step = next(
+            (i, x) for i, x in enumerate(trace) if x["op"] in ("REVERT", "INVALID")
+        )
         if step["op"] == "REVERT" and int(step["stack"][-2], 16):
             # get returned error string from stack
             data = _get_memory(step, -1)[4:]
@@ -342,18 +411,19 @@ class TransactionReceipt:
         # if none is found, expand the trace and get it from the pcMap
         self._expand_trace()
         try:
-            pc_map = find_contract(step["address"])._build["pcMap"]
+            pc_map = find_contract(self.trace.get_address(idx))._build["pcMap"]
             # if this is the function selector revert, check for a jump
             if "first_revert" in pc_map[step["pc"]]:
-                i = trace.index(step) - 4
+                i = idx - 4
                 if trace[i]["pc"] != step["pc"] - 4:
                     step = trace[i]
             self.revert_msg = pc_map[step["pc"]]["dev"]
         except KeyError:
             self.revert_msg = ""
 
-    def _expand_trace(self) -> None:
-        """Adds the following attributes to each step of the stack trace:
+    def _expand_trace(self, coverage_only: bool = False) -> None:
+        """Expands the stack trace into a Trace object, which adds the following
+        attributes to each step:
 
         address: The address executing this contract.
         contractName: The name of the contract.
@@ -364,92 +434,40 @@ class TransactionReceipt:
             filename: path to the source file for this step
             offset: Start and end offset associated source code
         }
+
+        Args:
+            coverage_only: Only evaluate coverage for the transaction. The trace is
+                           requested without memory and is not stored.
         """
+        if coverage_only and self._trace is None:
+            self._evaluate_coverage()
+            return
         if hasattr(self, "trace"):
             return
-        if self._trace is None:
-            self._get_trace()
-        self.trace = trace = self._trace
-        if not trace or "fn" in trace[0]:
+        self._get_trace(full=True)
+        self.trace = Trace()
+        if not self._trace:
             coverage.add_transaction(self.coverage_hash, {})
             return
 
-        # last_map gives a quick reference of previous values at each depth
-        last_map = {0: _get_last_map(self.receiver, self.input[:10])}
-        coverage_eval: Dict = {last_map[0]["name"]: {}}
-        active_branches = set()
-
-        for i in range(len(trace)):
-            # if depth has increased, tx has called into a different contract
-            if trace[i]["depth"] > trace[i - 1]["depth"]:
-                # get call signature
-                stack_idx = -4 if trace[i - 1]["op"] in {"CALL", "CALLCODE"} else -3
-                offset = int(trace[i - 1]["stack"][stack_idx], 16) * 2
-                sig = HexBytes(
-                    "".join(trace[i - 1]["memory"])[offset : offset + 8]
-                ).hex()
-
-                # get contract and method name
-                address = trace[i - 1]["stack"][-2][-40:]
-
-                last_map[trace[i]["depth"]] = _get_last_map(address, sig)
-                coverage_eval.setdefault(last_map[trace[i]["depth"]]["name"], {})
-
-            # update trace from last_map
-            last = last_map[trace[i]["depth"]]
-            trace[i].update(
-                {
-                    "address": last["address"],
-                    "contractName": last["name"],
-                    "fn": last["fn"][-1],
-                    "jumpDepth": last["jumpDepth"],
-                    "source": False,
-                }
-            )
-
-            if "pc_map" not in last:
-                continue
-            pc = last["pc_map"][trace[i]["pc"]]
-
-            if "path" not in pc:
-                continue
-            trace[i]["source"] = {"filename": pc["path"], "offset": pc["offset"]}
-
-            if "fn" not in pc:
-                continue
-
-            # calculate coverage
-            if pc["path"] != "<stdin>":
-                if pc["path"] not in coverage_eval[last["name"]]:
-                    coverage_eval[last["name"]][pc["path"]] = [set(), set(), set()]
-                if "statement" in pc:
-                    coverage_eval[last["name"]][pc["path"]][0].add(pc["statement"])
-                if "branch" in pc:
-                    if pc["op"] != "JUMPI":
-                        active_branches.add(pc["branch"])
-                    elif pc["branch"] in active_branches:
-                        # false, true
-                        key = 1 if trace[i + 1]["pc"] == trace[i]["pc"] + 1 else 2
-                        coverage_eval[last["name"]][pc["path"]][key].add(pc["branch"])
-                        active_branches.remove(pc["branch"])
-
-            # ignore jumps with no function - they are compiler optimizations
-            if "jump" not in pc:
-                continue
+        coverage_eval: Dict = {}
+        for step in _expand_steps(
+            self._trace, self.receiver, self.input[:10], coverage_eval
+        ):
+            self.trace.append(*step)
+        # the expanded trace holds all the raw data, no need to keep both
+        self._trace = self.trace
+        coverage.add_transaction(
+            self.coverage_hash, dict((k, v) for k, v in coverage_eval.items() if v)
+        )
 
-            # jump 'i' is calling into an internal function
-            if pc["jump"] == "i":
-                try:
-                    fn = last["pc_map"][trace[i + 1]["pc"]]["fn"]
-                except (KeyError, IndexError):
-                    continue
-                if fn != last["fn"][-1]:
-                    last["fn"].append(fn)
-                    last["jumpDepth"] += 1
-            # jump 'o' is returning from an internal function
-            elif last["jumpDepth"] > 0:
-                del last["fn"][-1]
-                last["jumpDepth"] -= 1
+    def _evaluate_coverage(self) -> None:
+        if not self._has_trace():
+            return
+        trace = self._fetch_trace({"disableStorage": True, "disableMemory": True})
+        coverage_eval: Dict = {}
+        for step in _expand_steps(trace, self.receiver, self.input[:10], coverage_eval):
+            pass
         coverage.add_transaction(
             self.coverage_hash, dict((k, v) for k, v in coverage_eval.items() if v)
         )
@@ -517,43 +535,25 @@ class TransactionReceipt:
             )
 
         result = f"Call trace for '{color['value']}{self.txid}{color}':"
-        result += _step_print(trace[0], trace[-1], None, 0, len(trace))
+        result += _step_print(trace, None, 0, len(trace))
         indent = {0: 0}
         indent_chars = [""] * 1000
 
-        # (index, depth, jumpDepth) for relevent steps in the trace
-        trace_index = [(0, 0, 0)] + [
-            (i, trace[i]["depth"], trace[i]["jumpDepth"])
-            for i in range(1, len(trace))
-            if not _step_compare(trace[i], trace[i - 1])
-        ]
-
-        for i, (idx, depth, jump_depth) in enumerate(trace_index[1:], start=1):
-            last = trace_index[i - 1]
-            if depth > last[1]:
+        for frame in trace.frames[1:]:
+            depth = frame.depth
+            if frame.external:
                 # called to a new contract
-                indent[depth] = trace_index[i - 1][2] + indent[depth - 1]
-                end = next(
-                    (x[0] for x in trace_index[i + 1 :] if x[1] < depth), len(trace)
-                )
+                indent[depth] = frame.caller_jump_depth + indent[depth - 1]
                 _depth = depth + indent[depth]
-                symbol, indent_chars[_depth] = _check_last(trace_index[i - 1 :])
-                indent_str = "".join(indent_chars[:_depth]) + symbol
-                result += _step_print(trace[idx], trace[end - 1], indent_str, idx, end)
-            elif depth == last[1] and jump_depth > last[2]:
+            else:
                 # jumped into an internal function
-                end = next(
-                    (
-                        x[0]
-                        for x in trace_index[i + 1 :]
-                        if x[1] < depth or (x[1] == depth and x[2] < jump_depth)
-                    ),
-                    len(trace),
-                )
-                _depth = depth + jump_depth + indent[depth]
-                symbol, indent_chars[_depth] = _check_last(trace_index[i - 1 :])
-                indent_str = "".join(indent_chars[:_depth]) + symbol
-                result += _step_print(trace[idx], trace[end - 1], indent_str, idx, end)
+                _depth = depth + frame.jump_depth + indent[depth]
+            if frame.is_last:
+                symbol, indent_chars[_depth] = "\u2514", "  "
+            else:
+                symbol, indent_chars[_depth] = "\u251c", "\u2502 "
+            indent_str = "".join(indent_chars[:_depth]) + symbol
+            result += _step_print(trace, indent_str, frame.start, frame.stop)
         print(result)
 
     def traceback(self) -> None:
@@ -573,30 +573,16 @@ class TransactionReceipt:
 
         try:
             idx = next(
-                i for i in range(len(trace)) if trace[i]["op"] in ("REVERT", "INVALID")
+                i
+                for i in range(len(trace))
+                if trace.get_op(i) in ("REVERT", "INVALID")
             )
             trace_range = range(idx, -1, -1)
         except StopIteration:
             return ""
 
-        result = [next(i for i in trace_range if trace[i]["source"])]
-        depth, jump_depth = trace[idx]["depth"], trace[idx]["jumpDepth"]
-
-        while True:
-            try:
-                idx = next(
-                    i
-                    for i in trace_range
-                    if trace[i]["depth"] < depth
-                    or (
-                        trace[i]["depth"] == depth
-                        and trace[i]["jumpDepth"] < jump_depth
-                    )
-                )
-                result.append(idx)
-                depth, jump_depth = trace[idx]["depth"], trace[idx]["jumpDepth"]
-            except StopIteration:
-                break
+        result = [next(i for i in trace_range if trace.has_source(i))]
+        result += trace.get_callers(idx)
         return (
             f"{color}Traceback for '{color['value']}{self.txid}{color}':\n"
             + "\n".join(self._source_string(i, 0) for i in result[::-1])
@@ -632,9 +618,9 @@ class TransactionReceipt:
         trace_range = range(len(trace) - 1, -1, -1)
         try:
             idx = next(
-                i for i in trace_range if trace[i]["op"] in {"REVERT", "INVALID"}
+                i for i in trace_range if trace.get_op(i) in {"REVERT", "INVALID"}
             )
-            idx = next(i for i in trace_range if trace[i]["source"])
+            idx = next(i for i in trace_range if trace.has_source(i))
             return self._source_string(idx, pad)
         except StopIteration:
             return ""
@@ -651,13 +637,16 @@ class TransactionReceipt:
 
         Returns: source code string
         """
-        trace = self.trace[idx]
-        if not trace["source"]:
+        trace = self.trace
+        if idx < 0:
+            idx += len(trace)
+        step_source = trace.get_source(idx)
+        if not step_source:
             return ""
-        contract = find_contract(self.trace[idx]["address"])
+        contract = find_contract(trace.get_address(idx))
         source, linenos = highlight_source(
-            contract._project._sources.get(trace["source"]["filename"]),
-            trace["source"]["offset"],
+            contract._project._sources.get(step_source["filename"]),
+            step_source["offset"],
             pad,
         )
         if not source:
@@ -665,13 +654,123 @@ class TransactionReceipt:
         return _format_source(
             source,
             linenos,
-            trace["source"]["filename"],
-            trace["pc"],
-            self.trace.index(trace),
-            trace["fn"],
+            step_source["filename"],
+            trace.pc[idx],
+            idx,
+            trace.get_fn(idx),
         )
 
 
+class _ConfirmationService:
+
+    """Awaits confirmation for every pending transaction in a single daemon thread.
+
+    Transactions are first checked as soon as they are added. Pending receipts
+    are queried again each time a block filter reports a new block, or on every
+    poll if the provider does not support filters."""
+
+    poll_interval = 0.1
+
+    def __init__(self) -> None:
+        self._lock = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Dict = {}
+        self._callbacks: Dict = {}
+        self._errors: Dict = {}
+        self._added = False
+        self._block_filter: Any = None
+        self._use_filter = True
+
+    def add(self, tx: TransactionReceipt, silent: bool) -> None:
+        """Adds a transaction to be confirmed."""
+        with self._lock:
+            # receipts hash by txid, so they are keyed by id to allow more than
+            # one receipt for the same transaction
+            # [receipt, silent, has the tx been found on the network?]
+            self._pending[id(tx)] = [tx, silent, False]
+            self._added = True
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._lock.notify()
+
+    def wait(self, tx: TransactionReceipt) -> None:
+        """Blocks until a transaction has confirmed, raising any exception that
+        occured while awaiting it."""
+        tx._confirmed.wait()
+        with self._lock:
+            exc = self._errors.pop(id(tx), None)
+        if exc is not None:
+            raise exc
+
+    def on_confirm(self, tx: TransactionReceipt, callback: Callable) -> None:
+        """Calls callback(tx) once a transaction has confirmed."""
+        with self._lock:
+            if id(tx) in self._pending:
+                self._callbacks.setdefault(id(tx), []).append(callback)
+                return
+        callback(tx)
+
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._added:
+                    self._lock.wait(self.poll_interval if self._pending else None)
+                added, self._added = self._added, False
+                pending = list(self._pending.values())
+            if not pending:
+                continue
+            new_block = added or self._new_block()
+            if new_block:
+                call_cache._new_block()
+            for item in pending:
+                tx, silent, found = item
+                try:
+                    if not found:
+                        found = item[2] = tx._check_pending(silent)
+                        if not found:
+                            continue
+                    elif not new_block:
+                        continue
+                    if tx._check_confirmed(silent):
+                        self._resolve(tx)
+                except Exception as e:
+                    self._resolve(tx, e)
+
+    def _new_block(self) -> bool:
+        if not self._use_filter:
+            return True
+        try:
+            if self._block_filter is None:
+                self._block_filter = web3.eth.filter("latest")
+                return True
+            return bool(self._block_filter.get_new_entries())
+        except ValueError:
+            if self._block_filter is None:
+                # the provider does not support filters
+                self._use_filter = False
+            # otherwise the filter is no longer valid, e.g. the RPC was restarted
+            self._block_filter = None
+            return True
+        except Exception:
+            self._block_filter = None
+            return True
+
+    def _resolve(self, tx: TransactionReceipt, exc: Optional[Exception] = None) -> None:
+        with self._lock:
+            del self._pending[id(tx)]
+            callbacks = self._callbacks.pop(id(tx), [])
+            if exc is not None:
+                self._errors[id(tx)] = exc
+        tx._confirmed.set()
+        if exc is None:
+            for callback in callbacks:
+                callback(tx)
+
+
+_confirmations = _ConfirmationService()
+
+
 def _format_source(
     source: str, linenos: Any, path: "Path", pc: Any, idx: int, fn_name: str
 ) -> str:
@@ -686,43 +785,44 @@ def _format_source(
     )
 
 
-def _step_compare(a: Any, b: Any) -> bool:
-    return a["depth"] == b["depth"] and a["jumpDepth"] == b["jumpDepth"]
-
-
-def _check_last(trace_index: Any) -> Tuple[str, str]:
-    initial = trace_index[0][1:]
-    try:
-        trace = next(i for i in trace_index[1:-1] if i[1:] == initial)
-    except StopIteration:
-        return "\u2514", "  "
-    i = trace_index[1:].index(trace) + 2
-    next_ = trace_index[i][1:]
-    if next_[0] < initial[0] or (next_[0] == initial[0] and next_[1] <= initial[1]):
-        return "\u2514", "  "
-    return "\u251c", "\u2502 "
+def _step_compare(trace: Trace, a: int, b: int) -> bool:
+    return (
+        trace.depth[a] == trace.depth[b] and trace.jump_depth[a] == trace.jump_depth[b]
+    )
 
 
-def _step_print(step: Dict, last_step: Any, indent: Any, start: int, stop: int) -> str:
+def _step_print(trace: Trace, indent: Any, start: int, stop: int) -> str:
     print_str = f"\n{color['dull']}"
     if indent is not None:
         print_str += f"{indent}\u2500"
-    if last_step["op"] in {"REVERT", "INVALID"} and _step_compare(step, last_step):
+    if trace.get_op(stop - 1) in {"REVERT", "INVALID"} and _step_compare(
+        trace, start, stop - 1
+    ):
         contract_color = color("error")
     else:
-        contract_color = color("contract_method" if not step["jumpDepth"] else "")
-    print_str += f"{contract_color}{step['fn']} {color['dull']}{start}:{stop}{color}"
-    if not step["jumpDepth"]:
-        print_str += (
-            f"  {color['dull']}({color}{step['address']}{color['dull']}){color}"
-        )
+        contract_color = color("contract_method" if not trace.jump_depth[start] else "")
+    print_str += (
+        f"{contract_color}{trace.get_fn(start)} {color['dull']}{start}:{stop}{color}"
+    )
+    if not trace.jump_depth[start]:
+        address = trace.get_address(start)
+        print_str += f"  {color['dull']}({color}{address}{color['dull']}){color}"
     return print_str
 
 
 def _get_memory(step: Dict, idx: int) -> HexBytes:
-    offset = int(step["stack"][idx], 16) * 2
-    length = int(step["stack"][idx - 1], 16) * 2
-    return HexBytes("".join(step["memory"])[offset : offset + length])
+    offset = int(step["stack"][idx], 16)
+    length = int(step["stack"][idx - 1], 16)
+    return HexBytes(_memory_slice(step["memory"], offset, length))
+
+
+def _memory_slice(memory: List, offset: int, length: int) -> str:
+    """Returns a hexstring slice of trace memory. Only the 32 byte words that
+    overlap the slice are joined, instead of the entire memory."""
+    start = offset // 32
+    stop = -(-(offset + length) // 32)
+    offset = (offset % 32) * 2
+    return "".join(memory[start:stop])[offset : offset + length * 2]
 
 
 def _raise(msg: str, source: Any) -> None:  # source: Union[str, 'Accounts']
@@ -741,7 +841,128 @@ def _get_last_map(address: Any, sig: str) -> Dict:
             }
         )
         if contract._build:
-            last_map["pc_map"] = contract._build["pcMap"]
+            last_map["pc_table"] = contract._project._build.get_pc_table(
+                contract._name
+            )
     else:
         last_map.update({"contract": None, "fn": [f"<UnknownContract>.{sig}"]})
     return last_map
+
+
+def _step_pairs(steps: Iterable) -> Iterator:
+    """Yields each step of a trace as a tuple of (step, next step). The final
+    step is yielded with None as the next step."""
+    steps = iter(steps)
+    step = next(steps, None)
+    for next_step in steps:
+        yield step, next_step
+        step = next_step
+    if step is not None:
+        yield step, None
+
+
+def _expand_steps(
+    steps: Iterable, receiver: Any, sig: str, coverage_eval: Dict
+) -> Iterator:
+    """Expands a raw trace in a single pass, finding the call frame and source
+    information for each step.
+
+    Steps are consumed from any iterable and yielded as soon as they have been
+    annotated. Coverage data is added to coverage_eval as the trace is walked.
+
+    Args:
+        steps: iterable of structLog steps from debug_traceTransaction
+        receiver: address of the contract called in the transaction
+        sig: bytes4 signature of the called method
+        coverage_eval: dict to add coverage data to
+
+    Yields: (step, address, contract name, function name, jump depth, source)"""
+
+    # last_map gives a quick reference of previous values at each depth
+    last_map = {0: _get_last_map(receiver, sig)}
+    coverage_eval.setdefault(last_map[0]["name"], {})
+    active_branches: Set = set()
+    prev: Dict = {"depth": 0}
+
+    for step, next_step in _step_pairs(steps):
+        # if depth has increased, tx has called into a different contract
+        if step["depth"] > prev["depth"]:
+            # get call signature, memory is not available when only evaluating coverage
+            sig = ""
+            if "memory" in prev:
+                stack_idx = -4 if prev["op"] in {"CALL", "CALLCODE"} else -3
+                offset = int(prev["stack"][stack_idx], 16)
+                sig = HexBytes(_memory_slice(prev["memory"], offset, 4)).hex()
+
+            # get contract and method name
+            address = prev["stack"][-2][-40:]
+
+            last_map[step["depth"]] = _get_last_map(address, sig)
+            coverage_eval.setdefault(last_map[step["depth"]]["name"], {})
+
+        last = last_map[step["depth"]]
+        frame = (last["address"], last["name"], last["fn"][-1], last["jumpDepth"])
+        source = _annotate_step(step, next_step, last, coverage_eval, active_branches)
+        prev = step
+        yield (step,) + frame + (source,)
+
+
+def _annotate_step(
+    step: Dict,
+    next_step: Optional[Dict],
+    last: Dict,
+    coverage_eval: Dict,
+    active_branches: Set,
+) -> Any:
+    # returns the source of the step, updating coverage and last_map as required
+    if "pc_table" not in last:
+        return False
+    table = last["pc_table"]
+    row = table.row(step["pc"])
+
+    if table.path[row] < 0:
+        return False
+    path = table.strings[table.path[row]]
+    source = {"filename": path, "offset": (table.start[row], table.stop[row])}
+
+    if table.fn[row] < 0:
+        return source
+
+    # calculate coverage, stored as bitsets of statement and branch indexes
+    if path != "<stdin>":
+        contract_eval = coverage_eval[last["name"]]
+        if path not in contract_eval:
+            contract_eval[path] = [0, 0, 0]
+        if table.statement[row] >= 0:
+            contract_eval[path][0] |= 1 << table.statement[row]
+        branch = table.branch[row]
+        if branch >= 0:
+            if table.strings[table.op[row]] != "JUMPI":
+                active_branches.add(branch)
+            elif branch in active_branches and next_step is not None:
+                # false, true
+                key = 1 if next_step["pc"] == step["pc"] + 1 else 2
+                contract_eval[path][key] |= 1 << branch
+                active_branches.remove(branch)
+
+    # ignore jumps with no function - they are compiler optimizations
+    if table.jump[row] < 0:
+        return source
+
+    # jump 'i' is calling into an internal function
+    if table.strings[table.jump[row]] == "i":
+        try:
+            fn_id = table.fn[table.row(next_step["pc"])]  # type: ignore
+        except (KeyError, TypeError):
+            return source
+        if fn_id < 0:
+            return source
+        fn = table.strings[fn_id]
+        if fn != last["fn"][-1]:
+            last["fn"].append(fn)
+            last["jumpDepth"] += 1
+    # jump 'o' is returning from an internal function
+    elif last["jumpDepth"] > 0:
+        del last["fn"][-1]
+        last["jumpDepth"] -= 1
+    return source
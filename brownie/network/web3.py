@@ -1,8 +1,19 @@
 #!/usr/bin/python3
 
+import json
 from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import HTTPProvider, IPCProvider, WebsocketProvider, Web3 as _Web3
+from web3._utils import request as web3_request
+from web3._utils.request import make_post_request
 
+from brownie._config import CONFIG
 from brownie._singleton import _Singleton
 
 
@@ -13,9 +24,12 @@ class Web3(_Web3, metaclass=_Singleton):
     def __init__(self) -> None:
         super().__init__(HTTPProvider("null"))
         self.provider = None
+        self._session: Optional[Session] = None
+        self._profiler: Optional[RequestProfiler] = None
 
     def connect(self, uri: str) -> None:
         """Connects to a provider"""
+        self._close_session()
         try:
             if Path(uri).exists():
                 self.provider = IPCProvider(uri)
@@ -25,7 +39,11 @@ class Web3(_Web3, metaclass=_Singleton):
         if uri[:3] == "ws:":
             self.provider = WebsocketProvider(uri)
         elif uri[:4] == "http":
-            self.provider = HTTPProvider(uri)
+            settings = CONFIG["active_network"]
+            self._session = _get_session(uri, settings)
+            self.provider = HTTPProvider(
+                uri, request_kwargs={"timeout": settings.get("http_timeout", 30)}
+            )
         else:
             raise ValueError(
                 "Unknown URI - must be a path to an IPC socket, a websocket "
@@ -36,8 +54,241 @@ class Web3(_Web3, metaclass=_Singleton):
         """Disconnects from a provider"""
         if self.provider:
             self.provider = None
+        self._close_session()
 
     def isConnected(self) -> bool:
         if not self.provider:
             return False
         return super().isConnected()
+
+    def _close_session(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def enable_rpc_profile(self) -> None:
+        """Starts recording statistics about every JSON-RPC request."""
+        if self._profiler is None:
+            self._profiler = RequestProfiler()
+        if "rpc_profile" not in self.middleware_onion:
+            # the innermost layer sees the raw request and response
+            self.middleware_onion.inject(self._profiler, name="rpc_profile", layer=0)
+
+    def disable_rpc_profile(self) -> None:
+        """Stops recording JSON-RPC statistics. Already recorded data is kept."""
+        if "rpc_profile" in self.middleware_onion:
+            self.middleware_onion.remove("rpc_profile")
+
+    def get_rpc_profile(self) -> Dict:
+        """Returns a dict of statistics for each JSON-RPC method that has been
+        called since profiling was enabled."""
+        if self._profiler is None:
+            return {}
+        return self._profiler.get_profile()
+
+    def clear_rpc_profile(self) -> None:
+        """Discards all recorded JSON-RPC statistics."""
+        if self._profiler is not None:
+            self._profiler.clear()
+
+    def _active_profiler(self) -> Optional["RequestProfiler"]:
+        if "rpc_profile" not in self.middleware_onion:
+            return None
+        return self._profiler
+
+    def _raw_request(self, method: str, params: Any) -> Dict:
+        # sends a request directly to the provider, bypassing the middlewares
+        make_request = self.provider.make_request  # type: ignore
+        profiler = self._active_profiler()
+        if profiler is not None:
+            make_request = profiler(make_request, self)
+        return make_request(method, params)
+
+    def batch(self) -> "BatchRequest":
+        """Returns a context manager that collects JSON-RPC requests and sends
+        them together as a single batch request when the context exits."""
+        return BatchRequest(self)
+
+    def _make_batch_request(self, requests: List[Tuple[str, List]]) -> List[Dict]:
+        # sends many raw requests, returning the responses in the same order.
+        # HTTP providers use one JSON-RPC batch, others send each request in turn.
+        if not requests:
+            return []
+        if isinstance(self.provider, HTTPProvider):
+            start = time.perf_counter()
+            responses = _http_batch_request(self.provider, requests)
+            if responses is not None:
+                profiler = self._active_profiler()
+                if profiler is not None:
+                    # requests in a batch share the latency of the round trip
+                    elapsed = (time.perf_counter() - start) / len(requests)
+                    for (method, params), response in zip(requests, responses):
+                        profiler.record(method, elapsed, params, response)
+                return responses
+        return [self._raw_request(*i) for i in requests]
+
+
+class BatchRequest:
+
+    """Collects raw JSON-RPC requests and sends them in a single round trip.
+
+    Requests are added with `add`, which returns the index of the request. Once
+    the context exits the results are available from `results`, in the order
+    that the requests were added. An error response raises ValueError, in the
+    same way as web3.py."""
+
+    def __init__(self, web3: Web3) -> None:
+        self._web3 = web3
+        self._requests: List[Tuple[str, List]] = []
+        self.results: List = []
+
+    def __enter__(self) -> "BatchRequest":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def add(self, method: str, params: Optional[List] = None) -> int:
+        """Adds a request to the batch.
+
+        Args:
+            method: JSON-RPC method name
+            params: List of parameters for the method
+
+        Returns:
+            Index of the request's result within `results`."""
+        self._requests.append((method, params or []))
+        return len(self._requests) - 1
+
+    def execute(self) -> List:
+        """Sends every pending request and returns a list of the results."""
+        requests, self._requests = self._requests, []
+        self.results = []
+        for response in self._web3._make_batch_request(requests):
+            if "error" in response:
+                raise ValueError(response["error"])
+            self.results.append(response["result"])
+        return self.results
+
+
+class RequestProfiler:
+
+    """Web3 middleware that records the number of calls, latency and payload
+    size of JSON-RPC requests, grouped by method.
+
+    Payload sizes are the length of the JSON encoded params and response."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._data: Dict = {}
+
+    def __call__(self, make_request: Callable, web3: Any) -> Callable:
+        def middleware(method: str, params: Any) -> Dict:
+            start = time.perf_counter()
+            response = make_request(method, params)
+            self.record(method, time.perf_counter() - start, params, response)
+            return response
+
+        return middleware
+
+    def record(self, method: str, elapsed: float, params: Any, response: Any) -> None:
+        """Records a single request."""
+        sent = len(json.dumps(params, default=str))
+        received = len(json.dumps(response, default=str))
+        with self._lock:
+            if method not in self._data:
+                self._data[method] = {"times": [], "sent": 0, "received": 0}
+            data = self._data[method]
+            data["times"].append(elapsed)
+            data["sent"] += sent
+            data["received"] += received
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def get_profile(self) -> Dict:
+        """Returns a dict of {method: stats}. Times are given in seconds and
+        payload sizes in bytes."""
+        with self._lock:
+            data = [
+                (k, list(v["times"]), v["sent"], v["received"])
+                for k, v in self._data.items()
+            ]
+        profile = {}
+        for method, times, sent, received in data:
+            times.sort()
+            count = len(times)
+            profile[method] = {
+                "count": count,
+                "total": sum(times),
+                "avg": sum(times) / count,
+                "p50": times[int(count * 0.5)],
+                "p95": times[min(int(count * 0.95), count - 1)],
+                "max": times[-1],
+                "sent": sent,
+                "received": received,
+            }
+        return profile
+
+
+def _http_batch_request(
+    provider: HTTPProvider, requests: List[Tuple[str, List]]
+) -> Optional[List[Dict]]:
+    request_ids = [next(provider.request_counter) for i in requests]
+    request_data = [
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": id_}
+        for (method, params), id_ in zip(requests, request_ids)
+    ]
+    raw_response = make_post_request(
+        provider.endpoint_uri,
+        json.dumps(request_data).encode(),
+        **provider.get_request_kwargs(),
+    )
+    response = provider.decode_rpc_response(raw_response)
+    if not isinstance(response, list):
+        # the client rejected the batch without processing any of the requests
+        return None
+    # responses to a batch may arrive in any order
+    by_id = {i.get("id"): i for i in response}
+    return [
+        by_id.get(i, {"error": {"message": "No response to batch request"}})
+        for i in request_ids
+    ]
+
+
+def _get_session(uri: str, settings: Dict) -> Session:
+    # creates a pooled session for an HTTP provider. web3.py keeps one session per
+    # endpoint, so every thread making requests to the endpoint shares the pool.
+    pool_size = settings.get("http_pool_size", 10)
+    retries = settings.get("http_retries", 0)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        # requests are not idempotent, so only failed connections are retried
+        max_retries=Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            redirect=0,
+            backoff_factor=0.1,
+        ),
+    )
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not settings.get("http_keep_alive", True):
+        session.headers["Connection"] = "close"
+    if hasattr(web3_request, "cache_session"):
+        web3_request.cache_session(uri, session)
+    else:
+        # older versions of web3.py look up sessions by the arguments to _get_session
+        key = web3_request.generate_cache_key(((uri,), {}))
+        web3_request._session_cache[key] = session
+    return session
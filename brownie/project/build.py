@@ -1,8 +1,24 @@
 #!/usr/bin/python3
 
-from typing import Dict, Optional, Any, ItemsView, Union, List, Tuple, Iterable
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    ItemsView,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+)
+from array import array
 import json
+import mmap
+import os
 from pathlib import Path
+import struct
+import sys
 
 from .sources import highlight_source
 
@@ -28,6 +44,30 @@ BUILD_KEYS = [
     "type",
 ]
 
+# build fields that are only read from a binary artifact when first accessed
+LAZY_KEYS = [
+    "ast",
+    "coverageMap",
+    "deployedSourceMap",
+    "opcodes",
+    "pcMap",
+    "source",
+    "sourceMap",
+]
+
+# incremented whenever the layout of binary artifacts changes
+ARTIFACT_VERSION = 2
+
+# the first bytes of a binary artifact and of a saved PcTable
+ARTIFACT_MAGIC = b"BRBA"
+PC_TABLE_MAGIC = b"BRPC"
+
+# magic bytes, version, length of the json key, length of the json header
+_PREFIX = struct.Struct(">4sHII")
+
+# integer columns of a PcTable, in the order they are stored
+PC_TABLE_COLUMNS = ["op", "path", "start", "stop", "fn", "jump", "statement", "branch"]
+
 
 _revert_map: Dict = {}
 
@@ -39,6 +79,11 @@ class Build:
     def __init__(self, project_path: Optional["Path"], sources: Any) -> None:
         self._sources = sources
         self._build: Dict = {}
+        # {contract name: set of contract names that inherit from or link to it}
+        self._dependents: Dict = {}
+        # {source path: sha1 of the source when it was last compiled}
+        self._source_hashes: Dict = {}
+        self._pc_tables: Dict = {}
 
         if not project_path:
             self._project_path = None
@@ -46,6 +91,8 @@ class Build:
 
         self._project_path = Path(project_path)
         for path in list(self._project_path.glob("build/contracts/*.json")):
+            if self._load_artifact(path):
+                continue
             try:
                 with path.open() as fp:
                     build_json = json.load(fp)
@@ -58,9 +105,17 @@ class Build:
                 path.unlink()
                 continue
             self._add(build_json)
+            self._save_artifact(build_json)
+
+        try:
+            with self._project_path.joinpath("build/sources.json").open() as fp:
+                self._source_hashes = json.load(fp)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
 
     def _add(self, build_json: Dict) -> None:
         contract_name = build_json["contractName"]
+        self._add_dependents(build_json)
         if "0" in build_json["pcMap"]:
             build_json["pcMap"] = dict(
                 (int(k), v) for k, v in build_json["pcMap"].items()
@@ -70,6 +125,94 @@ class Build:
         self._build[contract_name] = build_json
         self._generate_revert_map(build_json["pcMap"])
 
+    def _add_dependents(self, build_json: Dict) -> None:
+        contract_name = build_json["contractName"]
+        self._pc_tables.pop(contract_name, None)
+        if contract_name in self._build:
+            self._remove_dependents(contract_name)
+        for name in build_json["dependencies"]:
+            self._dependents.setdefault(name, set()).add(contract_name)
+
+    def _load_artifact(self, path: Path) -> bool:
+        # adds a contract using the binary artifact that was saved alongside it's
+        # build json. returns False if the artifact is missing or out of date.
+        artifact_path = self._artifact(path.stem)
+        try:
+            with artifact_path.open("rb") as fp:
+                key, length = _read_key(fp, ARTIFACT_MAGIC)
+                source_path = key["sourcePath"]
+                if key["key"] != list(self._artifact_key(path, source_path)):
+                    return False
+                header = json.loads(fp.read(length))
+                end = fp.tell()
+        except (OSError, KeyError, TypeError, ValueError, struct.error):
+            return False
+        if not self._project_path.joinpath(source_path).exists():  # type: ignore
+            return False
+
+        # field offsets in the index are relative to the end of the header
+        fields = dict((k, (v[0] + end, v[1])) for k, v in header["fields"].items())
+        reverts = dict((int(k), v) for k, v in header["reverts"].items())
+        build_json = LazyBuildJson(header["data"], artifact_path, fields, reverts)
+        self._add_dependents(build_json)
+        self._build[build_json["contractName"]] = build_json
+        # the revert map only requires the REVERT and INVALID opcodes from the pcMap
+        self._generate_revert_map(reverts)
+        return True
+
+    def _save_artifact(self, build_json: Dict) -> None:
+        # saves a contract's build data as a binary artifact. the artifact begins with
+        # an index of the lazy fields, so each can be read without loading the others.
+        try:
+            key = self._artifact_key(
+                self._absolute(build_json["contractName"]), build_json["sourcePath"]
+            )
+        except (OSError, KeyError):
+            return
+        fields = {}
+        blobs = []
+        offset = 0
+        for name in LAZY_KEYS:
+            blob = _encode(build_json[name])
+            fields[name] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+        header = {
+            "data": dict((k, v) for k, v in build_json.items() if k not in fields),
+            "fields": fields,
+            "reverts": dict(
+                (k, v)
+                for k, v in build_json["pcMap"].items()
+                if v["op"] in {"REVERT", "INVALID"} or "jump_revert" in v
+            ),
+        }
+        key_data = {"key": key, "sourcePath": build_json["sourcePath"]}
+        blobs.insert(0, _encode_header(ARTIFACT_MAGIC, key_data, header))
+
+        artifact_path = self._artifact(build_json["contractName"])
+        artifact_path.parent.mkdir(exist_ok=True)
+        temp_path = artifact_path.with_suffix(".tmp")
+        with temp_path.open("wb") as fp:
+            fp.write(b"".join(blobs))
+        os.replace(str(temp_path), str(artifact_path))
+        try:
+            PcTable.from_pc_map(build_json["pcMap"]).save(
+                self._artifact(build_json["contractName"], ".pcmap"), key
+            )
+        except OSError:
+            # the previous table may still be mapped, it is rebuilt when needed
+            pass
+
+    def _artifact_key(self, path: Path, source_path: str) -> Tuple:
+        # an artifact is valid for as long as the build json and the contract source
+        # are unchanged. the source matters because minified offsets are expanded.
+        stat = path.stat()
+        return (
+            stat.st_mtime_ns,
+            stat.st_size,
+            self._sources.get_source_hash(source_path),
+        )
+
     def _generate_revert_map(self, pcMap: Dict) -> None:
         """Adds a contract's dev revert strings to the revert map and it's pcMap.
 
@@ -130,6 +273,8 @@ class Build:
             with self._absolute(build_json["contractName"]).open("w") as fp:
                 json.dump(build_json, fp, sort_keys=True, indent=2, default=sorted)
         self._add(build_json)
+        if self._project_path:
+            self._save_artifact(build_json)
 
     def get(self, contract_name: str) -> Dict:
         """Returns build data for the given contract name."""
@@ -146,20 +291,68 @@ class Build:
         """Checks if the contract name exists in the currently loaded build data."""
         return self._stem(contract_name) in self._build
 
+    def get_pc_table(self, contract_name: str) -> "PcTable":
+        """Returns a PcTable for the given contract name. When possible the table
+        is memory-mapped from the build folder, otherwise it is created from the
+        contract's pcMap."""
+        contract_name = self._stem(contract_name)
+        if contract_name not in self._pc_tables:
+            table = None
+            if self._project_path:
+                try:
+                    key = self._artifact_key(
+                        self._absolute(contract_name),
+                        self._build[contract_name]["sourcePath"],
+                    )
+                    table = PcTable.load(self._artifact(contract_name, ".pcmap"), key)
+                except (OSError, KeyError):
+                    pass
+            if table is None:
+                table = PcTable.from_pc_map(self._build[contract_name]["pcMap"])
+            self._pc_tables[contract_name] = table
+        return self._pc_tables[contract_name]
+
     def get_dependents(self, contract_name: str) -> List:
         """Returns a list of contract names that inherit from or link to the given
         contract. Used by the compiler when determining which contracts to recompile
         based on a changed source file."""
-        return [k for k, v in self._build.items() if contract_name in v["dependencies"]]
+        return sorted(self._dependents.get(self._stem(contract_name), []))
+
+    def get_source_hash(self, path: str) -> Optional[str]:
+        """Returns the hash of a source file when it was last compiled."""
+        return self._source_hashes.get(path)
+
+    def set_source_hashes(self, hashes: Dict) -> None:
+        """Updates the stored hashes of compiled source files. The hashes are
+        saved in the project's build folder.
+
+        Args:
+            hashes: dict of {'path': "sha1 hash"}"""
+        self._source_hashes.update(hashes)
+        if self._project_path:
+            with self._project_path.joinpath("build/sources.json").open("w") as fp:
+                json.dump(self._source_hashes, fp, sort_keys=True, indent=2)
 
     def delete(self, contract_name: str) -> None:
         """Removes a contract's build data from the active project.
-        The json file in ``build/contracts`` is deleted.
+        The json file in ``build/contracts`` and the binary artifact in
+        ``build/artifacts`` are deleted.
 
         Args:
             contract_name: name of the contract to delete."""
+        self._remove_dependents(self._stem(contract_name))
         del self._build[self._stem(contract_name)]
+        self._pc_tables.pop(self._stem(contract_name), None)
         self._absolute(contract_name).unlink()
+        for suffix in (".dat", ".pcmap"):
+            try:
+                self._artifact(contract_name, suffix).unlink()
+            except (FileNotFoundError, PermissionError):
+                pass
+
+    def _remove_dependents(self, contract_name: str) -> None:
+        for name in self._build[contract_name]["dependencies"]:
+            self._dependents[name].discard(contract_name)
 
     def _absolute(self, contract_name: str) -> "Path":
         contract_name = self._stem(contract_name)
@@ -167,6 +360,12 @@ class Build:
             return Path("")
         return self._project_path.joinpath(f"build/contracts/{contract_name}.json")
 
+    def _artifact(self, contract_name: str, suffix: str = ".dat") -> "Path":
+        contract_name = self._stem(contract_name)
+        return self._project_path.joinpath(  # type: ignore
+            f"build/artifacts/{contract_name}{suffix}"
+        )
+
     def _stem(self, contract_name: str) -> str:
         return contract_name.replace(".json", "")
 
@@ -203,6 +402,238 @@ class Build:
         return offset_map[offset]
 
 
+class LazyBuildJson(dict):
+
+    """Build data for a contract that was loaded from a binary artifact.
+
+    Fields in LAZY_KEYS are read from the artifact the first time they are
+    accessed. Until then the key is present with a value of None, so membership
+    tests and key iteration behave the same as for a regular build json.
+
+    Overriding __iter__ stops dict() and unpacking from reading the placeholders
+    directly, so they load each value via __getitem__ instead."""
+
+    def __init__(self, data: Dict, path: Path, fields: Dict, reverts: Dict) -> None:
+        super().__init__(data)
+        super().update((i, None) for i in fields)
+        self._path = path
+        self._fields = fields
+        self._reverts = reverts
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return self._load(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._fields.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __eq__(self, other: Any) -> bool:
+        self._load_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __iter__(self) -> Iterator:
+        return super().__iter__()
+
+    def __copy__(self) -> "LazyBuildJson":
+        fields = dict(self._fields)
+        data = dict((k, v) for k, v in super().items() if k not in fields)
+        return LazyBuildJson(data, self._path, fields, self._reverts)
+
+    def __repr__(self) -> str:
+        self._load_all()
+        return super().__repr__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def items(self) -> ItemsView:  # type: ignore
+        self._load_all()
+        return super().items()
+
+    def values(self) -> ValuesView:  # type: ignore
+        self._load_all()
+        return super().values()
+
+    def copy(self) -> Dict:
+        self._load_all()
+        return dict(super().items())
+
+    def _load(self, key: str) -> Any:
+        try:
+            offset, length = self._fields[key]
+        except KeyError:
+            # another thread loaded the field first
+            return super().__getitem__(key)
+        with self._path.open("rb") as fp:
+            fp.seek(offset)
+            value = json.loads(fp.read(length))
+        if key == "pcMap":
+            value = dict((int(k), v) for k, v in value.items())
+            # the revert map added dev strings to these entries when the artifact
+            # was loaded, so they replace the unmodified entries from the file
+            value.update(self._reverts)
+        super().__setitem__(key, value)
+        self._fields.pop(key, None)
+        return value
+
+    def _load_all(self) -> None:
+        for key in list(self._fields):
+            self._load(key)
+
+
+class PcTable:
+
+    """Dense, array indexed version of a contract's pcMap, used to expand traces.
+
+    `index` maps each program counter to a row number, or -1 if no instruction
+    begins at that program counter. The remaining attributes (named in
+    PC_TABLE_COLUMNS) are columns of integers with one value per row. Strings
+    are stored as an index within `strings`, and missing values are given as -1.
+
+    Columns are arrays when the table is created from a pcMap, or views of a
+    memory-mapped file when it is loaded from the build folder. A mapped table
+    is shared between every process that loads it."""
+
+    def __init__(self, strings: List, index: Any, columns: List) -> None:
+        self.strings = strings
+        self.index = index
+        self.op, self.path, self.start, self.stop = columns[:4]
+        self.fn, self.jump, self.statement, self.branch = columns[4:]
+
+    def __len__(self) -> int:
+        return len(self.op)
+
+    @classmethod
+    def from_pc_map(cls, pc_map: Dict) -> "PcTable":
+        """Creates a table from a pcMap dict."""
+        strings: List = []
+        string_ids: Dict = {}
+
+        def _string_id(value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            return string_ids[value]
+
+        index = array("i", [-1]) * (max(pc_map, default=-1) + 1)
+        columns = [array("i") for i in PC_TABLE_COLUMNS]
+        for row, pc in enumerate(sorted(pc_map)):
+            data = pc_map[pc]
+            index[pc] = row
+            offset = data.get("offset") or (-1, -1)
+            values = (
+                _string_id(data["op"]),
+                _string_id(data.get("path")),
+                offset[0],
+                offset[1],
+                _string_id(data.get("fn")),
+                _string_id(data.get("jump")),
+                data.get("statement", -1),
+                data.get("branch", -1),
+            )
+            for column, value in zip(columns, values):
+                column.append(value)
+        return cls(strings, index, columns)
+
+    @classmethod
+    def load(cls, path: Path, key: Any) -> Optional["PcTable"]:
+        """Memory-maps a table that was saved with the given key. Returns None if
+        the file does not exist or was saved with a different key."""
+        try:
+            with path.open("rb") as fp:
+                mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            file_key, length = _read_key(mapped, PC_TABLE_MAGIC)
+            if file_key != list(key):
+                mapped.close()
+                return None
+            header = json.loads(mapped.read(length))
+            if header["format"] != list(_pc_table_format()):
+                mapped.close()
+                return None
+        except (KeyError, TypeError, ValueError, struct.error):
+            mapped.close()
+            return None
+
+        # the columns begin at the first aligned offset after the header
+        start = -(-mapped.tell() // 8) * 8
+        view = memoryview(mapped)[start:].cast("i")
+        size, rows = header["size"], header["rows"]
+        columns = [
+            view[size + i * rows : size + (i + 1) * rows]
+            for i in range(len(PC_TABLE_COLUMNS))
+        ]
+        return cls(header["strings"], view[:size], columns)
+
+    def save(self, path: Path, key: Any) -> None:
+        """Saves the table so it can be memory-mapped with `load`."""
+        header = {
+            "format": _pc_table_format(),
+            "strings": self.strings,
+            "size": len(self.index),
+            "rows": len(self),
+        }
+        data = _encode_header(PC_TABLE_MAGIC, key, header)
+        # the header is padded so the columns are aligned
+        data += bytes(-len(data) % 8)
+
+        path.parent.mkdir(exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with temp_path.open("wb") as fp:
+            fp.write(data)
+            fp.write(array("i", self.index).tobytes())
+            for name in PC_TABLE_COLUMNS:
+                fp.write(array("i", getattr(self, name)).tobytes())
+        os.replace(str(temp_path), str(path))
+
+    def row(self, pc: int) -> int:
+        """Returns the row number for a program counter. Raises KeyError if no
+        instruction begins at the program counter."""
+        try:
+            row = self.index[pc]
+        except IndexError:
+            raise KeyError(pc) from None
+        if row < 0:
+            raise KeyError(pc)
+        return row
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=sorted).encode()
+
+
+def _encode_header(magic: bytes, key: Any, header: Dict) -> bytes:
+    # the key is stored ahead of the header, so a stale artifact is rejected
+    # without decoding the rest of the header
+    key_data = _encode(key)
+    header_data = _encode(header)
+    prefix = _PREFIX.pack(magic, ARTIFACT_VERSION, len(key_data), len(header_data))
+    return prefix + key_data + header_data
+
+
+def _read_key(fp: Any, magic: bytes) -> Tuple:
+    # reads the prefix and key of an artifact from a file or mmap object, leaving
+    # the position at the start of the header. returns (key, header length).
+    file_magic, version, key_length, length = _PREFIX.unpack(fp.read(_PREFIX.size))
+    if file_magic != magic or version != ARTIFACT_VERSION:
+        raise ValueError("Artifact is not a supported format")
+    return json.loads(fp.read(key_length)), length
+
+
+def _pc_table_format() -> Tuple:
+    # mapped tables are stored in native byte order
+    return (sys.byteorder, array("i").itemsize)
+
+
 def get_dev_revert(pc: int) -> Optional[str]:
     """Given the program counter from a stack trace that caused a transaction
     to revert, returns the commented dev string (if any)."""
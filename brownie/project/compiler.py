@@ -3,18 +3,27 @@
 from typing import Optional, Dict, Any, List, Type, Union, Set, Tuple
 from solcast.main import SourceUnit
 
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from collections import deque
+from functools import lru_cache
 from hashlib import sha1
+import json
 import logging
+import os
+from pathlib import Path
+import posixpath
 import re
 from requests.exceptions import ConnectionError
 import solcast
 from semantic_version import NpmSpec, Version
 import solcx
+import time
 
 from . import sources
 from brownie.exceptions import CompilerError, IncompatibleSolcVersion, PragmaError
+from brownie._config import CONFIG
 
 solcx_logger = logging.getLogger("solcx")
 solcx_logger.setLevel(10)
@@ -23,6 +32,16 @@ sh.setLevel(10)
 sh.setFormatter(logging.Formatter("%(message)s"))
 solcx_logger.addHandler(sh)
 
+IMPORT_REGEX = re.compile(r"import\s+(?:[^;\"']*?from\s+)?[\"']([^\"']+)[\"']")
+PRAGMA_REGEX = re.compile(r"pragma +solidity([^;]*);")
+
+# seconds before the cached list of available solc versions is refreshed
+SOLC_VERSIONS_TTL = 86400
+
+# the cache is kept in the user's home folder, as the brownie install folder
+# is not always writable
+SOLC_VERSIONS_CACHE = Path.home().joinpath(".brownie/solc_versions.json")
+
 STANDARD_JSON = {
     "language": "Solidity",
     "sources": {},
@@ -94,24 +113,107 @@ def compile_and_format(
             contracts, install_needed=True, silent=silent
         )
 
+    workers = os.cpu_count() or 1
+    jobs = []
     for version, path_list in path_versions.items():
         set_solc_version(version)
         compiler_data = {
             "minify_source": minify,
             "version": solcx.get_solc_version_string(),
         }
+        solc_binary = str(solcx.install.get_executable())
         to_compile = dict((k, v) for k, v in contracts.items() if k in path_list)
 
-        input_json = generate_input_json(
-            to_compile, optimize, runs, evm_version, minify
-        )
-        output_json = compile_from_input_json(input_json, silent)
-        build_json.update(
-            generate_build_json(input_json, output_json, compiler_data, silent)
-        )
+        # sources that do not import one another are compiled separately
+        for shard in get_import_shards(to_compile, workers):
+            input_json = generate_input_json(
+                dict((k, to_compile[k]) for k in shard),
+                optimize,
+                runs,
+                evm_version,
+                minify,
+            )
+            jobs.append((input_json, dict(compiler_data), solc_binary))
+
+    if len(jobs) == 1 or workers == 1:
+        for job in jobs:
+            build_json.update(_compile_and_generate(*job, silent))
+        return build_json
+
+    # each job is compiled in its own process, using its own solc binary
+    with ProcessPoolExecutor(min(len(jobs), workers)) as executor:
+        futures = [executor.submit(_compile_and_generate, *i, True) for i in jobs]
+        version = None
+        for (input_json, compiler_data, _), future in zip(jobs, futures):
+            result = future.result()
+            if not silent:
+                if compiler_data["version"] != version:
+                    version = compiler_data["version"]
+                    _print_compiler_info(input_json, version)
+                    print("Generating build data...")
+                for contract_name in result:
+                    print(f" - {contract_name}...")
+            build_json.update(result)
+    if not silent:
+        print("")
     return build_json
 
 
+def _compile_and_generate(
+    input_json: Dict, compiler_data: Dict, solc_binary: str, silent: bool
+) -> Dict:
+    # compiles with a specific solc binary and returns build data. This function
+    # is called within worker processes, so it must not rely on global solc state.
+    output_json = compile_from_input_json(input_json, silent, solc_binary)
+    return generate_build_json(input_json, output_json, compiler_data, silent)
+
+
+def get_import_shards(contracts: Dict[str, str], count: int) -> List[List[str]]:
+    """Splits source files into groups that can be compiled independently.
+
+    Sources that import one another, directly or indirectly, are always placed
+    in the same group. Groups are balanced by the total length of their sources.
+
+    Args:
+        contracts: a dictionary in the form of {'path': "source code"}
+        count: maximum number of groups to create
+
+    Returns: list of lists of source paths"""
+    parents = dict((i, i) for i in contracts)
+
+    def find(path: str) -> str:
+        while parents[path] != path:
+            parents[path] = parents[parents[path]]
+            path = parents[path]
+        return path
+
+    for path, source in contracts.items():
+        for import_path in IMPORT_REGEX.findall(source):
+            if import_path.startswith("."):
+                import_path = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(path), import_path)
+                )
+            if import_path in parents:
+                parents[find(import_path)] = find(path)
+
+    components: Dict = {}
+    for path in contracts:
+        components.setdefault(find(path), []).append(path)
+
+    # assign the largest components first, each to the smallest shard
+    shards: List = [[] for i in range(min(count, len(components)) or 1)]
+    sizes = [0] * len(shards)
+    for paths in sorted(
+        components.values(), key=lambda k: -sum(len(contracts[i]) for i in k)
+    ):
+        idx = sizes.index(min(sizes))
+        shards[idx].extend(paths)
+        sizes[idx] += sum(len(contracts[i]) for i in paths)
+
+    order = dict((k, i) for i, k in enumerate(contracts))
+    return [sorted(i, key=order.__getitem__) for i in shards if i]
+
+
 def find_solc_versions(
     contracts: Dict[str, Any],
     install_needed: bool = False,
@@ -130,40 +232,34 @@ def find_solc_versions(
 
     Returns: dictionary of {'version': ['path', 'path', ..]}
     """
-    installed_versions = [Version(i[1:]) for i in solcx.get_installed_solc_versions()]
+    installed_versions = _get_versions(tuple(solcx.get_installed_solc_versions()))
     try:
-        available_versions = [
-            Version(i[1:]) for i in solcx.get_available_solc_versions()
-        ]
+        available_versions = _get_versions(tuple(get_available_solc_versions()))
     except ConnectionError:
         if not installed_versions:
             raise ConnectionError("Solc not installed and cannot connect to GitHub")
         available_versions = installed_versions
 
-    pragma_regex = re.compile(r"pragma +solidity([^;]*);")
     pragma_specs: Dict = {}
     to_install = set()
     new_versions = set()
 
     for path, source in contracts.items():
 
-        pragma_string = next(pragma_regex.finditer(source), None)
-        if pragma_string is None:
-            raise PragmaError(f"No version pragma in '{path}'")
-        pragma_specs[path] = NpmSpec(pragma_string.groups()[0])
-        version = pragma_specs[path].select(installed_versions)
+        pragma_string, pragma_specs[path] = get_pragma_spec(source, path)
+        version = _select_version(pragma_specs[path], installed_versions)
 
         if not version and not (install_needed or install_latest):
             raise IncompatibleSolcVersion(
-                f"No installed solc version matching '{pragma_string[0]}' in '{path}'"
+                f"No installed solc version matching '{pragma_string}' in '{path}'"
             )
 
         # if no installed version of solc matches the pragma, find the latest available version
-        latest = pragma_specs[path].select(available_versions)
+        latest = _select_version(pragma_specs[path], available_versions)
 
         if not version and not latest:
             raise PragmaError(
-                f"No installable solc version matching '{pragma_string[0]}' in '{path}'"
+                f"No installable solc version matching '{pragma_string}' in '{path}'"
             )
 
         if not version or (install_latest and latest > version):
@@ -174,9 +270,7 @@ def find_solc_versions(
     # install new versions if needed
     if to_install:
         install_solc(*to_install)
-        installed_versions = [
-            Version(i[1:]) for i in solcx.get_installed_solc_versions()
-        ]
+        installed_versions = _get_versions(tuple(solcx.get_installed_solc_versions()))
     elif new_versions and not silent:
         print(
             f"New compatible solc version{'s' if len(new_versions) > 1 else ''}"
@@ -186,12 +280,71 @@ def find_solc_versions(
     # organize source paths by latest available solc version
     compiler_versions: Dict = {}
     for path, spec in pragma_specs.items():
-        version = spec.select(installed_versions)
+        version = _select_version(spec, installed_versions)
         compiler_versions.setdefault(str(version), []).append(path)
 
     return compiler_versions
 
 
+def get_available_solc_versions() -> List:
+    """Returns a list of solc versions that are available to install.
+
+    The list is saved at SOLC_VERSIONS_CACHE and is only requested from GitHub
+    again once it is older than SOLC_VERSIONS_TTL. If the request fails, an
+    expired list is used when one exists."""
+    path = SOLC_VERSIONS_CACHE
+    cached = None
+    try:
+        with path.open() as fp:
+            cached = json.load(fp)
+        if time.time() - cached["timestamp"] < SOLC_VERSIONS_TTL:
+            return cached["versions"]
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+
+    try:
+        versions = solcx.get_available_solc_versions()
+    except ConnectionError:
+        if cached is None:
+            raise
+        return cached["versions"]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with temp_path.open("w") as fp:
+            json.dump({"timestamp": time.time(), "versions": versions}, fp)
+        os.replace(str(temp_path), str(path))
+    except OSError as e:
+        print(f"WARNING: Unable to save the list of solc versions to '{path}': {e}")
+    return versions
+
+
+@lru_cache(maxsize=1024)
+def get_pragma_spec(source: str, path: Optional[str] = None) -> Tuple:
+    """Returns the first solidity version pragma in a source string.
+
+    Args:
+        source: solidity source code
+        path: path to the source, used in the exception if no pragma is found
+
+    Returns: (pragma string, NpmSpec object)"""
+    pragma_string = next(PRAGMA_REGEX.finditer(source), None)
+    if pragma_string is None:
+        raise PragmaError(f"No version pragma in '{path}'")
+    return pragma_string[0], NpmSpec(pragma_string.groups()[0])
+
+
+@lru_cache(maxsize=None)
+def _get_versions(versions: Tuple) -> Tuple:
+    # converts a tuple of version strings as returned by solcx to Version objects
+    return tuple(Version(i[1:]) for i in versions)
+
+
+@lru_cache(maxsize=1024)
+def _select_version(spec: NpmSpec, versions: Tuple) -> Optional[Version]:
+    return spec.select(versions)
+
+
 def generate_input_json(
     contracts: Dict,
     optimize: bool = True,
@@ -227,29 +380,22 @@ def generate_input_json(
     return input_json
 
 
-def compile_from_input_json(input_json: Dict, silent: bool = True) -> Dict:
+def compile_from_input_json(
+    input_json: Dict, silent: bool = True, solc_binary: Optional[str] = None
+) -> Dict:
     """Compiles contracts from a standard input json.
 
     Args:
         input_json: solc input json
         silent: verbose reporting
+        solc_binary: path to the solc binary (use None for the active version)
 
     Returns: standard compiler output json"""
     optimizer = input_json["settings"]["optimizer"]
     input_json["settings"].setdefault("evmVersion", None)
     if not silent:
-        print("Compiling contracts...")
-        print(f"  Solc {solcx.get_solc_version_string()}")
-        print(
-            "  Optimizer: "
-            + (
-                f"Enabled  Runs: {optimizer['runs']}"
-                if optimizer["enabled"]
-                else "Disabled"
-            )
-        )
-        if input_json["settings"]["evmVersion"]:
-            print(f"  EVM Version: {input_json['settings']['evmVersion'].capitalize()}")
+        version = solcx.get_solc_version_string(solc_binary=solc_binary)
+        _print_compiler_info(input_json, version)
     try:
         return solcx.compile_standard(
             input_json,
@@ -257,11 +403,28 @@ def compile_from_input_json(input_json: Dict, silent: bool = True) -> Dict:
             optimize_runs=optimizer["runs"],
             evm_version=input_json["settings"]["evmVersion"],
             allow_paths=".",
+            solc_binary=solc_binary,
         )
     except solcx.exceptions.SolcError as e:
         raise CompilerError(e)
 
 
+def _print_compiler_info(input_json: Dict, version: str) -> None:
+    optimizer = input_json["settings"]["optimizer"]
+    print("Compiling contracts...")
+    print(f"  Solc {version}")
+    print(
+        "  Optimizer: "
+        + (
+            f"Enabled  Runs: {optimizer['runs']}"
+            if optimizer["enabled"]
+            else "Disabled"
+        )
+    )
+    if input_json["settings"]["evmVersion"]:
+        print(f"  EVM Version: {input_json['settings']['evmVersion'].capitalize()}")
+
+
 def generate_build_json(
     input_json: Dict,
     output_json: Dict,
@@ -421,11 +584,15 @@ def generate_coverage_data(
     source_nodes = dict((i.contract_id, i.parent()) for i in contract_nodes)
     paths = set(v.path for v in source_nodes.values())
 
-    stmt_nodes = dict((i, stmt_nodes[i].copy()) for i in paths)
+    # sorted indexes of statement and function offsets for each source
+    stmt_index = dict((i, _OffsetIndex(stmt_nodes[i])) for i in paths)
+    fn_index = dict((i.path, _get_function_index(i)) for i in source_nodes.values())
     statement_map: Dict = dict((i, {}) for i in paths)
 
     # possible branch offsets
-    branch_original = dict((i, branch_nodes[i].copy()) for i in paths)
+    branch_original = dict(
+        (i, dict((x.offset, x) for x in branch_nodes[i])) for i in paths
+    )
     branch_nodes = dict((i, set(i.offset for i in branch_nodes[i])) for i in paths)
     # currently active branches, awaiting a jumpi
     branch_active: Dict = dict((i, {}) for i in paths)
@@ -493,23 +660,14 @@ def generate_coverage_data(
             if "offset" in pc_list[-2] and offset == pc_list[-2]["offset"]:
                 pc_list[-1]["fn"] = pc_list[-2]["fn"]
             else:
-                pc_list[-1]["fn"] = (
-                    source_nodes[source[2]]
-                    .children(
-                        depth=2,
-                        inner_offset=offset,
-                        filters={"node_type": "FunctionDefinition"},
-                    )[0]
-                    .full_name
-                )
-                statement = next(
-                    i for i in stmt_nodes[path] if sources.is_inside_offset(offset, i)
-                )
-                stmt_nodes[path].discard(statement)
-                statement_map[path].setdefault(pc_list[-1]["fn"], {})[count] = statement
-                pc_list[-1]["statement"] = count
-                count += 1
-        except (KeyError, IndexError, StopIteration):
+                pc_list[-1]["fn"] = fn_index[path].get(offset)
+                idx = stmt_index[path].find(offset)
+                if idx is not None:
+                    fn_map = statement_map[path].setdefault(pc_list[-1]["fn"], {})
+                    fn_map[count] = stmt_index[path].pop(idx)
+                    pc_list[-1]["statement"] = count
+                    count += 1
+        except (KeyError, IndexError):
             pass
         if "value" not in pc_list[-1]:
             continue
@@ -520,6 +678,7 @@ def generate_coverage_data(
             )
 
     # compare revert() statements against the map of revert jumps to find
+    pc_offsets = set(i["offset"] for i in pc_list if "offset" in i)
     for (path, fn_name), values in revert_map.items():
         fn_node = next(i for i in source_nodes.values() if i.path == path).children(
             depth=2,
@@ -533,10 +692,9 @@ def generate_coverage_data(
         for node in (i for i in revert_nodes if not i.arguments):
             offset = node.offset
             # if the node offset is not in the source map, apply it's offset to the JUMPI op
-            if not next(
-                (x for x in pc_list if "offset" in x and x["offset"] == offset), False
-            ):
+            if offset not in pc_offsets:
                 pc_list[values[0]].update({"offset": offset, "jump_revert": True})
+                pc_offsets.add(offset)
                 del values[0]
 
     # set branch index markers and build final branch map
@@ -551,16 +709,8 @@ def generate_coverage_data(
         if "fn" in pc_list[idx[0]]:
             fn = pc_list[idx[0]]["fn"]
         else:
-            fn = (
-                source_nodes[path]
-                .children(
-                    depth=2,
-                    inner_offset=offset,
-                    filters={"node_type": "FunctionDefinition"},
-                )[0]
-                .full_name
-            )
-        node = next(i for i in branch_original[path] if i.offset == offset)
+            fn = fn_index[path].get(offset)
+        node = branch_original[path][offset]
         branch_map[path].setdefault(fn, {})[count] = offset + (node.jump,)
         count += 1
 
@@ -568,6 +718,74 @@ def generate_coverage_data(
     return pc_map, statement_map, branch_map
 
 
+class _OffsetIndex:
+
+    """Sorted index of source offsets, used to find an offset that contains
+    another offset with a binary search instead of checking every offset.
+
+    When more than one offset contains the target, the one that starts first
+    is returned. The stop of each offset is held in the leaves of a binary max
+    tree, so the first containing offset is found in O(log n) even when offsets
+    are nested, and removed offsets are cleared from the tree."""
+
+    def __init__(self, offsets: Any, values: Optional[List] = None) -> None:
+        if values is None:
+            values = list(offsets)
+        items = sorted(zip(offsets, values), key=lambda k: k[0])
+        self._offsets = [i[0] for i in items]
+        self._values = [i[1] for i in items]
+        self._starts = [i[0] for i in self._offsets]
+        size = 1
+        while size < len(self._offsets):
+            size *= 2
+        self._size = size
+        self._max_stop = [-1] * size + [i[1] for i in self._offsets]
+        self._max_stop += [-1] * (2 * size - len(self._max_stop))
+        for node in range(size - 1, 0, -1):
+            self._max_stop[node] = max(
+                self._max_stop[2 * node], self._max_stop[2 * node + 1]
+            )
+
+    def find(self, offset: Tuple) -> Optional[int]:
+        """Returns the index of an offset that contains the given offset."""
+        max_stop = self._max_stop
+        if max_stop[1] < offset[1]:
+            return None
+        # descend to the first offset that stops at or after the target
+        node = 1
+        while node < self._size:
+            node *= 2
+            if max_stop[node] < offset[1]:
+                node += 1
+        idx = node - self._size
+        if idx >= len(self._starts) or self._starts[idx] > offset[0]:
+            return None
+        return idx
+
+    def get(self, offset: Tuple) -> Any:
+        """Returns the value of an offset that contains the given offset."""
+        idx = self.find(offset)
+        if idx is None:
+            raise KeyError(offset)
+        return self._values[idx]
+
+    def pop(self, idx: int) -> Any:
+        """Removes an offset from future results and returns it's value."""
+        node = idx + self._size
+        self._max_stop[node] = -1
+        while node > 1:
+            node //= 2
+            self._max_stop[node] = max(
+                self._max_stop[2 * node], self._max_stop[2 * node + 1]
+            )
+        return self._values[idx]
+
+
+def _get_function_index(source_node: Any) -> _OffsetIndex:
+    nodes = source_node.children(depth=2, filters={"node_type": "FunctionDefinition"})
+    return _OffsetIndex([i.offset for i in nodes], [i.full_name for i in nodes])
+
+
 def expand_source_map(source_map_str: str) -> List:
     """Expands the compressed sourceMap supplied by solc into a list of lists."""
     source_map: List = [
@@ -1,21 +1,33 @@
 #!/usr/bin/python3
 
-from typing import Union, Dict, Iterable, KeysView, Any, Optional, List, Set
+from typing import (
+    TYPE_CHECKING,
+    Union,
+    Dict,
+    Iterable,
+    KeysView,
+    Any,
+    Optional,
+    List,
+    Set,
+)
+from collections import deque
 from io import BytesIO
 from pathlib import Path
-import requests
 import shutil
 import sys
 import zipfile
 
 from brownie.cli.utils import color
-from brownie.network.contract import ContractContainer
+from brownie.network import trace
 from brownie.exceptions import ProjectAlreadyLoaded, ProjectNotFound
-from brownie.project import compiler
 from brownie.project.sources import Sources, get_hash
 from brownie.project.build import Build
 from brownie._config import CONFIG, load_project_config, load_project_compiler_config
 
+if TYPE_CHECKING:
+    from brownie.network.contract import ContractContainer  # NOQA: F401
+
 FOLDERS = ["contracts", "scripts", "reports", "tests", "build", "build/contracts"]
 MIXES_URL = "https://github.com/brownie-mix/{}-mix/archive/master.zip"
 
@@ -30,6 +42,10 @@ class _ProjectBase:
         self._build = Build(project_path, self._sources)
 
     def _compile(self, sources: Dict, compiler_config: Dict, silent: bool) -> None:
+        # the compiler, network and requests modules are imported when first needed,
+        # so that loading brownie does not require solcx or web3
+        from brownie.project import compiler
+
         build_json = compiler.compile_and_format(
             sources,
             solc_version=compiler_config["version"],
@@ -43,6 +59,8 @@ class _ProjectBase:
             self._build.add(data)
 
     def _create_containers(self) -> None:
+        from brownie.network.contract import ContractContainer
+
         # create container objects
         self._containers: Dict = {}
         for key, data in self._build.items():
@@ -51,7 +69,7 @@ class _ProjectBase:
                 self._containers[key] = container
                 setattr(self, container._name, container)
 
-    def __getitem__(self, key: str) -> ContractContainer:
+    def __getitem__(self, key: str) -> "ContractContainer":
         return self._containers[key]
 
     def __iter__(self) -> Iterable:
@@ -60,7 +78,7 @@ class _ProjectBase:
     def __len__(self) -> int:
         return len(self._containers)
 
-    def __contains__(self, item: ContractContainer) -> bool:
+    def __contains__(self, item: "ContractContainer") -> bool:
         return item in self._containers
 
     def dict(self) -> Dict:
@@ -95,14 +113,16 @@ class Project(_ProjectBase):
             raise ProjectAlreadyLoaded("Project is already active")
 
         self._compiler_config = load_project_compiler_config(self._project_path, "solc")
-        solc_version = self._compiler_config["version"]
-        if solc_version:
-            self._compiler_config["version"] = compiler.set_solc_version(solc_version)
 
         # compile updated sources, update build
         changed = self._get_changed_contracts()
-        self._compiler_config["version"] = solc_version
         self._compile(changed, self._compiler_config, False)
+        self._build.set_source_hashes(
+            dict(
+                (i, self._sources.get_source_hash(i))
+                for i in self._sources.get_path_list()
+            )
+        )
         self._create_containers()
 
         # add project to namespaces, apply import blackmagic
@@ -118,14 +138,20 @@ class Project(_ProjectBase):
         ]
         self._active = True
         _loaded_projects.append(self)
+        trace.set_cache_path(Path(self._project_path).joinpath("build/traces"))
 
     def _get_changed_contracts(self) -> Dict:
         changed = [
             i for i in self._sources.get_contract_list() if self._compare_build_json(i)
         ]
+        # walk the dependency graph once to find everything affected by the changes
         final = set(changed)
-        for contract_name in changed:
-            final.update(self._build.get_dependents(contract_name))
+        queue = deque(changed)
+        while queue:
+            for name in self._build.get_dependents(queue.popleft()):
+                if name not in final:
+                    final.add(name)
+                    queue.append(name)
         for name in [i for i in final if self._build.contains(i)]:
             self._build.delete(name)
         changed_set: Set = set(self._sources.get_source_path(i) for i in final)
@@ -138,18 +164,30 @@ class Project(_ProjectBase):
             build_json = self._build.get(contract_name)
         except KeyError:
             return True
-        if build_json["sha1"] != get_hash(
-            source, contract_name, config["minify_source"]
-        ):
+        compiler = build_json["compiler"]
+        # falsy settings such as optimize=False still change the output, so each
+        # one is compared. an unset version or evm_version is resolved when
+        # compiling, and runs only applies when the optimizer is enabled
+        if config["version"] and _version_number(
+            compiler["version"]
+        ) != _version_number(config["version"]):
+            # compare version numbers only, so that solc is not queried
             return True
-        return next(
-            (
-                True
-                for k, v in build_json["compiler"].items()
-                if config[k] and v != config[k]
-            ),
-            False,
-        )
+        if config["evm_version"] and compiler["evm_version"] != config["evm_version"]:
+            return True
+        for key in ("minify_source", "optimize"):
+            if compiler[key] != config[key]:
+                return True
+        if config["optimize"] and compiler["runs"] != config["runs"]:
+            return True
+        # minify_source has been checked, so the sha1 of the contract can only
+        # change if the contents of the source file changed
+        path = self._sources.get_source_path(contract_name)
+        if self._sources.get_source_hash(path) != self._build.get_source_hash(path):
+            hash_ = get_hash(source, contract_name, config["minify_source"])
+            if build_json["sha1"] != hash_:
+                return True
+        return False
 
     def _update_and_register(self, dict_: Any) -> None:
         dict_.update(self)
@@ -185,6 +223,11 @@ class Project(_ProjectBase):
         sys.modules["brownie.project"].__console_dir__.remove(name)  # type: ignore
         self._active = False
         _loaded_projects.remove(self)
+        if _loaded_projects:
+            project_path = Path(_loaded_projects[-1]._project_path)
+            trace.set_cache_path(project_path.joinpath("build/traces"))
+        else:
+            trace.set_cache_path(None)
 
         # clear paths
         try:
@@ -265,6 +308,8 @@ def pull(
     if project_path.exists() and list(project_path.glob("*")):
         raise FileExistsError(f"Folder already exists - {project_path}")
 
+    import requests
+
     print(f"Downloading from {url}...")
     request = requests.get(url)
     with zipfile.ZipFile(BytesIO(request.content)) as zf:
@@ -362,3 +407,8 @@ def _add_to_sys_path(project_path: Path) -> None:
     if project_path_string in sys.path:
         return
     sys.path.insert(0, project_path_string)
+
+
+def _version_number(version: str) -> str:
+    # "Version: 0.5.7+commit.6da8b019.Linux.g++" -> "0.5.7"
+    return version.replace("Version:", "").strip().lstrip("v").split("+")[0]
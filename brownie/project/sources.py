@@ -25,6 +25,7 @@ class Sources:
 
     def __init__(self, project_path: Union["Path", str, None]) -> None:
         self._source: Dict = {}
+        self._hashes: Dict = {}
         self._contracts: Dict = {}
         if not project_path:
             return
@@ -50,6 +51,7 @@ class Sources:
                 )
             values["path"] = path
         self._source[path] = source
+        self._hashes[path] = sha1(source.encode()).hexdigest()
         self._contracts.update(data)
 
     def get(self, name: str) -> str:
@@ -63,6 +65,10 @@ class Sources:
             return self._source[self._contracts[name]["path"]]
         return self._source[str(name)]
 
+    def get_source_hash(self, path: str) -> str:
+        """Returns a sha1 hash of the entire contents of a source file."""
+        return self._hashes[str(path)]
+
     def get_path_list(self) -> List:
         """Returns a list of source code file paths for the active project."""
         return list(self._source.keys())
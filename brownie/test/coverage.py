@@ -1,6 +1,8 @@
 #!/usr/bin/python3
 
-from copy import deepcopy
+# Coverage data for a transaction is stored as {"ContractName": {"path": [a, b, c]}},
+# where each value is an integer bitset. Bit i of `a` is set if statement i was
+# executed. Bit i of `b` and `c` are set if branch i evaluated False and True.
 
 
 _coverage_eval = {}
@@ -49,23 +51,18 @@ def get_merged_coverage_eval():
 
     Returns: coverage eval dict.
     """
-    if not _coverage_eval:
-        return {}
-    coverage_eval_list = list(_coverage_eval.values())
-    merged_eval = deepcopy(coverage_eval_list.pop())
-    for coverage_eval in coverage_eval_list:
-        for name in coverage_eval:
-            if name not in merged_eval:
-                merged_eval[name] = coverage_eval[name]
-                continue
-            for path, map_ in coverage_eval[name].items():
-                if path not in merged_eval[name]:
-                    merged_eval[name][path] = map_
+    merged_eval = {}
+    for coverage_eval in _coverage_eval.values():
+        for name, paths in coverage_eval.items():
+            merged = merged_eval.setdefault(name, {})
+            for path, map_ in paths.items():
+                if path not in merged:
+                    merged[path] = list(map_)
                     continue
-                for i in range(3):
-                    merged_eval[name][path][i] = set(merged_eval[name][path][i]).union(
-                        map_[i]
-                    )
+                value = merged[path]
+                value[0] |= map_[0]
+                value[1] |= map_[1]
+                value[2] |= map_[2]
     return merged_eval
 
 
@@ -74,3 +71,40 @@ def clear():
     _coverage_eval.clear()
     _cached.clear()
     _active_txhash.clear()
+
+
+def to_bitset(indexes):
+    """Converts an iterable of coverage indexes to a bitset."""
+    bitset = 0
+    for i in indexes:
+        bitset |= 1 << int(i)
+    return bitset
+
+
+def from_bitset(bitset):
+    """Returns a sorted list of the coverage indexes that are set in a bitset."""
+    return [i for i, x in enumerate(reversed(bin(bitset)[2:])) if x == "1"]
+
+
+def dumps_coverage_eval(coverage_eval):
+    """Returns a copy of a coverage eval dict that can be serialized as JSON.
+    Bitsets are given as hex strings."""
+    return dict(
+        (name, dict((path, [f"{i:x}" for i in map_]) for path, map_ in paths.items()))
+        for name, paths in coverage_eval.items()
+    )
+
+
+def loads_coverage_eval(coverage_eval):
+    """Converts a coverage eval dict created by dumps_coverage_eval back to bitsets.
+    Data saved as lists of indexes by earlier versions is also converted."""
+    return dict(
+        (name, dict((path, [_load(i) for i in map_]) for path, map_ in paths.items()))
+        for name, paths in coverage_eval.items()
+    )
+
+
+def _load(value):
+    if isinstance(value, str):
+        return int(value, 16)
+    return to_bitset(value)
@@ -4,7 +4,7 @@ from hashlib import sha1
 import json
 from pathlib import Path
 
-from brownie.network.state import get_current_dependencies
+from brownie.network.state import TxHistory, get_current_dependencies
 from brownie.project.scripts import get_ast_hash
 from brownie.test import coverage
 from brownie._config import ARGV
@@ -30,6 +30,7 @@ class TestManager:
         self.count = 0
         self.results = None
         self.isolated = set()
+        self.completed = set()
         glob = self.project_path.glob("tests/**/conftest.py")
         self.conf_hashes = dict((self._path(i.parent), get_ast_hash(i)) for i in glob)
         try:
@@ -52,6 +53,9 @@ class TestManager:
             for k, v in hashes["contracts"].items()
             if k not in self.contracts or v != self.contracts[k]
         )
+        hashes["tx"] = dict(
+            (k, coverage.loads_coverage_eval(v)) for k, v in hashes["tx"].items()
+        )
         if changed_contracts:
             for txhash, coverage_eval in hashes["tx"].items():
                 if not changed_contracts.intersection(coverage_eval.keys()):
@@ -107,16 +111,60 @@ class TestManager:
             "txhash": txhash,
             "results": "".join(self.results),
         }
+        self.completed.add(path)
 
     def save_json(self):
         txhash = set(x for v in self.tests.values() for x in v["txhash"])
         coverage_eval = dict(
-            (k, v) for k, v in coverage.get_coverage_eval().items() if k in txhash
+            (k, coverage.dumps_coverage_eval(v))
+            for k, v in coverage.get_coverage_eval().items()
+            if k in txhash
         )
         report = {"tests": self.tests, "contracts": self.contracts, "tx": coverage_eval}
         with self.project_path.joinpath("build/tests.json").open("w") as fp:
             json.dump(report, fp, indent=2, sort_keys=True, default=sorted)
 
+    def get_worker_output(self):
+        """Returns the results of modules completed by an xdist worker as a JSON
+        string, to be merged by the controller using merge_worker_output."""
+        tests = dict((k, self.tests[k]) for k in self.completed)
+        txhash = set(x for v in tests.values() for x in v["txhash"])
+        coverage_eval = dict(
+            (k, coverage.dumps_coverage_eval(v))
+            for k, v in coverage.get_coverage_eval().items()
+            if k in txhash
+        )
+        output = {"tests": tests, "tx": coverage_eval, "gas": TxHistory().gas_profile}
+        return json.dumps(output, default=sorted)
+
+    def merge_worker_output(self, output):
+        """Merges test results, coverage data and the gas profile returned by
+        an xdist worker."""
+        output = json.loads(output)
+        self.tests.update(output["tests"])
+        self.completed.update(output["tests"])
+        for txhash, coverage_eval in output["tx"].items():
+            coverage.add_cached_transaction(
+                txhash, coverage.loads_coverage_eval(coverage_eval)
+            )
+            coverage.check_cached(txhash, False)
+        gas_profile = TxHistory().gas_profile
+        for fn_name, gas in output["gas"].items():
+            if fn_name not in gas_profile:
+                gas_profile[fn_name] = gas
+                continue
+            total = gas_profile[fn_name]
+            count = total["count"] + gas["count"]
+            total.update(
+                {
+                    "avg": (total["avg"] * total["count"] + gas["avg"] * gas["count"])
+                    // count,
+                    "high": max(total["high"], gas["high"]),
+                    "low": min(total["low"], gas["low"]),
+                    "count": count,
+                }
+            )
+
     def set_active(self, path):
         path = self._path(path)
         if path == self.active_path:
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from brownie.cli.utils import color
 from brownie.network.state import TxHistory
+from brownie.network.web3 import Web3
 
 COVERAGE_COLORS = [(0.8, "bright red"), (0.9, "bright yellow"), (1, "bright green")]
 
@@ -43,6 +44,20 @@ def print_gas_profile():
         )
 
 
+def print_rpc_profile():
+    """Formats and prints a JSON-RPC request profile to the console."""
+    print("\n\nRPC Profile:")
+    profile = Web3().get_rpc_profile()
+    for i in sorted(profile, key=lambda k: profile[k]["total"], reverse=True):
+        data = profile[i]
+        print(
+            f"{i} -  calls: {data['count']}  total: {data['total']:.3f}s  "
+            f"avg: {data['avg']*1000:.2f}ms  p50: {data['p50']*1000:.2f}ms  "
+            f"p95: {data['p95']*1000:.2f}ms  max: {data['max']*1000:.2f}ms  "
+            f"sent: {data['sent']/1024:.1f}kB  received: {data['received']/1024:.1f}kB"
+        )
+
+
 def print_coverage_totals(project, coverage_eval):
     """Formats and prints a coverage evaluation report to the console.
 
@@ -128,7 +143,7 @@ def _split_by_fn(build, coverage_eval):
     function. Once done, the dict is no longer compatible with other methods in this module.
 
     Original format:
-        {"path/to/file": [index, ..], .. }
+        {"path/to/file": [statement bitset, false bitset, true bitset], .. }
 
     New format:
         {"path/to/file": { "ContractName.functionName": [index, .. ], .. }
@@ -148,13 +163,17 @@ def _split_by_fn(build, coverage_eval):
 def _split(coverage_eval, coverage_map, key):
     results = {}
     for fn, map_ in coverage_map["statements"][key].items():
-        results[fn] = [[i for i in map_ if int(i) in coverage_eval[0]], [], []]
+        results[fn] = [[i for i in map_ if _is_set(coverage_eval[0], i)], [], []]
     for fn, map_ in coverage_map["branches"][key].items():
-        results[fn][1] = [i for i in map_ if int(i) in coverage_eval[1]]
-        results[fn][2] = [i for i in map_ if int(i) in coverage_eval[2]]
+        results[fn][1] = [i for i in map_ if _is_set(coverage_eval[1], i)]
+        results[fn][2] = [i for i in map_ if _is_set(coverage_eval[2], i)]
     return results
 
 
+def _is_set(bitset, index):
+    return bool(bitset >> int(index) & 1)
+
+
 def _statement_totals(coverage_eval, coverage_map):
     result = {}
     count, total = 0, 0
@@ -219,7 +238,7 @@ def _statement_highlights(coverage_eval, coverage_map):
 
 
 def _statement_color(i, coverage_eval, path):
-    if path not in coverage_eval or int(i) not in coverage_eval[path][0]:
+    if path not in coverage_eval or not _is_set(coverage_eval[path][0], i):
         return "red"
     return "green"
 
@@ -240,10 +259,10 @@ def _branch_highlights(coverage_eval, coverage_map):
 def _branch_color(i, coverage_eval, path, jump):
     if path not in coverage_eval:
         return "red"
-    if i in coverage_eval[path][2]:
-        if i in coverage_eval[path][1]:
+    if _is_set(coverage_eval[path][2], i):
+        if _is_set(coverage_eval[path][1], i):
             return "green"
         return "yellow" if jump else "orange"
-    if i in coverage_eval[path][1]:
+    if _is_set(coverage_eval[path][1], i):
         return "orange" if jump else "yellow"
     return "red"
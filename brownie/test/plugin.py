@@ -37,6 +37,19 @@ def _generate_fixture(container):
     return pytest.fixture(scope="session")(_fixture)
 
 
+def _is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+def _is_xdist_controller(config):
+    return not _is_xdist_worker(config) and config.getoption("dist", "no") != "no"
+
+
+def _set_worker_id(config):
+    # the worker's RPC port is derived from this id when the network is connected
+    ARGV["xdist_worker"] = int(config.workerinput["workerid"].lstrip("gw"))
+
+
 if brownie.project.check_for_project("."):
 
     # load project and generate dynamic fixtures
@@ -62,6 +75,11 @@ if brownie.project.check_for_project("."):
             action="store_true",
             help="Display gas profile for function calls",
         )
+        parser.addoption(
+            "--rpc-profile",
+            action="store_true",
+            help="Display a profile of JSON-RPC requests",
+        )
         parser.addoption(
             "--update",
             "-U",
@@ -86,6 +104,7 @@ if brownie.project.check_for_project("."):
         for key in ("coverage", "always_transact"):
             ARGV[key] = config.getoption("--coverage")
         ARGV["gas"] = config.getoption("--gas")
+        ARGV["rpc-profile"] = config.getoption("--rpc-profile")
         ARGV["revert"] = (
             config.getoption("--revert-tb") or CONFIG["pytest"]["revert_traceback"]
         )
@@ -93,6 +112,11 @@ if brownie.project.check_for_project("."):
         ARGV["network"] = None
         if config.getoption("--network"):
             ARGV["network"] = config.getoption("--network")[0]
+        if _is_xdist_worker(config):
+            _set_worker_id(config)
+        elif config.getoption("dist", "no") == "load":
+            # results are recorded per module, so modules must not be split
+            config.option.dist = "loadscope"
 
     # plugin hooks
 
@@ -141,7 +165,12 @@ if brownie.project.check_for_project("."):
             for path in isolated_tests:
                 tests[path][0].parent.add_marker("skip")
 
-    def pytest_runtestloop():
+    def pytest_runtestloop(session):
+        if _is_xdist_controller(session.config):
+            # tests are run by the workers, each connecting to its own RPC
+            return
+        if ARGV["rpc-profile"]:
+            brownie.web3.enable_rpc_profile()
         if not ARGV["norpc"]:
             brownie.network.connect(ARGV["network"])
 
@@ -158,7 +187,17 @@ if brownie.project.check_for_project("."):
         if not nextitem or item.parent.fspath != nextitem.parent.fspath:
             manager.module_completed(item.parent.fspath)
 
-    def pytest_sessionfinish():
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(node, error):
+        # merge the results of a completed xdist worker
+        if "brownie" in getattr(node, "workeroutput", {}):
+            manager.merge_worker_output(node.workeroutput["brownie"])
+
+    def pytest_sessionfinish(session):
+        if _is_xdist_worker(session.config):
+            session.config.workeroutput["brownie"] = manager.get_worker_output()
+            project.close(False)
+            return
         manager.save_json()
         if ARGV["coverage"]:
             coverage_eval = brownie.test.coverage.get_merged_coverage_eval()
@@ -168,6 +207,8 @@ if brownie.project.check_for_project("."):
             )
         if ARGV["gas"]:
             output.print_gas_profile()
+        if ARGV["rpc-profile"] and not _is_xdist_controller(session.config):
+            output.print_rpc_profile()
         project.close(False)
 
     def pytest_keyboard_interrupt():
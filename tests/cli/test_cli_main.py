@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import pytest
+import subprocess
 import sys
 
 from brownie.cli.__main__ import main as cli_main
@@ -104,3 +105,20 @@ def test_cli_run(cli_tester, project):
 def test_cli_incorrect(cli_tester):
     with pytest.raises(SystemExit):
         cli_tester.run("foo")
+
+
+def test_cli_profile_startup(cli_tester, capfd):
+    cli_tester.set_target("brownie.project.new")
+    cli_tester.run("init --profile-startup", args=(".", False))
+    assert "Startup Profile" in capfd.readouterr()[0]
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, brownie, brownie.project; "
+        "assert 'web3' not in sys.modules; "
+        "assert 'solcx' not in sys.modules; "
+        "brownie.accounts; "
+        "assert 'web3' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
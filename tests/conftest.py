@@ -5,6 +5,7 @@ import json
 import os
 from pathlib import Path
 import shutil
+import tempfile
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
@@ -29,6 +30,12 @@ def pytest_sessionstart():
             "v0.4.22",
         ],
     )
+    # the list is always requested, so that a cached list is never used by the tests
+    monkeypatch_session.setattr("brownie.project.compiler.SOLC_VERSIONS_TTL", 0)
+    monkeypatch_session.setattr(
+        "brownie.project.compiler.SOLC_VERSIONS_CACHE",
+        Path(tempfile.mkdtemp()).joinpath("solc_versions.json"),
+    )
 
 
 # auto-parametrize the evmtester fixture
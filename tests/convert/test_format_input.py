@@ -2,7 +2,7 @@
 
 import pytest
 
-from brownie.convert import format_input
+from brownie.convert import format_input, get_input_formatter
 
 abi = {
     "inputs": [
@@ -44,3 +44,14 @@ def test_wrong_length_nested_array():
 def test_non_sequence():
     with pytest.raises(TypeError):
         format_input(abi, ["123", (1,), ([1, 1], [2, 2]), "0xff"])
+
+
+def test_input_formatter():
+    formatter = get_input_formatter(abi)
+    inputs = [(1, 2, 3), (1,), ([1, 1], [2, 2]), "0xff"]
+    assert formatter(inputs) == format_input(abi, inputs)
+    assert formatter([(4, 5, 6), (), (), "0x00"]) == format_input(
+        abi, [(4, 5, 6), (), (), "0x00"]
+    )
+    with pytest.raises(ValueError, match="testFunction argument #0"):
+        formatter([(1, 2), (1,), ([1, 1], [2, 2]), "0xff"])
@@ -13,6 +13,18 @@ def test_returns_contract_on_success(BrownieTester, accounts):
     assert type(c) == ProjectContract
 
 
+def test_returns_contract_with_revert_check(BrownieTester, accounts, config):
+    """returns a Contract instance when the revert check runs before broadcasting"""
+    config["active_network"]["reverting_tx_gas_limit"] = False
+    c = accounts[0].deploy(BrownieTester, True)
+    assert type(c) == ProjectContract
+    assert c.tx.status == 1
+    nonce = accounts[0].nonce
+    with pytest.raises(VirtualMachineError):
+        accounts[0].deploy(BrownieTester, False)
+    assert accounts[0].nonce == nonce
+
+
 def test_raises_on_revert(BrownieTester, accounts):
     """raises on revert if not in console"""
     with pytest.raises(VirtualMachineError):
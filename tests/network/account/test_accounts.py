@@ -82,3 +82,41 @@ def test_delete(accounts):
     del accounts[-1]
     assert len(accounts) == 9
     assert a not in accounts
+
+
+def test_send_many(accounts):
+    nonce = accounts[0].nonce
+    tx_list = accounts.send_many(
+        [{"from": accounts[0], "to": accounts[1], "value": 100}] * 3
+    )
+    assert len(tx_list) == 3
+    assert [i.status for i in tx_list] == [1, 1, 1]
+    assert [i.nonce for i in tx_list] == [nonce, nonce + 1, nonce + 2]
+    assert accounts[0].nonce == nonce + 3
+
+
+def test_send_many_requires_to(accounts):
+    with pytest.raises(ValueError, match="'to'"):
+        accounts.send_many([{"from": accounts[0], "value": 100}])
+    with pytest.raises(ValueError, match="'from'"):
+        accounts.send_many([{"to": accounts[0], "value": 100}])
+
+
+def test_send_many_batches_requests(accounts, web3, mocker):
+    mocker.spy(web3, "_make_batch_request")
+    tx_list = accounts.send_many(
+        [
+            {"from": accounts[0], "to": accounts[1], "value": 100},
+            {"from": accounts[1], "to": accounts[2], "value": 100, "gas": 21000},
+        ]
+    )
+    assert [i.status for i in tx_list] == [1, 1]
+    assert tx_list[1].gas_limit == 21000
+    assert web3._make_batch_request.call_count == 1
+
+
+def test_send_many_skips_single_revert_checks(accounts, config, mocker):
+    config["active_network"]["reverting_tx_gas_limit"] = False
+    mocker.spy(type(accounts[0]), "_check_for_revert")
+    accounts.send_many([{"from": accounts[0], "to": accounts[1], "value": 100}] * 2)
+    assert type(accounts[0])._check_for_revert.call_count == 0
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+from brownie.network.state import CallCache
+
 
 def test_attributes(accounts, tester):
     assert tester.getTuple._address == tester.address
@@ -43,3 +45,52 @@ def test_tuples(tester, accounts):
     value = ["blahblah", accounts[1], ["yesyesyes", "0x1234"]]
     tester.setTuple(value)
     assert tester.getTuple(accounts[1], {"from": accounts[0]}) == value
+
+
+def test_call_cache(accounts, tester, web3, rpc, config, monkeypatch, mocker):
+    monkeypatch.setitem(config["active_network"], "call_cache", True)
+    rpc.snapshot()
+    mocker.spy(web3.eth, "call")
+    assert tester.owner() == accounts[0]
+    assert tester.owner() == accounts[0]
+    assert web3.eth.call.call_count == 1
+    tester.getTuple(accounts[0])
+    tester.getTuple(accounts[1])
+    assert web3.eth.call.call_count == 3
+    rpc.mine()
+    tester.owner()
+    assert web3.eth.call.call_count == 4
+    rpc.revert()
+    tester.owner()
+    assert web3.eth.call.call_count == 4
+    assert len(CallCache()) == 3
+    rpc.reset()
+    assert len(CallCache()) == 0
+
+
+def test_call_cache_block_height(accounts, tester, web3, rpc, config, monkeypatch):
+    monkeypatch.setitem(config["active_network"], "call_cache", True)
+    cache = CallCache()
+    tester.owner()
+    height = web3.eth.blockNumber
+    assert cache._height == height
+    rpc.mine()
+    assert cache._height is None
+    tester.owner()
+    assert cache._height == height + 1
+    accounts[0].transfer(accounts[1], 1)
+    assert cache._height is None
+    tester.owner()
+    assert cache._height == height + 2
+
+
+def test_call_cache_size(tester, accounts, web3, config, monkeypatch, mocker):
+    monkeypatch.setitem(config["active_network"], "call_cache", True)
+    monkeypatch.setitem(config["active_network"], "call_cache_size", 2)
+    mocker.spy(web3.eth, "call")
+    for acct in accounts[:3]:
+        tester.getTuple(acct)
+    tester.getTuple(accounts[2])
+    assert web3.eth.call.call_count == 3
+    tester.getTuple(accounts[0])
+    assert web3.eth.call.call_count == 4
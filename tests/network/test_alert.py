@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import pytest
+import threading
 import time
 
 from brownie import alert
@@ -131,3 +132,54 @@ def test_repeat():
     assert not t.raised
     assert not a.is_alive()
     assert len(alert.show()) == 0
+
+
+def test_single_thread():
+    threads = set()
+    checked = [threading.Event() for i in range(5)]
+
+    def check(event):
+        # the first check happens in the main thread when the alert is created
+        if threading.current_thread() is not threading.main_thread():
+            threads.add(threading.current_thread())
+            event.set()
+        return True
+
+    for event in checked:
+        alert.new(check, (event,), delay=0.01)
+    assert all(i.wait(1) for i in checked)
+    assert len(threads) == 1
+    scheduler = threads.pop()
+    alert.stop_all()
+    scheduler.join(1)
+    assert not scheduler.is_alive()
+
+
+def test_stop_in_callback():
+    t = AlertTest("foo")
+    a = alert.new(t, delay=0.01, callback=lambda old, new: a.stop(), repeat=True)
+    t.set_value("bar")
+    a.wait(1)
+    assert not a.is_alive()
+    assert len(alert.show()) == 0
+
+
+def test_on_block(devnetwork, rpc):
+    t = AlertTest("foo")
+    checked = threading.Event()
+
+    def check():
+        checked.set()
+        return t()
+
+    a = alert.new(check, delay=0.01, callback=t.callback, on_block=True)
+    checked.clear()
+    t.set_value("bar")
+    # the value is not checked again until a block is mined
+    assert not checked.wait(0.05)
+    assert a.is_alive()
+    rpc.mine()
+    a.wait(1)
+    assert checked.is_set()
+    assert not t.raised
+    assert not a.is_alive()
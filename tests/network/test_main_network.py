@@ -2,6 +2,8 @@
 
 import pytest
 
+from brownie._config import modify_network_config
+
 
 def test_connect(network, rpc, web3):
     network.connect()
@@ -49,6 +51,30 @@ def test_connect_raises_block_height(network, monkeypatch):
         network.connect()
 
 
+def test_xdist_worker_port(config, argv):
+    argv["xdist_worker"] = 2
+    port = config["network"]["networks"]["development"]["test_rpc"]["port"]
+    active = modify_network_config("development")
+    assert active["test_rpc"]["port"] == port + 3
+    assert active["host"] == f"http://127.0.0.1:{port + 3}"
+    assert config["network"]["networks"]["development"]["test_rpc"]["port"] == port
+
+
+def test_xdist_worker_port_from_host(config, argv):
+    argv["xdist_worker"] = 0
+    config["network"]["networks"]["development"]["host"] = "http://127.0.0.1:9000"
+    active = modify_network_config("development")
+    assert active["test_rpc"]["port"] == 9001
+    assert active["host"] == "http://127.0.0.1:9001"
+
+
+def test_xdist_worker_port_raises(config, argv):
+    argv["xdist_worker"] = 0
+    config["network"]["networks"]["development"]["test_rpc"]["port"] = 65535
+    with pytest.raises(ValueError):
+        modify_network_config("development")
+
+
 def test_gas_limit_raises_not_connected(network):
     with pytest.raises(ConnectionError):
         network.gas_limit()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.exceptions import VirtualMachineError
+from brownie.network.multicall import Multicall, MulticallResult
+
+
+def test_multicall(accounts, tester, web3, mocker):
+    expected = [tester.getTuple(i) for i in accounts]
+    mocker.spy(web3, "_make_batch_request")
+    with Multicall() as multicall:
+        results = [tester.getTuple(i) for i in accounts]
+        assert all(type(i) is MulticallResult for i in results)
+        assert not any(i.executed for i in results)
+        assert len(multicall) == len(accounts)
+    assert web3._make_batch_request.call_count == 1
+    assert [i.result for i in results] == expected
+
+
+def test_block_identifier(accounts, tester, web3):
+    value = ["blahblah", accounts[1], ["yesyesyes", "0x1234"]]
+    empty = tester.getTuple(accounts[1])
+    tester.setTuple(value, {"from": accounts[0]})
+    height = web3.eth.blockNumber
+    with Multicall(height - 1):
+        before = tester.getTuple(accounts[1])
+    with Multicall(height):
+        after = tester.getTuple(accounts[1])
+    assert before.result == empty
+    assert after.result == value
+
+
+def test_not_executed(tester):
+    with Multicall():
+        result = tester.owner()
+        with pytest.raises(ValueError):
+            result.result
+
+
+def test_revert(accounts, tester):
+    with Multicall() as multicall:
+        reverted = multicall.add(tester.revertStrings, (0, {"from": accounts[0]}))
+        result = tester.owner()
+    with pytest.raises(VirtualMachineError):
+        reverted.result
+    assert result.result == accounts[0]
+
+
+def test_exception_discards(tester):
+    with pytest.raises(KeyError):
+        with Multicall() as multicall:
+            result = tester.owner()
+            raise KeyError
+    assert len(multicall) == 0
+    assert not result.executed
+    assert tester.owner() == tester.owner.call()
+
+
+def test_always_transact(accounts, tester, argv):
+    argv["always_transact"] = True
+    with Multicall() as multicall:
+        assert tester.owner() == accounts[0]
+    assert len(multicall) == 0
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+import pytest
+
 
 def test_adds_tx(accounts, history):
     assert len(history) == 0
@@ -67,3 +69,57 @@ def test_copy(accounts, history, rpc):
     assert h[0] == history[0]
     rpc.reset()
     assert len(h) == 1
+
+
+def test_revert_updates_filters(accounts, history, rpc):
+    accounts[0].transfer(accounts[1], "1 ether")
+    rpc.snapshot()
+    accounts[1].transfer(accounts[0], "1 ether")
+    accounts[0].transfer(accounts[0], "1 ether")
+    assert len(history.of_address(accounts[0])) == 3
+    assert history.of_address(accounts[0]) == history.copy()
+    rpc.revert()
+    assert history.of_address(accounts[0]) == history.copy()
+    assert len(history.from_sender(accounts[0])) == 1
+    assert len(history.from_sender(accounts[1])) == 0
+    assert len(history.to_receiver(accounts[0])) == 0
+
+
+class _Receipt:
+    def __init__(self, block_number, txindex):
+        self.sender = "0x" + "11" * 20
+        self.receiver = "0x" + "22" * 20
+        self.block_number = block_number
+        self.txindex = txindex
+        self.status = 1
+
+
+def test_out_of_order_confirmations(history):
+    tx_list = [_Receipt(1, 0), _Receipt(2, 0), _Receipt(3, 0), _Receipt(2, 1)]
+    try:
+        for tx in tx_list:
+            history._add_tx(tx)
+        for tx in reversed(tx_list):
+            history._confirm_tx(tx)
+        expected = [tx_list[0], tx_list[1], tx_list[3], tx_list[2]]
+        assert history.from_sender("0x" + "11" * 20) == expected
+        assert history.to_receiver("0x" + "22" * 20) == expected
+        assert history.of_address("0x" + "22" * 20) == expected
+    finally:
+        history.clear()
+
+
+def test_max_length(accounts, history):
+    history.max_length = 2
+    try:
+        for i in range(1, 4):
+            accounts[0].transfer(accounts[i], "1 ether")
+        assert len(history) == 2
+        assert len(history.from_sender(accounts[0])) == 2
+        assert len(history.to_receiver(accounts[1])) == 0
+        history.max_length = 1
+        assert history.to_receiver(accounts[3]) == history.copy()
+        with pytest.raises(ValueError):
+            history.max_length = 0
+    finally:
+        history.max_length = None
@@ -38,3 +38,58 @@ def test_disconnect(web3):
     assert web3.provider
     web3.disconnect()
     assert not web3.provider
+
+
+def test_batch(web3, accounts):
+    with web3.batch() as batch:
+        for acct in accounts:
+            batch.add("eth_getBalance", [str(acct), "latest"])
+        batch.add("eth_blockNumber")
+    assert len(batch.results) == len(accounts) + 1
+    assert [int(i, 16) for i in batch.results[:-1]] == [i.balance() for i in accounts]
+    assert int(batch.results[-1], 16) == web3.eth.blockNumber
+
+
+def test_batch_error(web3):
+    with pytest.raises(ValueError):
+        with web3.batch() as batch:
+            batch.add("eth_potato")
+
+
+def test_http_session(web3, config, monkeypatch):
+    monkeypatch.setitem(config["active_network"], "http_pool_size", 3)
+    monkeypatch.setitem(config["active_network"], "http_keep_alive", False)
+    web3.connect("http://localhost")
+    adapter = web3._session.get_adapter("http://localhost")
+    assert adapter._pool_maxsize == 3
+    assert web3._session.headers["Connection"] == "close"
+    assert web3.provider.get_request_kwargs()["timeout"] == 30
+    session = web3._session
+    web3.disconnect()
+    assert web3._session is None
+    web3.connect("http://localhost")
+    assert web3._session is not session
+
+
+def test_rpc_profile(web3, accounts, rpc):
+    web3.clear_rpc_profile()
+    web3.enable_rpc_profile()
+    try:
+        web3.eth.blockNumber
+        accounts[0].balance()
+        rpc.mine(3)
+        profile = web3.get_rpc_profile()
+    finally:
+        web3.disable_rpc_profile()
+    assert profile["eth_blockNumber"]["count"] >= 2
+    assert profile["eth_getBalance"]["count"] == 1
+    assert profile["evm_mine"]["count"] == 3
+    data = profile["eth_getBalance"]
+    assert data["sent"] > 0 and data["received"] > 0
+    assert data["max"] >= data["p95"] >= data["p50"] > 0
+    web3.eth.blockNumber
+    assert web3.get_rpc_profile()["eth_blockNumber"]["count"] == (
+        profile["eth_blockNumber"]["count"]
+    )
+    web3.clear_rpc_profile()
+    assert web3.get_rpc_profile() == {}
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+from brownie.network.transaction import TransactionReceipt, _confirmations
+
 
 def test_await_conf_simple_xfer(accounts):
     tx = accounts[0].transfer(accounts[1], "1 ether")
@@ -29,3 +31,32 @@ def test_await_conf_failed_contract_deploy(accounts, BrownieTester, console_mode
     tx = BrownieTester.deploy(False, {"from": accounts[0]})
     assert tx.status == 0
     tx._await_confirmation(False)
+
+
+def test_single_confirmation_thread(accounts):
+    accounts[0].transfer(accounts[1], "1 ether")
+    thread = _confirmations._thread
+    tx = accounts[0].transfer(accounts[1], "1 ether")
+    assert _confirmations._thread is thread
+    assert not _confirmations._pending
+    assert tx._confirmed.is_set()
+
+
+def test_on_confirm_after_confirmation(accounts):
+    tx = accounts[0].transfer(accounts[1], "1 ether")
+    confirmed = []
+    _confirmations.on_confirm(tx, confirmed.append)
+    assert confirmed == [tx]
+
+
+def test_same_txid(accounts):
+    tx = accounts[0].transfer(accounts[1], "1 ether")
+    receipts = [tx, TransactionReceipt(tx.txid, silent=True)]
+    for receipt in receipts:
+        receipt._confirmed.clear()
+    with _confirmations._lock:
+        for receipt in receipts:
+            _confirmations.add(receipt, True)
+    for receipt in receipts:
+        assert receipt._confirmed.wait(5)
+    assert not _confirmations._pending
@@ -5,7 +5,8 @@ possible. These tests check that it is only being called when absolutely necessa
 
 import pytest
 
-from brownie.network.transaction import TransactionReceipt
+from brownie.network.trace import Trace
+from brownie.network.transaction import TransactionReceipt, _memory_slice
 from brownie.project import build
 from brownie import Contract
 
@@ -100,6 +101,26 @@ def test_coverage_trace(accounts, tester, coverage_mode):
     assert tx._expand_trace.call_count > 0
 
 
+def test_coverage_trace_not_stored(accounts, tester, coverage_mode, mocker):
+    """coverage evaluation requests the trace without memory and does not store it"""
+    mocker.spy(TransactionReceipt, "_request_trace")
+    tx = tester.doNothing({"from": accounts[0]})
+    assert tx._trace is None
+    for call in tx._request_trace.call_args_list:
+        assert call[0][1]["disableMemory"]
+
+
+def test_partial_trace(console_mode, accounts, tester, mocker):
+    """stack and memory are not requested when there is no return value"""
+    mocker.spy(TransactionReceipt, "_request_trace")
+    tx = accounts[0].transfer(tester, "1 ether")
+    tx.modified_state
+    assert tx._request_trace.call_count == 1
+    assert tx._request_trace.call_args[0][1]["disableMemory"]
+    assert "memory" in tx.trace[0]
+    assert tx._request_trace.call_count == 2
+
+
 def test_source(tester):
     """querying source always evaluates the trace"""
     tx = tester.doNothing()
@@ -223,3 +244,104 @@ def test_contractabi(ExternalCallTester, accounts, tester, ext_tester):
     del ExternalCallTester[0]
     ext_tester = Contract(ext_tester.address, "ExternalTesterABI", ext_tester.abi)
     tx.call_trace()
+
+
+def test_memory_slice():
+    memory = [f"{i:064x}" for i in range(1, 5)]
+    joined = "".join(memory)
+    for offset, length in [(0, 0), (0, 4), (30, 4), (31, 33), (64, 64), (100, 64)]:
+        expected = joined[offset * 2 : (offset + length) * 2]
+        assert _memory_slice(memory, offset, length) == expected
+
+
+def test_trace_columns(tester):
+    tx = tester.makeInternalCalls(True, True)
+    trace = tx.trace
+    assert type(trace) is Trace
+    steps = list(trace)
+    assert len(steps) == len(trace)
+    assert trace[-1] == steps[-1]
+    assert trace[2:5] == steps[2:5]
+    for i, step in enumerate(steps):
+        assert step["pc"] == trace.pc[i]
+        assert step["jumpDepth"] == trace.jump_depth[i]
+        assert step["op"] == trace.get_op(i)
+        assert step["fn"] == trace.get_fn(i)
+        assert step["source"] == trace.get_source(i)
+    with pytest.raises(IndexError):
+        trace[len(trace)]
+
+
+def test_trace_shared_memory():
+    trace = Trace()
+    step = {"pc": 0, "depth": 0, "gas": 100, "gasCost": 3, "op": "PUSH1"}
+    memory = ["00" * 32, "11" * 32]
+    frame = ("0x00", "A", "A.f", 0, False)
+    for i in range(3):
+        trace.append(dict(step, pc=i, memory=list(memory)), *frame)
+    step["error"] = "oops"
+    trace.append(dict(step, memory=memory[:1]), *frame)
+    assert trace._memory[0] is trace._memory[2]
+    assert trace._memory[3][0] is trace._memory[0][0]
+    assert trace[1]["memory"] == memory
+    assert trace[3]["error"] == "oops"
+    assert "error" not in trace[2]
+
+
+def test_trace_mixed_steps():
+    trace = Trace()
+    step = {"pc": 0, "depth": 0, "gas": 100, "gasCost": 3, "op": "PUSH1"}
+    frame = ("0x00", "A", "A.f", 0, False)
+    trace.append(dict(step, pc=0), *frame)
+    trace.append(dict(step, pc=1, stack=["01"], memory=["00" * 32]), *frame)
+    trace.append(dict(step, pc=2, storage={"00": "01"}), *frame)
+    trace.append(dict(step, pc=3, stack=["02"], memory=["11" * 32]), *frame)
+    assert len(trace._stack) == len(trace._memory) == len(trace._storage) == 4
+    assert "stack" not in trace[0] and "memory" not in trace[0]
+    assert trace[1]["stack"] == ["01"]
+    assert trace[1]["memory"] == ["00" * 32]
+    assert "stack" not in trace[2] and "memory" not in trace[2]
+    assert trace[2]["storage"] == {"00": "01"}
+    assert trace[3]["stack"] == ["02"]
+    assert trace[3]["memory"] == ["11" * 32]
+    assert "storage" not in trace[3]
+
+
+def test_call_frames(tester, ext_tester):
+    tx = tester.makeExternalCall(ext_tester, 4)
+    trace = tx.trace
+    frames = trace.frames
+    assert (frames[0].start, frames[0].stop) == (0, len(trace))
+    assert any(i.external for i in frames)
+    for frame in frames[1:]:
+        parent = frames[frame.parent]
+        assert parent.start < frame.start and frame.stop <= parent.stop
+        assert trace.depth[frame.start] == frame.depth
+        for i in range(frame.start, frame.stop):
+            key = (trace.depth[i], trace.jump_depth[i])
+            assert key >= (frame.depth, frame.jump_depth)
+
+
+def test_get_callers():
+    trace = Trace()
+    step = {"pc": 0, "depth": 0, "gas": 100, "gasCost": 3, "op": "PUSH1"}
+    for depth, jump_depth in [(0, 0), (0, 1), (0, 1), (1, 0), (0, 1), (0, 2), (1, 0)]:
+        trace.append(dict(step, depth=depth), "0x00", "A", "A.f", jump_depth, False)
+    assert trace.get_callers(6) == [5, 4, 0]
+    assert trace.get_callers(3) == [2, 0]
+    assert trace.get_callers(0) == []
+    frames = [(i.start, i.stop) for i in trace.frames]
+    assert frames == [(0, 7), (1, 7), (3, 4), (5, 7), (6, 7)]
+
+
+def test_trace_cache(config, testproject, tester, mocker, monkeypatch):
+    monkeypatch.setitem(config["active_network"], "trace_cache", True)
+    mocker.spy(TransactionReceipt, "_request_trace")
+    tx = tester.doNothing()
+    tx.modified_state
+    assert tx._request_trace.call_count == 1
+    assert list(testproject._project_path.joinpath("build/traces").glob("*.json.gz"))
+    tx = TransactionReceipt(tx.txid, silent=True)
+    tx.modified_state
+    assert tx._request_trace.call_count == 1
+    assert tx.trace
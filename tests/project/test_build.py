@@ -1,8 +1,11 @@
 #!/usr/bin/python3
 
-from copy import deepcopy
+from copy import copy, deepcopy
+import os
+import pytest
 
 from brownie.project import compiler
+from brownie.project.build import BUILD_KEYS, Build, LazyBuildJson, PcTable
 
 
 def test_expand_build_offsets(testproject, btsource):
@@ -15,3 +18,87 @@ def test_expand_build_offsets(testproject, btsource):
     for key in ("coverageMap", "pcMap"):
         assert expanded_json[key] == build_json[key]
         assert minified_json[key] != build_json[key]
+
+
+def test_load_artifact(testproject):
+    build = Build(testproject._project_path, testproject._sources)
+    build_json = build.get("BrownieTester")
+    assert type(build_json) is LazyBuildJson
+    assert set(BUILD_KEYS).issubset(build_json)
+    assert "pcMap" in build_json._fields
+    expected = testproject._build.get("BrownieTester")
+    assert build_json["pcMap"] == expected["pcMap"]
+    assert "pcMap" not in build_json._fields
+    assert "ast" in build_json._fields
+    assert build_json == expected
+
+
+def test_copy_unloaded_artifact(testproject):
+    expected = testproject._build.get("BrownieTester")
+    for copy_fn in (dict, lambda k: {**k}, copy, lambda k: k.copy()):
+        build = Build(testproject._project_path, testproject._sources)
+        build_json = build.get("BrownieTester")
+        assert "pcMap" in build_json._fields
+        copied = copy_fn(build_json)
+        assert None not in (copied["pcMap"], copied["ast"])
+        assert dict(copied) == expected
+
+
+def test_artifact_outdated(testproject):
+    path = testproject._project_path.joinpath("build/contracts/BrownieTester.json")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    build = Build(testproject._project_path, testproject._sources)
+    assert type(build.get("BrownieTester")) is dict
+    build = Build(testproject._project_path, testproject._sources)
+    assert type(build.get("BrownieTester")) is LazyBuildJson
+
+
+def test_artifact_version(testproject):
+    path = testproject._project_path.joinpath("build/artifacts/BrownieTester.dat")
+    data = bytearray(path.read_bytes())
+    data[4:6] = (0).to_bytes(2, "big")
+    path.write_bytes(data)
+    build = Build(testproject._project_path, testproject._sources)
+    assert type(build.get("BrownieTester")) is dict
+
+
+def test_pc_table(testproject):
+    build = Build(testproject._project_path, testproject._sources)
+    table = build.get_pc_table("BrownieTester")
+    assert type(table.index) is memoryview
+    assert "pcMap" in build.get("BrownieTester")._fields
+    pc_map = testproject._build.get("BrownieTester")["pcMap"]
+    assert len(table) == len(pc_map)
+    for pc, data in pc_map.items():
+        row = table.row(pc)
+        assert table.strings[table.op[row]] == data["op"]
+        if "offset" in data:
+            assert (table.start[row], table.stop[row]) == tuple(data["offset"])
+        if "fn" in data:
+            assert table.strings[table.fn[row]] == data["fn"]
+        assert table.statement[row] == data.get("statement", -1)
+        assert table.branch[row] == data.get("branch", -1)
+    with pytest.raises(KeyError):
+        table.row(len(table.index))
+
+
+def test_pc_table_from_pc_map():
+    pc_map = {0: {"op": "PUSH1"}, 3: {"op": "JUMP", "path": "a.sol", "offset": (4, 9)}}
+    table = PcTable.from_pc_map(pc_map)
+    assert list(table.index) == [0, -1, -1, 1]
+    assert table.strings[table.path[1]] == "a.sol"
+    assert table.path[0] == -1
+    with pytest.raises(KeyError):
+        table.row(1)
+
+
+def test_pc_table_save_load(tmp_path):
+    table = PcTable.from_pc_map({0: {"op": "PUSH1"}, 2: {"op": "STOP"}})
+    path = tmp_path.joinpath("Foo.pcmap")
+    table.save(path, (1, 2, "abc"))
+    assert PcTable.load(path, (1, 2, "def")) is None
+    loaded = PcTable.load(path, (1, 2, "abc"))
+    assert list(loaded.index) == [0, -1, 1]
+    assert loaded.strings == table.strings
+    assert list(loaded.op) == list(table.op)
@@ -1,7 +1,10 @@
 #!/usr/bin/python3
 
 import functools
+import json
+import pickle
 import pytest
+from requests.exceptions import ConnectionError
 from semantic_version import Version
 import solcx
 
@@ -116,6 +119,54 @@ def test_build_json_unlinked_libraries(solc4source, solc5source):
     assert "__Bar__" in build_json["Foo"]["bytecode"]
 
 
+def test_compile_multiple_versions(solc4source, solc5source):
+    solc4source = solc4source.replace("Foo", "Foo4").replace("Bar", "Bar4")
+    build_json = compiler.compile_and_format(
+        {"solc4.sol": solc4source, "solc5.sol": solc5source}
+    )
+    assert sorted(build_json) == ["Bar", "Bar4", "Foo", "Foo4"]
+    assert "0.4.25" in build_json["Foo4"]["compiler"]["version"]
+    assert "0.5." in build_json["Foo"]["compiler"]["version"]
+
+
+def test_get_import_shards():
+    sources = {
+        "contracts/A.sol": 'import "./lib/B.sol";',
+        "contracts/lib/B.sol": "import {Foo} from '../C.sol';",
+        "contracts/C.sol": "",
+        "contracts/D.sol": "contract D {}",
+        "contracts/E.sol": 'import * as D from "contracts/D.sol";',
+        "contracts/F.sol": "contract F {}",
+    }
+    assert compiler.get_import_shards(sources, 1) == [list(sources)]
+    shards = compiler.get_import_shards(sources, 3)
+    assert sorted(shards) == [
+        ["contracts/A.sol", "contracts/lib/B.sol", "contracts/C.sol"],
+        ["contracts/D.sol", "contracts/E.sol"],
+        ["contracts/F.sol"],
+    ]
+    assert compiler.get_import_shards(sources, 3) == shards
+    assert len(compiler.get_import_shards(sources, 2)) == 2
+
+
+def test_compile_shards(solc5source):
+    sources = {
+        "foo.sol": solc5source,
+        "baz.sol": solc5source.replace("Foo", "Baz").replace("Bar", "Qux"),
+    }
+    build_json = compiler.compile_and_format(sources, solc_version="0.5.7")
+    assert sorted(build_json) == ["Bar", "Baz", "Foo", "Qux"]
+    assert build_json["Foo"]["allSourcePaths"] == ["foo.sol"]
+    assert build_json["Baz"]["allSourcePaths"] == ["baz.sol"]
+
+
+def test_compiler_error_pickle():
+    input_json = compiler.generate_input_json({"path": "potato"}, True, 200)
+    with pytest.raises(CompilerError) as exc:
+        compiler.compile_from_input_json(input_json)
+    assert str(pickle.loads(pickle.dumps(exc.value))) == str(exc.value)
+
+
 def test_format_link_references(solc4json, solc5json):
     evm = solc5json["contracts"]["path"]["Foo"]["evm"]
     assert "__Bar__" in compiler.format_link_references(evm)
@@ -164,6 +215,59 @@ def test_find_solc_versions_install(find_version, msolc):
     assert msolc.pop() == "v0.5.10"
 
 
+def test_available_versions_cache(monkeypatch, tmp_path):
+    path = tmp_path.joinpath("solc_versions.json")
+    with path.open("w") as fp:
+        json.dump({"timestamp": 0, "versions": ["v0.5.9"]}, fp)
+    calls = []
+
+    def available():
+        calls.append(True)
+        return ["v0.5.10"]
+
+    monkeypatch.setattr("solcx.get_available_solc_versions", available)
+    monkeypatch.setattr(compiler, "SOLC_VERSIONS_CACHE", path)
+    monkeypatch.setattr(compiler, "SOLC_VERSIONS_TTL", 3600)
+    assert compiler.get_available_solc_versions() == ["v0.5.10"]
+    assert compiler.get_available_solc_versions() == ["v0.5.10"]
+    assert len(calls) == 1
+
+
+def test_available_versions_offline(monkeypatch, tmp_path):
+    path = tmp_path.joinpath("solc_versions.json")
+    with path.open("w") as fp:
+        json.dump({"timestamp": 0, "versions": ["v0.5.9"]}, fp)
+
+    def available():
+        raise ConnectionError
+
+    monkeypatch.setattr("solcx.get_available_solc_versions", available)
+    monkeypatch.setattr(compiler, "SOLC_VERSIONS_CACHE", path)
+    assert compiler.get_available_solc_versions() == ["v0.5.9"]
+    path.unlink()
+    with pytest.raises(ConnectionError):
+        compiler.get_available_solc_versions()
+
+
+def test_available_versions_unwritable(monkeypatch, tmp_path, capsys):
+    tmp_path.joinpath("file").touch()
+    path = tmp_path.joinpath("file/solc_versions.json")
+    monkeypatch.setattr("solcx.get_available_solc_versions", lambda: ["v0.5.10"])
+    monkeypatch.setattr(compiler, "SOLC_VERSIONS_CACHE", path)
+    assert compiler.get_available_solc_versions() == ["v0.5.10"]
+    assert "Unable to save" in capsys.readouterr().out
+
+
+def test_get_pragma_spec():
+    source = "pragma solidity ^0.5.0; contract Foo {}"
+    pragma, spec = compiler.get_pragma_spec(source)
+    assert pragma == "pragma solidity ^0.5.0;"
+    assert spec.select([Version("0.4.25"), Version("0.5.7")]) == Version("0.5.7")
+    assert compiler.get_pragma_spec(source)[1] is spec
+    with pytest.raises(PragmaError):
+        compiler.get_pragma_spec("contract Foo {}")
+
+
 def test_install_solc(msolc):
     assert "v0.5.10" not in msolc
     assert "v0.6.0" not in msolc
@@ -177,3 +281,28 @@ def test_first_revert(BrownieTester, ExternalCallTester):
     assert next((i for i in pc_map.values() if "first_revert" in i), False)
     pc_map = BrownieTester._build["pcMap"]
     assert not next((i for i in pc_map.values() if "first_revert" in i), False)
+
+
+def test_offset_index():
+    index = compiler._OffsetIndex([(10, 20), (0, 5), (30, 60)], ["b", "a", "c"])
+    assert index.get((12, 18)) == "b"
+    assert index.get((0, 5)) == "a"
+    assert index.get((30, 30)) == "c"
+    with pytest.raises(KeyError):
+        index.get((18, 25))
+    idx = index.find((40, 50))
+    assert index.pop(idx) == "c"
+    assert index.find((40, 50)) is None
+
+
+def test_offset_index_nested():
+    offsets = [(0, 100), (10, 20), (12, 18), (30, 90), (40, 50), (95, 100)]
+    index = compiler._OffsetIndex(offsets)
+    assert index.get((14, 16)) == (0, 100)
+    index.pop(index.find((14, 16)))
+    assert index.get((14, 16)) == (10, 20)
+    index.pop(index.find((14, 16)))
+    assert index.get((14, 16)) == (12, 18)
+    assert index.get((45, 46)) == (30, 90)
+    assert index.get((96, 99)) == (95, 100)
+    assert index.find((19, 25)) is None
@@ -1,9 +1,11 @@
 #!/usr/bin/python3
 
+import json
 from pathlib import Path
 import pytest
 import sys
 
+from brownie.project import compiler
 from brownie.project.main import Project, TempProject, _ProjectBase
 from brownie.exceptions import ProjectAlreadyLoaded, ProjectNotFound
 
@@ -113,3 +115,45 @@ def test_create_folders(project, tmp_path):
     project.main._create_folders(Path(tmp_path))
     for path in ("contracts", "scripts", "reports", "tests", "build"):
         assert Path(tmp_path).joinpath(path).exists()
+
+
+def test_load_unchanged(testproject, mocker):
+    testproject.close()
+    mocker.spy(compiler, "compile_and_format")
+    mocker.spy(compiler, "set_solc_version")
+    testproject.load()
+    assert compiler.compile_and_format.call_args[0][0] == {}
+    assert compiler.set_solc_version.call_count == 0
+    assert testproject._project_path.joinpath("build/sources.json").exists()
+
+
+def test_recompile_dependents(testproject, mocker):
+    testproject.close()
+    path = testproject._project_path.joinpath("contracts/SafeMath.sol")
+    source = path.read_text().replace(
+        "library SafeMath {", "library SafeMath {\n    uint256 constant FOO = 1;"
+    )
+    path.write_text(source)
+    mocker.spy(compiler, "compile_and_format")
+    testproject.load()
+    assert sorted(compiler.compile_and_format.call_args[0][0]) == [
+        "contracts/BrownieTester.sol",
+        "contracts/SafeMath.sol",
+    ]
+    assert "BrownieTester" in testproject._build.get_dependents("SafeMath")
+
+
+@pytest.mark.parametrize("key,value", [("optimize", False), ("minify_source", True)])
+def test_recompile_on_config_change(testproject, mocker, key, value):
+    testproject.close()
+    config_path = testproject._project_path.joinpath("brownie-config.json")
+    with config_path.open() as fp:
+        config = json.load(fp)
+    config["compiler"]["solc"][key] = value
+    with config_path.open("w") as fp:
+        json.dump(config, fp)
+    mocker.spy(compiler, "compile_and_format")
+    testproject.load()
+    assert sorted(compiler.compile_and_format.call_args[0][0]) == sorted(
+        testproject._sources.get_path_list()
+    )
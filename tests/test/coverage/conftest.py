@@ -17,7 +17,7 @@ def branch_results(coverage_mode, evmtester):
 # organizes branch results based on if they evaluated True or False
 def _get_branch_results(build):
     branch_false, branch_true = [
-        sorted(i)
+        coverage.from_bitset(i)
         for i in list(coverage.get_coverage_eval().values())[0]["EVMTester"][PATH][1:]
     ]
     coverage.clear()
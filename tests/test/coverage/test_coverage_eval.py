@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+
+import pytest
+
+from brownie.test import coverage
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    coverage.clear()
+    yield
+    coverage.clear()
+
+
+def test_bitsets():
+    bitset = coverage.to_bitset([0, 3, 64, 200])
+    assert bitset == 1 | 8 | 2 ** 64 | 2 ** 200
+    assert coverage.from_bitset(bitset) == [0, 3, 64, 200]
+    assert coverage.from_bitset(0) == []
+
+
+def test_merge():
+    coverage.add_transaction("0x1", {"Foo": {"a.sol": [0b101, 0b1, 0]}})
+    coverage.add_transaction(
+        "0x2", {"Foo": {"a.sol": [0b110, 0, 0b10], "b.sol": [1, 0, 0]}, "Bar": {}}
+    )
+    merged = coverage.get_merged_coverage_eval()
+    assert merged == {
+        "Foo": {"a.sol": [0b111, 0b1, 0b10], "b.sol": [1, 0, 0]},
+        "Bar": {},
+    }
+    assert coverage.get_coverage_eval()["0x1"]["Foo"]["a.sol"] == [0b101, 0b1, 0]
+
+
+def test_serialize():
+    coverage_eval = {"Foo": {"a.sol": [2 ** 70 + 1, 0, 6]}}
+    dumped = coverage.dumps_coverage_eval(coverage_eval)
+    assert dumped == {"Foo": {"a.sol": [f"{2 ** 70 + 1:x}", "0", "6"]}}
+    assert coverage.loads_coverage_eval(dumped) == coverage_eval
+    legacy = {"Foo": {"a.sol": [[0, 70], [], [1, 2]]}}
+    assert coverage.loads_coverage_eval(legacy) == coverage_eval
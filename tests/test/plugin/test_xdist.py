@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+
+import json
+import pytest
+
+pytest.importorskip("xdist")
+
+test_source = """
+def test_stuff(BrownieTester, accounts, module_isolation):
+    c = accounts[0].deploy(BrownieTester, True)
+    c.doNothing({'from': accounts[0]})"""
+
+test_source_2 = """
+def test_more_stuff(BrownieTester, accounts, module_isolation):
+    c = accounts[0].deploy(BrownieTester, True)
+    c.doNothing({'from': accounts[0]})
+
+def test_failing(accounts):
+    assert False"""
+
+
+def test_parallel(json_path, plugintester):
+    plugintester.makepyfile(test_other=test_source_2)
+    result = plugintester.runpytest("-n", "2", "-C")
+    result.assert_outcomes(passed=2, failed=1)
+    with json_path.open() as fp:
+        build = json.load(fp)
+    assert build["tests"]["test_parallel.py"]["results"] == "."
+    assert build["tests"]["test_other.py"]["results"] == ".F"
+    for path in ("test_parallel.py", "test_other.py"):
+        txhash = build["tests"][path]["txhash"]
+        assert txhash and all(i in build["tx"] for i in txhash)